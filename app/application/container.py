@@ -13,6 +13,8 @@ from app.core.data_processor import IL2DataProcessor
 from app.core.repositories import JsonCampaignRepository
 from app.core.squadron_enrichment_service import SquadronEnrichmentService
 
+_ASSETS_ROOT: Path = Path(__file__).resolve().parents[1] / "assets"
+
 
 class AppContainer:
     """Container simples de DI manual para bootstrap de dependências."""
@@ -71,7 +73,6 @@ class AppContainer:
 
     def get_content_module_registry(self) -> ContentModuleRegistry:
         if self._content_registry is None:
-            assets_root = (Path(__file__).resolve().parents[1] / "assets")
-            self._content_registry = ContentModuleRegistry(assets_root)
+            self._content_registry = ContentModuleRegistry(_ASSETS_ROOT)
             self._content_registry.load_external_modules()
         return self._content_registry
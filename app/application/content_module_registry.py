@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from utils import json_fast
+
 
 @dataclass(frozen=True)
 class ContentModule:
@@ -41,11 +44,20 @@ class ContentModuleRegistry:
         if not root.exists() or not root.is_dir():
             return 0
 
+        # Só um nível: scandir já traz o tipo da entrada, sem stat por subdiretório comum.
+        # Diretórios via symlink continuam aceitos (como no glob anterior)
+        try:
+            with os.scandir(root) as it:
+                dirs = sorted(entry.path for entry in it if entry.is_dir())
+        except OSError:
+            return 0
+
         loaded = 0
-        for manifest in sorted(root.glob("*/module.json")):
+        for module_dir in dirs:
+            base_dir = Path(module_dir)
             try:
-                raw = json.loads(manifest.read_text(encoding="utf-8"))
-                module = self._parse_manifest(raw, manifest.parent)
+                raw = json_fast.loads((base_dir / "module.json").read_bytes())
+                module = self._parse_manifest(raw, base_dir)
                 self._modules[module.module_id] = module
                 loaded += 1
             except (OSError, ValueError, json.JSONDecodeError):
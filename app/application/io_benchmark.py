@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Dict
 
 from app.core.data_parser import IL2DataParser
@@ -16,18 +16,21 @@ def benchmark_personnel_io_scenario(base_path: Path, campaign_name: str, runs: i
 
     safe_runs = max(1, int(runs or 1))
 
-    naive_start = perf_counter()
+    # Aquecimento fora da medição: o primeiro cenário não paga sozinho o cache frio do SO
+    IL2DataParser(base_path).get_json_many(files)
+
+    naive_start = perf_counter_ns()
     for _ in range(safe_runs):
         for p in files:
             parser = IL2DataParser(base_path)
             parser.get_json_data(p)
-    naive_ms = (perf_counter() - naive_start) * 1000.0
+    naive_ms = (perf_counter_ns() - naive_start) / 1e6
 
-    batch_start = perf_counter()
+    batch_start = perf_counter_ns()
     for _ in range(safe_runs):
         parser = IL2DataParser(base_path)
         parser.get_json_many(files)
-    batch_ms = (perf_counter() - batch_start) * 1000.0
+    batch_ms = (perf_counter_ns() - batch_start) / 1e6
 
     gain_pct = 0.0
     if naive_ms > 0:
@@ -9,6 +9,13 @@ from utils.notification_bus import notify_warning
 logger = logging.getLogger("IL2CampaignAnalyzer")
 
 
+def _as_str(value: Any) -> str:
+    """Equivale a ``str(value or "")`` sem chamar ``str`` quando o valor já é texto."""
+    if type(value) is str:
+        return value
+    return str(value) if value else ""
+
+
 @dataclass(frozen=True)
 class Mission:
     """Missão tipada para consumo da camada de apresentação."""
@@ -39,12 +46,12 @@ class MissionValidationService:
 
             try:
                 mission = Mission(
-                    date=str(raw.get("date", "") or ""),
-                    time=str(raw.get("time", "") or ""),
-                    aircraft=str(raw.get("aircraft", "") or ""),
-                    aircraft_badge=str(raw.get("aircraft_badge", "") or ""),
-                    duty=str(raw.get("duty", "") or ""),
-                    description=str(raw.get("description", "") or ""),
+                    date=_as_str(raw.get("date")),
+                    time=_as_str(raw.get("time")),
+                    aircraft=_as_str(raw.get("aircraft")),
+                    aircraft_badge=_as_str(raw.get("aircraft_badge")),
+                    duty=_as_str(raw.get("duty")),
+                    description=_as_str(raw.get("description")),
                 )
             except (TypeError, ValueError) as e:
                 logger.warning("Missão inválida no índice %s: %s", idx, e)
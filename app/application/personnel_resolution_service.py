@@ -10,6 +10,16 @@ from app.core.data_parser import IL2DataParser
 
 logger = logging.getLogger("IL2CampaignAnalyzer")
 
+_NAME_SLUG = str.maketrans(" ", "_")
+
+
+def _medal_id(medal: Dict[str, Any]) -> str:
+    """ID da medalha: nome do arquivo sem ``.png`` ou, na falta dele, o nome em slug."""
+    img = str(medal.get("medalImage", "") or "").strip()
+    if img:
+        return img[:-4] if img[-4:].lower() == ".png" else img
+    return str(medal.get("medalName", "") or "").strip().lower().translate(_NAME_SLUG)
+
 
 @dataclass(frozen=True)
 class PersonnelResolutionResult:
@@ -38,7 +48,7 @@ class PersonnelResolutionService:
             logger.warning("Diretório Personnel não encontrado: %s", personnel_dir)
             return default
 
-        earned_ids = set()
+        earned_ids: FrozenSet[str] = frozenset()
         resolved_code = default.country_code
         display_name = default.display_name
 
@@ -72,22 +82,13 @@ class PersonnelResolutionService:
             if matches:
                 country, _, medals = matches[0]
                 resolved_code, display_name = self._map_country_to_folder_and_label(country)
-                for medal in medals:
-                    img = str(medal.get("medalImage", "") or "").strip()
-                    if img:
-                        medal_id = img[:-4] if img.lower().endswith(".png") else img
-                        earned_ids.add(medal_id)
-                        continue
-
-                    medal_name = str(medal.get("medalName", "") or "").strip()
-                    if medal_name:
-                        earned_ids.add(medal_name.lower().replace(" ", "_"))
+                earned_ids = frozenset(medal_id for medal_id in map(_medal_id, medals) if medal_id)
 
                 logger.info("Resolvido: país=%s, %s medalhas", resolved_code, len(earned_ids))
                 return PersonnelResolutionResult(
                     country_code=resolved_code,
                     display_name=display_name,
-                    earned_medal_ids=frozenset(earned_ids),
+                    earned_medal_ids=earned_ids,
                 )
         except OSError:
             logger.exception("Falha ao varrer diretório Personnel: %s", personnel_dir)
@@ -97,7 +98,7 @@ class PersonnelResolutionService:
         return PersonnelResolutionResult(
             country_code=resolved_code,
             display_name=display_name,
-            earned_medal_ids=frozenset(earned_ids),
+            earned_medal_ids=earned_ids,
         )
 
     @staticmethod
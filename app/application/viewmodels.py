@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Sequence, Sized
 
 from app.application.mission_validation_service import Mission
 
@@ -19,10 +19,12 @@ class MissionsViewModel:
             return ViewState("empty", "Nenhuma missão disponível para os filtros atuais.")
         return ViewState("success", f"{len(missions)} missões carregadas.")
 
-    def filter_visibility(self, missions: List[Mission], row_values: List[List[str]], query: str) -> List[bool]:
+    def filter_visibility(self, missions: List[Mission], row_values: Iterable[Sequence[str]], query: str) -> List[bool]:
         q = (query or "").strip().lower()
         if not q:
-            return [True] * len(row_values)
+            # Sem filtro, as linhas nem precisam ser lidas (aceita gerador preguiçoso)
+            count = len(row_values) if isinstance(row_values, Sized) else len(missions)
+            return [True] * count
 
         visible: List[bool] = []
         for idx, cols in enumerate(row_values):
@@ -4,14 +4,60 @@
 # ===================================================================
 
 import json
+import os
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Union, Optional, Tuple, Set
 
+from utils import json_fast
+
 logger = logging.getLogger("IL2CampaignAnalyzer")
 
+# Leituras em lote: a partir deste número de arquivos não cacheados vale sobrepor as leituras
+_PARALLEL_READ_MIN = 4
+_READ_POOL: Optional[ThreadPoolExecutor] = None
+_READ_POOL_LOCK = threading.Lock()
+
+
+def _read_pool() -> ThreadPoolExecutor:
+    """Pool compartilhado de leitura de arquivos, criado no primeiro lote grande."""
+    global _READ_POOL
+    if _READ_POOL is None:
+        with _READ_POOL_LOCK:
+            if _READ_POOL is None:
+                _READ_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="json-read")
+    return _READ_POOL
+
+
+# (mtime_ns, tamanho) do arquivo no momento da leitura; None quando ele não existia
+_Stamp = Optional[Tuple[int, int]]
+_ReadResult = Union[Tuple[bytes, Tuple[int, int]], OSError]
+
+
+def _stat_stamp(file_path_str: str) -> _Stamp:
+    try:
+        st = os.stat(file_path_str)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_bytes(file_path_str: str) -> _ReadResult:
+    """Lê o arquivo inteiro com o carimbo do fstat do mesmo descritor.
+
+    O erro é devolvido, não levantado, para ser registrado na thread chamadora.
+    """
+    try:
+        with open(file_path_str, 'rb') as f:
+            st = os.fstat(f.fileno())
+            return f.read(), (st.st_mtime_ns, st.st_size)
+    except OSError as e:
+        return e
+
 
 class IL2DataParser:
     """Lê e extrai dados brutos dos arquivos da campanha PWCGFC.
@@ -50,6 +96,8 @@ class IL2DataParser:
         
         self.campaigns_path: Path = self.pwcgfc_path / 'User' / 'Campaigns'
         self._json_cache: Dict[str, Optional[Any]] = {}
+        # Carimbo de cada entrada: um arquivo reescrito é relido sem precisar de clear_cache()
+        self._json_stamps: Dict[str, _Stamp] = {}
         self._cache_hits: int = 0
         self._cache_misses: int = 0
         logger.info(f"Parser inicializado com caminho: {self.pwcgfc_path}")
@@ -57,35 +105,81 @@ class IL2DataParser:
     def clear_cache(self) -> None:
         """Limpa o cache de JSON desta instância."""
         self._json_cache.clear()
+        self._json_stamps.clear()
         self._cache_hits = 0
         self._cache_misses = 0
 
     def _get_json_data_cached(self, file_path_str: str) -> Optional[Any]:
         """Versão cacheada de carregamento de JSON por instância."""
-        if file_path_str in self._json_cache:
+        if self._is_fresh(file_path_str):
             self._cache_hits += 1
             return self._json_cache[file_path_str]
 
         self._cache_misses += 1
-        self._json_cache[file_path_str] = self._load_json_file(Path(file_path_str))
-        return self._json_cache[file_path_str]
+        return self._store(file_path_str, _read_bytes(file_path_str))
+
+    def _is_fresh(self, file_path_str: str) -> bool:
+        """Entrada cacheada e arquivo inalterado (mesmo mtime e tamanho) desde a leitura."""
+        return (
+            file_path_str in self._json_cache
+            and self._json_stamps.get(file_path_str) == _stat_stamp(file_path_str)
+        )
+
+    def _store(self, file_path_str: str, result: _ReadResult) -> Optional[Any]:
+        data = self._decode_read_result(Path(file_path_str), result)
+        self._json_cache[file_path_str] = data
+        self._json_stamps[file_path_str] = None if isinstance(result, OSError) else result[1]
+        return data
     
     def get_json_many(self, file_paths: List[Path]) -> Dict[Path, Optional[Any]]:
         """Carrega múltiplos arquivos JSON em batch reutilizando cache da instância.
 
         Essa API bulk-first evita padrões análogos a N+1 de chamadas externas,
-        concentrando resolução de caminhos e leitura em uma única etapa.
+        concentrando resolução de caminhos e leitura em uma única etapa. Os arquivos
+        fora do cache são lidos em paralelo; a decodificação fica nesta thread.
         """
         loaded: Dict[Path, Optional[Any]] = {}
+        pending: Dict[str, List[Path]] = {}
         for file_path in file_paths or []:
             resolved_path: Path = file_path
+            # Reserva a posição: quem consome o lote depende da ordem de entrada
+            loaded[file_path] = None
             try:
                 resolved_path = file_path.resolve()
-                loaded[file_path] = self._get_json_data_cached(str(resolved_path))
+                key = str(resolved_path)
             except (TypeError, ValueError, OSError):
                 loaded[file_path] = self._load_json_file(resolved_path)
+                continue
+            if self._is_fresh(key):
+                self._cache_hits += 1
+                loaded[file_path] = self._json_cache[key]
+            else:
+                pending.setdefault(key, []).append(file_path)
+
+        if pending:
+            keys = list(pending)
+            if len(keys) >= _PARALLEL_READ_MIN:
+                raws = list(_read_pool().map(_read_bytes, keys))
+            else:
+                raws = [_read_bytes(key) for key in keys]
+            for key, raw in zip(keys, raws):
+                data = self._store(key, raw)
+                self._cache_misses += 1
+                self._cache_hits += len(pending[key]) - 1
+                for file_path in pending[key]:
+                    loaded[file_path] = data
         return loaded
 
+    def _decode_read_result(self, file_path: Path, result: _ReadResult) -> Optional[Any]:
+        """Converte o resultado de ``_read_bytes`` em dados JSON (ou None, com log)."""
+        if isinstance(result, FileNotFoundError):
+            logger.debug(f"Arquivo não encontrado: {file_path}")
+            return None
+        if isinstance(result, OSError):
+            logger.error(f"Erro ao abrir {file_path}: {result}")
+            return None
+        return self._decode_json_bytes(file_path, result[0])
+
 
     def get_cache_metrics(self) -> Dict[str, int]:
         """Retorna métricas simples de cache para observabilidade."""
@@ -124,46 +218,44 @@ class IL2DataParser:
         Returns:
             Dados JSON parseados ou None se houver erro
         """
-        if not file_path.exists():
-            logger.debug(f"Arquivo não encontrado: {file_path}")
-            return None
-        
+        # Uma leitura só: a ausência do arquivo vem do próprio read_bytes, sem exists() antes
+        return self._decode_read_result(file_path, _read_bytes(str(file_path)))
+
+    def _decode_json_bytes(self, file_path: Path, raw: bytes) -> Optional[Any]:
+        """Decodifica o conteúdo já lido de ``file_path`` com fallback de encoding.
+
+        Args:
+            file_path: Caminho de origem (para logs e tentativas de fallback)
+            raw: Bytes do arquivo
+
+        Returns:
+            Dados JSON parseados ou None se houver erro
+        """
         # Tentativa 1: UTF-8 (padrão moderno)
         try:
-            with file_path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json_fast.loads(raw)
             logger.debug(f"JSON carregado com UTF-8: {file_path.name}")
             return data
-        except json.JSONDecodeError as e:
-            logger.debug(
-                f"Falha UTF-8 em {file_path.name} (pos {e.pos}), "
-                "tentando Latin-1..."
-            )
-        except (FileNotFoundError, PermissionError, OSError) as e:
-            logger.error(f"Erro ao abrir {file_path}: {e}")
-            return None
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.debug(f"Falha UTF-8 em {file_path.name} ({e}), tentando Latin-1...")
         
+        # As tentativas seguintes decodificam os mesmos bytes: o arquivo não é reaberto
         # Tentativa 2: Latin-1 (arquivos legados Windows)
         try:
-            with file_path.open('r', encoding='latin-1') as f:
-                data = json.load(f)
+            data = json.loads(raw.decode('latin-1'))
             logger.info(f"JSON carregado com Latin-1: {file_path.name}")
             return data
         except json.JSONDecodeError:
             logger.debug(f"Falha Latin-1 em {file_path.name}, tentando modo tolerante...")
-        except (FileNotFoundError, PermissionError, OSError) as e:
-            logger.error(f"Erro ao ler {file_path} (Latin-1): {e}")
-            return None
         
         # Tentativa 3: UTF-8 tolerante (substitui caracteres inválidos)
         try:
-            text = file_path.read_text(encoding='utf-8', errors='replace')
-            data = json.loads(text)
+            data = json.loads(raw.decode('utf-8', errors='replace'))
             logger.warning(
                 f"JSON carregado com substituição de caracteres: {file_path.name}"
             )
             return data
-        except (OSError, json.JSONDecodeError) as e:
+        except json.JSONDecodeError as e:
             logger.error(f"Falha final ao decodificar {file_path}: {e}")
             return None
     
@@ -173,18 +265,17 @@ class IL2DataParser:
         Returns:
             Lista ordenada de nomes de campanhas (diretórios)
         """
-        if not self.campaigns_path.exists():
-            logger.warning(f"Pasta de campanhas não encontrada: {self.campaigns_path}")
-            return []
-        
         try:
-            campaigns = [
-                p.name 
-                for p in self.campaigns_path.iterdir() 
-                if p.is_dir()
-            ]
+            # scandir traz o tipo da entrada do próprio readdir: sem Path nem stat por campanha
+            # (links simbólicos para pastas continuam contando como campanha)
+            with os.scandir(self.campaigns_path) as it:
+                campaigns = [entry.name for entry in it if entry.is_dir()]
+            campaigns.sort()
             logger.info(f"Encontradas {len(campaigns)} campanhas")
-            return sorted(campaigns)
+            return campaigns
+        except FileNotFoundError:
+            logger.warning(f"Pasta de campanhas não encontrada: {self.campaigns_path}")
+            return []
         except OSError as e:
             # Captura PermissionError, FileNotFoundError e outros erros de I/O
             logger.error(f"Erro ao listar campanhas em {self.campaigns_path}: {e}")
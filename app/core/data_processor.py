@@ -7,11 +7,44 @@
 import re
 import logging
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Any, Union, Optional, Tuple
 
 logger = logging.getLogger("IL2CampaignAnalyzer")
 
+# Data compacta do PWCG (YYYYMMDD), compilada uma única vez
+_DATE_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+
+
+def _as_int(value: Any) -> int:
+    """Inteiro a partir do texto decimal de ``value``; o resto vale 0.
+
+    ``isdecimal`` em vez de ``isdigit``: aceita exatamente o que ``int()`` converte,
+    então não há exceção a capturar.
+    """
+    text = str(value)
+    return int(text) if text.isdecimal() else 0
+
+
+def _as_count(value: Any) -> int:
+    """Contagem tolerante: tamanho de coleções ou texto decimal (``_as_int``)."""
+    if isinstance(value, (list, tuple, dict)):
+        return len(value)
+    return _as_int(value)
+
+
+# Código de status do PWCG -> descrição (0 e 1 são ambos piloto ativo). Montado uma
+# vez no import; a busca por hash aceita códigos equivalentes como 2.0
+_PILOT_STATUS: Dict[int, str] = {
+    0: "Ativo",
+    1: "Ativo",
+    2: "Morto em Combate (KIA)",
+    3: "Gravemente Ferido (WIA)",
+    4: "Capturado (POW)",
+    5: "Desaparecido em Combate (MIA)",
+}
+
 try:
     from .data_parser import IL2DataParser  # pacote
 except ImportError:
@@ -243,42 +276,30 @@ class IL2DataProcessor:
 
         coll: Dict[str, Any] = squadron_personnel.get("squadronMemberCollection", {}) or {}
 
+        # Uma passada em tuplas (missões, vitórias, nome, patente, status); os dicts
+        # só são montados depois de ordenar
+        rows: List[Tuple[int, int, Any, Any, str]] = []
         for p in coll.values():
-            try:
-                victories: Any = p.get("victories", [])
-                v_count = (
-                    int(len(victories))
-                    if isinstance(victories, (list, tuple, dict))
-                    else int(victories)
-                    if str(victories).isdigit()
-                    else 0
-                )
-            except (TypeError, ValueError):
-                v_count = 0
-
-            try:
-                m_flown: Any = p.get("missionFlown", 0)
-                m_flown = (
-                    int(m_flown)
-                    if isinstance(m_flown, int)
-                    else int(m_flown)
-                    if str(m_flown).isdigit()
-                    else 0
-                )
-            except (TypeError, ValueError):
-                m_flown = 0
-
-            result.append(
-                {
-                    "name": p.get("name", "NA"),
-                    "rank": p.get("rank", "NA"),
-                    "victories": v_count,
-                    "missions_flown": m_flown,
-                    "status": self.get_pilot_status(p.get("pilotActiveStatus", -1)),
-                }
-            )
-
-        result.sort(key=lambda x: (x["missions_flown"], x["victories"]), reverse=True)
+            m_flown: Any = p.get("missionFlown", 0)
+            rows.append((
+                int(m_flown) if isinstance(m_flown, int) else _as_int(m_flown),
+                _as_count(p.get("victories", [])),
+                p.get("name", "NA"),
+                p.get("rank", "NA"),
+                self.get_pilot_status(p.get("pilotActiveStatus", -1)),
+            ))
+
+        rows.sort(key=itemgetter(0, 1), reverse=True)
+        result.extend(
+            {
+                "name": name,
+                "rank": rank,
+                "victories": v_count,
+                "missions_flown": m_flown,
+                "status": status,
+            }
+            for m_flown, v_count, name, rank, status in rows
+        )
         return result
 
     def get_pilot_status(self, code: int) -> str:
@@ -291,14 +312,7 @@ class IL2DataProcessor:
         Returns:
             Descrição do status
         """
-        return {
-            0: "Ativo",
-            1: "Ativo",
-            2: "Morto em Combate (KIA)",
-            3: "Gravemente Ferido (WIA)",
-            4: "Capturado (POW)",
-            5: "Desaparecido em Combate (MIA)",
-        }.get(code, "Desconhecido")
+        return _PILOT_STATUS.get(code, "Desconhecido")
 
     def process_aces_data(self, aces_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -314,30 +328,26 @@ class IL2DataProcessor:
         if not aces_raw:
             return out
 
+        # Ordena pares (vitórias, ás) e só então monta os dicts de saída
+        counted: List[Tuple[int, Dict[str, Any]]] = []
         for ace in aces_raw:
-            try:
-                # Conta vitórias (é um array no JSON)
-                v: Any = ace.get("victories", [])
-                v_count = (
-                    int(len(v))
-                    if isinstance(v, list)
-                    else int(v)
-                    if isinstance(v, (int, str)) and str(v).isdigit()
-                    else 0
-                )
-            except (TypeError, ValueError):
-                v_count = 0
-
-            # Mantém TODOS os campos importantes
-            out.append({
+            # Conta vitórias (é um array no JSON)
+            v: Any = ace.get("victories", [])
+            v_count = len(v) if isinstance(v, list) else _as_int(v) if isinstance(v, (int, str)) else 0
+            counted.append((v_count, ace))
+
+        counted.sort(key=itemgetter(0), reverse=True)
+        # Mantém TODOS os campos importantes
+        out.extend(
+            {
                 "name": ace.get("name", "NA"),
                 "rank": ace.get("rank", "NA"),
                 "country": ace.get("country", ""),
                 "victories": v_count,
                 "missions_flown": ace.get("missionFlown", 0),
-            })
-
-        out.sort(key=lambda x: x["victories"], reverse=True)
+            }
+            for v_count, ace in counted
+        )
         return out
 
     def format_date(self, yyyymmdd: str) -> str:
@@ -350,12 +360,17 @@ class IL2DataProcessor:
         Returns:
             Data formatada ou original se inválida
         """
-        if not yyyymmdd or len(yyyymmdd) != 8 or not yyyymmdd.isdigit():
+        # fullmatch: '$' aceitaria um '\n' final
+        m = _DATE_RE.fullmatch(yyyymmdd) if yyyymmdd else None
+        if m is None:
             return yyyymmdd
+        year, month, day = m.groups()
         try:
-            return datetime.strptime(yyyymmdd, "%Y%m%d").strftime("%d/%m/%Y")
+            # Só valida o calendário (mês 13, 30/02...); o texto sai das próprias fatias
+            datetime(int(year), int(month), int(day))
         except ValueError:
             return yyyymmdd
+        return f"{day}/{month}/{year}"
 
     @staticmethod
     def _extract_report_victories(report: Dict[str, Any]) -> int:
@@ -9,9 +9,35 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-from utils.file_operations import atomic_json_write, safe_read_json
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import json_fast
+from utils.file_operations import atomic_json_dump
+
+# Schemas montados uma vez no import: a validação por arquivo só percorre constantes prontas
+_INPUT_STRING_KEYS: Tuple[str, ...] = ("squadronName", "name", "displayName", "id", "squadron_id")
+_OUTPUT_REQUIRED_ORDER: Tuple[str, ...] = (
+    "squadronId",
+    "squadronName",
+    "country",
+    "history",
+    "emblemImage",
+    "airfields",
+    "source",
+)
+_OUTPUT_REQUIRED = frozenset(_OUTPUT_REQUIRED_ORDER)
+
+
+def _loads_json_bytes(raw: bytes) -> Optional[Any]:
+    """Decodifica JSON em UTF-8 com fallback latin-1; ``None`` se nenhum dos dois servir."""
+    try:
+        return json_fast.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        pass
+    try:
+        return json.loads(raw.decode("latin-1"))
+    except json.JSONDecodeError:
+        return None
 
 
 @dataclass(frozen=True)
@@ -83,21 +109,17 @@ class SquadronEnrichmentService:
     COUNTRY_KEYS: Tuple[str, ...] = ("country", "nation", "countryCode")
 
     def read_json(self, path: Path) -> Dict[str, Any]:
-        """Lê JSON com API segura padronizada e fallback de encoding."""
-        data = safe_read_json(path, default=None)
+        """Lê JSON com uma única leitura em bytes e fallback de encoding."""
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            raw = b""
+
+        data = _loads_json_bytes(raw) if raw else None
         if isinstance(data, dict):
             self._validate_input_schema(data)
             return data
 
-        try:
-            with path.open("r", encoding="latin-1") as f:
-                parsed = json.load(f)
-            if isinstance(parsed, dict):
-                self._validate_input_schema(parsed)
-                return parsed
-        except (UnicodeDecodeError, json.JSONDecodeError, OSError):
-            pass
-
         raise ValueError(f"JSON inválido ou ilegível: {path}")
 
     def resolve_id_and_name(self, data: Dict[str, Any], path: Path) -> Tuple[str, str]:
@@ -124,10 +146,10 @@ class SquadronEnrichmentService:
 
         af_dict = data.get("airfields")
         if isinstance(af_dict, dict):
-            items = sorted(((str(k), str(v)) for k, v in af_dict.items()), key=lambda x: x[0])
-            for index, (start, af_name) in enumerate(items):
-                end = items[index + 1][0] if index + 1 < len(items) else ""
-                add_af(start, end, af_name)
+            # Cada período termina onde começa o seguinte: pares (início, próximo início) via zip
+            starts = sorted(af_dict, key=str)
+            for start, end in zip(starts, starts[1:] + [""]):
+                add_af(str(start), str(end), str(af_dict[start]))
 
         if isinstance(data.get("airfields"), list):
             for item in data["airfields"]:
@@ -185,8 +207,7 @@ class SquadronEnrichmentService:
         """Persiste payload em JSON UTF-8 com escrita atômica padronizada."""
         self._validate_output_schema(payload)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with atomic_json_write(output_path) as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        atomic_json_dump(output_path, payload)
 
     @staticmethod
     def _first_string(data: Dict[str, Any], keys: Tuple[str, ...]) -> str:
@@ -201,7 +222,7 @@ class SquadronEnrichmentService:
         if not isinstance(data, dict):
             raise ValueError("Schema inválido: JSON raiz deve ser um objeto")
 
-        for key in ("squadronName", "name", "displayName", "id", "squadron_id"):
+        for key in _INPUT_STRING_KEYS:
             value = data.get(key)
             if value is not None and not isinstance(value, str):
                 raise ValueError(f"Schema inválido: campo '{key}' deve ser string")
@@ -212,10 +233,10 @@ class SquadronEnrichmentService:
 
     @staticmethod
     def _validate_output_schema(payload: Dict[str, Any]) -> None:
-        required = ("squadronId", "squadronName", "country", "history", "emblemImage", "airfields", "source")
-        for key in required:
-            if key not in payload:
-                raise ValueError(f"Schema de saída inválido: campo ausente '{key}'")
+        if not _OUTPUT_REQUIRED.issubset(payload):
+            # Caminho de erro: reporta o primeiro campo ausente na ordem do schema
+            missing = next(key for key in _OUTPUT_REQUIRED_ORDER if key not in payload)
+            raise ValueError(f"Schema de saída inválido: campo ausente '{missing}'")
 
         if not isinstance(payload.get("airfields"), list):
             raise ValueError("Schema de saída inválido: 'airfields' deve ser lista")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict
 
 
@@ -202,10 +203,16 @@ class AppI18n:
         },
     }
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _lookup(key: str, lang: str) -> str:
+        # A tabela é estática: o texto resolvido (com fallback) vale para o processo todo
+        lang_dict = AppI18n._T.get(key, {})
+        return lang_dict.get(lang) or lang_dict.get(AppI18n.PT_BR) or key
+
     @classmethod
     def t(cls, key: str, lang: str, **kwargs: str) -> str:
-        lang_dict = cls._T.get(key, {})
-        text = lang_dict.get(lang) or lang_dict.get(cls.PT_BR) or key
+        text = cls._lookup(key, lang)
         if kwargs:
             return text.format(**kwargs)
         return text
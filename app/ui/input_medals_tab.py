@@ -18,7 +18,7 @@ from PyQt5.QtWidgets import (
     QTableWidgetItem, QFileDialog, QLabel, QGroupBox, QFormLayout,
     QLineEdit, QTextEdit, QMessageBox, QCheckBox, QComboBox
 )
-from utils.file_operations import atomic_json_write
+from utils.file_operations import atomic_json_dump
 from utils.notification_bus import notify_info
 
 logger = logging.getLogger(__name__)
@@ -606,9 +606,7 @@ class InputMedalsTab(QWidget):
     def _persist_and_feedback(self) -> None:
         """Persiste medalhas em arquivo JSON com escrita atômica e exibe feedback."""
         try:
-            with atomic_json_write(self._meta_file) as f:
-                payload: str = json.dumps(self.medals, ensure_ascii=False, indent=2)
-                f.write(payload + "\n")
+            atomic_json_dump(self._meta_file, self.medals, durable=True)
             
             logger.info(f"Arquivo medals.json persistido ({len(self.medals)} medalhas)")
         except (OSError, TypeError, ValueError) as e:
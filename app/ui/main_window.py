@@ -568,6 +568,8 @@ class MainWindow(QMainWindow):
         except (RuntimeError, AttributeError):
             logger.debug("Erro ao tentar finalizar thread de sincronização durante fechamento")
 
+        # Escritas de configurações são agrupadas; garante o flush antes de sair
+        settings_manager.flush()
         logger.info("Aplicação encerrada")
         super().closeEvent(event)
 
@@ -4,11 +4,11 @@
 # Aba de Missões com dia da semana em INGLÊS
 # ===================================================================
 
-from typing import List, Any, Optional
-from datetime import datetime
+from typing import Iterator, List, Any, Optional
+from datetime import datetime, time as _time
 import re
 
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
 from app.application.mission_validation_service import Mission
 from app.application.viewmodels import MissionsViewModel
 from app.ui.delegates.timeline_delegate import TimelineDelegate
@@ -20,6 +20,29 @@ from PyQt5.QtWidgets import (
     QTextEdit, QGroupBox, QHeaderView, QLineEdit, QLabel, QCheckBox
 )
 
+# Formatos aceitos por _format_time; os dois primeiros não têm parte de data
+_TIME_FORMATS = (
+    '%H:%M:%S',
+    '%H:%M',
+    '%d.%m.%Y %H:%M:%S',
+    '%d.%m.%Y %H:%M',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+)
+_BARE_TIME_FORMATS = _TIME_FORMATS[:2]
+
+
+def _looks_like_bare_date(value: str) -> bool:
+    """Indica se o texto é apenas uma data no formato d.m.yyyy."""
+    parts = value.split('.')
+    return (
+        len(parts) == 3
+        and all(p.isdecimal() for p in parts)
+        and 1 <= len(parts[0]) <= 2
+        and 1 <= len(parts[1]) <= 2
+        and len(parts[2]) == 4
+    )
+
 
 class MissionsTab(QWidget, CtrlFFocusMixin):
     """Aba de Missões com tabela e painel de detalhes."""
@@ -32,6 +55,9 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
         super().__init__(parent)
         self._missions: List[Mission] = []
         self._vm: MissionsViewModel = MissionsViewModel()
+        self._last_details: str = ""
+        self._pending_details_idx: int = -1
+        self._details_refresh_pending: bool = False
         self._build_ui()
     
     def _build_ui(self) -> None:
@@ -94,6 +120,7 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
         details_layout: QVBoxLayout = QVBoxLayout(details_group)
         self.details: QTextEdit = QTextEdit()
         self.details.setReadOnly(True)
+        self.details.setAcceptRichText(False)
         details_layout.addWidget(self.details)
         
         splitter.addWidget(self.table)
@@ -116,13 +143,13 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
         loaded_state = self._vm.state_for_loaded_missions(self._missions)
         if loaded_state.state == DSStates.EMPTY:
             self.table.setRowCount(0)
-            self.details.clear()
+            self._pending_details_idx = -1
+            self._set_details_text("")
             self._set_view_state(loaded_state.state, self.tr(loaded_state.message))
             self.stats_updated.emit(0, 0, "—", "—")
             return
 
         self._set_view_state(loaded_state.state, self.tr(loaded_state.message))
-        self.table.setRowCount(len(self._missions))
 
         mission_dates = [self._parse_date(m.date) for m in self._missions]
         known_dates = [d for d in mission_dates if d is not None]
@@ -130,37 +157,51 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
         max_date = max(known_dates) if known_dates else None
         first_date = min_date.strftime("%Y-%m-%d") if min_date else "—"
         last_date = max_date.strftime("%Y-%m-%d") if max_date else "—"
-
+        # Extração de hora (regex) fica fora do laço que toca a tabela
+        mission_times = [self._extract_time(m) for m in self._missions]
+
+        # Suspende repaint, sinais e ordenação enquanto as linhas são preenchidas;
+        # com ordenação ativa, setText em item reaproveitado reordenaria linhas no meio do laço
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        self.table.setSortingEnabled(False)
+        try:
+            self.table.setRowCount(len(self._missions))
+            self._populate_rows(mission_dates, mission_times, min_date, max_date)
+        finally:
+            self.table.setSortingEnabled(True)
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+
+        self._pending_details_idx = -1
+        self._set_details_text("")
+        self.stats_updated.emit(len(self._missions), len(self._missions), first_date, last_date)
+    
+    def _populate_rows(
+        self,
+        mission_dates: List[Optional[datetime]],
+        mission_times: List[str],
+        min_date: Optional[datetime],
+        max_date: Optional[datetime],
+    ) -> None:
+        """Preenche as células de cada missão na tabela."""
         for r, m in enumerate(self._missions):
             # Coluna 0: Data
             date_value = m.date
-            date_item = QTableWidgetItem(date_value)
-            date_item.setTextAlignment(Qt.AlignCenter)
-            date_item.setToolTip(date_value)
-            self.table.setItem(r, 0, date_item)
+            self._fill_cell(r, 0, date_value)
             
             # Coluna 1: Hora (extraída)
-            formatted_time = self._extract_time(m)
-            time_item = QTableWidgetItem(formatted_time)
-            time_item.setTextAlignment(Qt.AlignCenter)
-            time_item.setToolTip(formatted_time)
-            self.table.setItem(r, 1, time_item)
+            self._fill_cell(r, 1, mission_times[r])
             
             # Coluna 2: Aeronave + badge de progressão
             aircraft = m.aircraft
             badge = (m.aircraft_badge or "").strip()
             aircraft_label = f"{aircraft}  🔖 {badge}" if badge else aircraft
-            aircraft_item = QTableWidgetItem(aircraft_label)
-            aircraft_item.setTextAlignment(Qt.AlignCenter)
-            aircraft_item.setToolTip(aircraft_label)
-            self.table.setItem(r, 2, aircraft_item)
+            self._fill_cell(r, 2, aircraft_label)
             
             # Coluna 3: Tipo de missão
             duty = m.duty
-            duty_item = QTableWidgetItem(duty)
-            duty_item.setTextAlignment(Qt.AlignCenter)
-            duty_item.setToolTip(duty)
-            self.table.setItem(r, 3, duty_item)
+            self._fill_cell(r, 3, duty)
 
             ratio = 0.0
             current_date = mission_dates[r] if r < len(mission_dates) else None
@@ -169,14 +210,24 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
             elif current_date and min_date and max_date and max_date == min_date:
                 ratio = 1.0
 
-            timeline_item = QTableWidgetItem("")
+            timeline_item = self.table.item(r, 4)
+            if timeline_item is None:
+                timeline_item = QTableWidgetItem("")
+                timeline_item.setToolTip(self.tr("Progresso temporal da campanha"))
+                self.table.setItem(r, 4, timeline_item)
             timeline_item.setData(Qt.UserRole, ratio)
-            timeline_item.setToolTip(self.tr("Progresso temporal da campanha"))
-            self.table.setItem(r, 4, timeline_item)
 
-        self.details.clear()
-        self.stats_updated.emit(len(self._missions), len(self._missions), first_date, last_date)
-    
+    def _fill_cell(self, row: int, col: int, text: str) -> None:
+        """Reaproveita o item existente da célula, criando-o apenas se faltar."""
+        item = self.table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(Qt.AlignCenter)
+            self.table.setItem(row, col, item)
+        else:
+            item.setText(text)
+        item.setToolTip(text)
+
     def _parse_date(self, date_text: str) -> Optional[datetime]:
         value = (date_text or "").strip()
         for fmt in ('%d/%m/%Y', '%d.%m.%Y', '%d-%m-%Y', '%Y-%m-%d', '%Y%m%d'):
@@ -227,11 +278,17 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
         """
         if not time_value:
             return ''
+
+        # Valores já tipados dispensam conversão para texto e parsing
+        if isinstance(time_value, datetime):
+            return time_value.strftime('%H:%M')
+        if isinstance(time_value, _time):
+            return f"{time_value.hour:02d}:{time_value.minute:02d}"
         
         time_str = str(time_value).strip()
         
         # Ignora se parece ser uma data (formato d.m.yyyy)
-        if re.match(r'^\d{1,2}\.\d{1,2}\.\d{4}$', time_str):
+        if _looks_like_bare_date(time_str):
             return ''
         
         # Caso 1: Formato "HH:MM:SS" ou "HH:MM"
@@ -250,15 +307,9 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
                 except ValueError:
                     pass
         
-        # Caso 2: Tenta parsear como datetime
-        for fmt in [
-            '%H:%M:%S',
-            '%H:%M',
-            '%d.%m.%Y %H:%M:%S',
-            '%d.%m.%Y %H:%M',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y %H:%M'
-        ]:
+        # Caso 2: Tenta parsear como datetime (sem separador de data, só formatos de hora)
+        has_date_part = '.' in time_str or '/' in time_str
+        for fmt in (_TIME_FORMATS if has_date_part else _BARE_TIME_FORMATS):
             try:
                 dt = datetime.strptime(time_str, fmt)
                 return dt.strftime('%H:%M')
@@ -312,16 +363,18 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
         else:
             self.state_label.setStyleSheet(DSStyles.STATE_INFO)
 
-    def _apply_filter(self, text: str) -> None:
-        row_values: List[List[str]] = []
+    def _iter_row_values(self) -> Iterator[List[str]]:
+        """Gera os textos de cada linha sob demanda, sem materializar a tabela inteira."""
+        col_count = self.table.columnCount()
         for row in range(self.table.rowCount()):
             cols: List[str] = []
-            for col in range(self.table.columnCount()):
+            for col in range(col_count):
                 item = self.table.item(row, col)
                 cols.append(item.text() if item else "")
-            row_values.append(cols)
+            yield cols
 
-        visibility = self._vm.filter_visibility(self._missions, row_values, text)
+    def _apply_filter(self, text: str) -> None:
+        visibility = self._vm.filter_visibility(self._missions, self._iter_row_values(), text)
         for row, is_visible in enumerate(visibility):
             self.table.setRowHidden(row, not is_visible)
 
@@ -363,35 +416,54 @@ class MissionsTab(QWidget, CtrlFFocusMixin):
     def _on_selection_changed(self) -> None:
         """
         Lida com a mudança de seleção na tabela de missões.
-        Atualiza o painel de detalhes e emite sinal com dia da semana em inglês.
+        Agenda a atualização do painel de detalhes e emite o sinal de seleção.
         """
         idx: int = self.selected_index()
         
         if 0 <= idx < len(self._missions):
             data: Mission = self._missions[idx]
-            description = data.description
-            
-            # ADICIONA DIA DA SEMANA EM INGLÊS
-            date_str = data.date
-            weekday = self._get_weekday(date_str)
-            
-            if weekday:
-                # Injeta o dia da semana logo após "Date: X.X.XXXX"
-                date_match = re.search(r'(Date[:\s]+\d{1,2}\.\d{1,2}\.\d{4})', description)
-                if date_match:
-                    date_line = date_match.group(1)
-                    # Adiciona dia da semana em inglês após a data
-                    enhanced_description = description.replace(
-                        date_line,
-                        f"{date_line} ({weekday})"
-                    )
-                    self.details.setText(enhanced_description)
-                else:
-                    self.details.setText(description)
-            else:
-                self.details.setText(description)
-            
+            self._schedule_details_refresh(idx)
             self.missionSelected.emit(idx, data)
         else:
-            self.details.clear()
+            self._schedule_details_refresh(-1)
             self.missionSelected.emit(-1, None)
+
+    def _schedule_details_refresh(self, idx: int) -> None:
+        """Agrupa mudanças de seleção em rajada numa única renderização."""
+        self._pending_details_idx = idx
+        if not self._details_refresh_pending:
+            self._details_refresh_pending = True
+            QTimer.singleShot(0, self._refresh_details)
+
+    def _refresh_details(self) -> None:
+        """Renderiza a descrição da missão pendente com dia da semana em inglês."""
+        self._details_refresh_pending = False
+        idx = self._pending_details_idx
+        if not 0 <= idx < len(self._missions):
+            self._set_details_text("")
+            return
+
+        data: Mission = self._missions[idx]
+        description = data.description
+
+        # ADICIONA DIA DA SEMANA EM INGLÊS
+        weekday = self._get_weekday(data.date)
+        if weekday:
+            # Injeta o dia da semana logo após "Date: X.X.XXXX"
+            date_match = re.search(r'(Date[:\s]+\d{1,2}\.\d{1,2}\.\d{4})', description)
+            if date_match:
+                date_line = date_match.group(1)
+                # Adiciona dia da semana em inglês após a data
+                description = description.replace(date_line, f"{date_line} ({weekday})")
+
+        self._set_details_text(description)
+
+    def _set_details_text(self, text: str) -> None:
+        """Atualiza o painel de detalhes apenas quando o texto muda."""
+        if text == self._last_details:
+            return
+        if text:
+            self.details.setPlainText(text)
+        else:
+            self.details.clear()
+        self._last_details = text
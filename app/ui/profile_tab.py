@@ -11,15 +11,17 @@
 
 from __future__ import annotations
 
+import os
 import re
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Set, List
+from typing import Dict, Optional, Tuple, Set, List
 
 from datetime import datetime
 
-from PyQt5.QtCore import Qt, QDate, QSettings, QSize, QRect, QPoint
-from PyQt5.QtGui import QPixmap, QIcon, QMouseEvent
+from PyQt5.QtCore import Qt, QDate, QSettings, QSignalBlocker, QSize, QRect, QTimer
+from PyQt5.QtGui import QPixmap, QIcon, QImageReader, QMouseEvent
 from PyQt5.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -56,6 +58,119 @@ from utils.structured_logger import StructuredLogger
 logger = logging.getLogger("IL2CampaignAnalyzer")
 structured_logger = StructuredLogger("IL2CampaignAnalyzer")
 
+_WS_RE = re.compile(r"\s+")
+_SLUG_RE = re.compile(r"[^a-z0-9_\-\.\:\/]")
+
+
+_ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+# Cópias já redimensionadas dos assets empacotados, geradas uma vez por tamanho
+_PRESCALED_DIR = _ASSETS_DIR / "_prescaled"
+
+
+def _prescaled_path(src: Path, w: int, h: int) -> Optional[Path]:
+    """Caminho da cópia pré-escalada de um asset; ``None`` para arquivos fora de ``app/assets``."""
+    try:
+        rel = src.resolve().relative_to(_ASSETS_DIR)
+    except ValueError:
+        return None
+    if rel.parts and rel.parts[0] == _PRESCALED_DIR.name:
+        return None
+    # Mantém o nome original na chave: foo.png e foo.jpg não podem cair no mesmo arquivo
+    return _PRESCALED_DIR / f"{w}x{h}" / rel.parent / f"{rel.name}.png"
+
+
+def _load_prescaled(src: Path, mtime_ns: int, w: int, h: int) -> Tuple[QPixmap, Optional[Path]]:
+    """Lê a cópia pré-escalada se ela for mais nova que o original."""
+    cached = _prescaled_path(src, w, h)
+    if cached is None:
+        return QPixmap(), None
+    try:
+        if cached.stat().st_mtime_ns >= mtime_ns:
+            return QPixmap(str(cached)), cached
+    except OSError:
+        pass
+    return QPixmap(), cached
+
+
+def _fit(pm: QPixmap, w: int, h: int) -> QPixmap:
+    """Ajusta ``pm`` a ``w``x``h`` mantendo a proporção, sem reamostrar quando já está no tamanho."""
+    if pm.width() == w and pm.height() == h:
+        return pm
+    return pm.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+@lru_cache(maxsize=256)
+def _load_scaled(path_str: str, mtime_ns: int, w: int, h: int) -> QPixmap:
+    """Carrega e redimensiona uma imagem; ``mtime_ns`` invalida a entrada quando o arquivo muda.
+
+    Assets empacotados são lidos da cópia em ``_prescaled/<w>x<h>/`` quando existe;
+    caso contrário são escalados uma vez e gravados ali (melhor esforço). Imagens de fora
+    do bundle, como o avatar do usuário, seguem só com o cache em memória.
+    """
+    pm, cached = _load_prescaled(Path(path_str), mtime_ns, w, h)
+    if not pm.isNull():
+        return pm
+    pm = QPixmap(path_str)
+    if pm.isNull():
+        return pm
+    pm = _fit(pm, w, h)
+    if cached is not None:
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            if not pm.save(str(cached), "PNG"):
+                logger.debug("Não foi possível gravar asset pré-escalado: %s", cached)
+        except OSError:
+            # Diretório somente leitura (ex.: bundle congelado): fica só o cache em memória
+            pass
+    return pm
+
+
+@lru_cache(maxsize=8)
+def _read_scaled(path_str: str, mtime_ns: int, w: int, h: int) -> QPixmap:
+    """Decodifica já no tamanho final (DCT reduzido no JPEG) em vez de carregar a imagem inteira."""
+    reader = QImageReader(path_str)
+    reader.setAutoTransform(True)
+    src = reader.size()
+    if src.isValid():
+        reader.setScaledSize(src.scaled(w, h, Qt.KeepAspectRatio))
+    img = reader.read()
+    if img.isNull():
+        return QPixmap()
+    return QPixmap.fromImage(img)
+
+
+def _scaled_pixmap(path: Path, w: int, h: int) -> QPixmap:
+    """Retorna o pixmap redimensionado do cache (pixmap nulo se o arquivo não existir)."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return QPixmap()
+    return _load_scaled(str(path), mtime_ns, w, h)
+
+
+# Extensões aceitas para assets, em ordem de preferência
+_IMAGE_EXT_PRIORITY = {".png": 0, ".jpg": 1, ".jpeg": 2}
+
+
+def _scan_image_dir(base: Path) -> Dict[str, Path]:
+    """Indexa as imagens de uma pasta por nome-base em minúsculas (uma única varredura)."""
+    index: Dict[str, Path] = {}
+    ranks: Dict[str, int] = {}
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                rank = _IMAGE_EXT_PRIORITY.get(ext.lower())
+                if rank is None:
+                    continue
+                key = stem.lower()
+                if key not in ranks or rank < ranks[key]:
+                    ranks[key] = rank
+                    index[key] = Path(entry.path)
+    except OSError:
+        pass
+    return index
+
 
 class FlowLayout(QLayout):
     """
@@ -76,10 +191,27 @@ class FlowLayout(QLayout):
         self._items: List[QLayoutItem] = []
         self._h_spacing = int(h_spacing)
         self._v_spacing = int(v_spacing)
+        # Caches de geometria; o Qt chama invalidate() quando itens mudam de tamanho/visibilidade
+        self._min_size_cache: Optional[QSize] = None
+        self._hfw_cache: Dict[int, int] = {}
+        self._last_rect = QRect()
+        # Itens visíveis pré-filtrados; show/hide de um widget filho dispara invalidate()
+        self._visible_cache: Optional[List[QLayoutItem]] = None
         self.setContentsMargins(margin, margin, margin, margin)
 
+    def _clear_caches(self) -> None:
+        self._min_size_cache = None
+        self._hfw_cache.clear()
+        self._last_rect = QRect()
+        self._visible_cache = None
+
+    def invalidate(self) -> None:
+        self._clear_caches()
+        super().invalidate()
+
     def addItem(self, item: QLayoutItem) -> None:
         self._items.append(item)
+        self._clear_caches()
 
     def count(self) -> int:
         return len(self._items)
@@ -91,6 +223,7 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index: int) -> Optional[QLayoutItem]:
         if 0 <= index < len(self._items):
+            self._clear_caches()
             return self._items.pop(index)
         return None
 
@@ -101,50 +234,74 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width: int) -> int:
-        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+        height = self._hfw_cache.get(width)
+        if height is None:
+            height = self._do_layout(QRect(0, 0, width, 0), test_only=True)
+            self._hfw_cache[width] = height
+        return height
 
     def setGeometry(self, rect: QRect) -> None:
         super().setGeometry(rect)
+        # Repaints e rajadas de resize repetem o mesmo rect; largura zero não tem o que posicionar
+        if rect == self._last_rect or rect.width() <= 0:
+            return
         self._do_layout(rect, test_only=False)
+        self._last_rect = QRect(rect)
 
     def sizeHint(self) -> QSize:
         return self.minimumSize()
 
     def minimumSize(self) -> QSize:
+        if self._min_size_cache is not None:
+            return QSize(self._min_size_cache)
         size = QSize()
         for item in self._items:
             size = size.expandedTo(item.minimumSize())
         left, top, right, bottom = self.getContentsMargins()
         size += QSize(left + right, top + bottom)
+        self._min_size_cache = QSize(size)
         return size
 
+    def _visible_items(self) -> List[QLayoutItem]:
+        items = self._visible_cache
+        if items is None:
+            # isEmpty() segue hide()/show() explícitos, não a visibilidade do pai: o cache
+            # montado com a aba ainda oculta continua válido quando ela aparece
+            items = [it for it in self._items if not it.isEmpty()]
+            self._visible_cache = items
+        return items
+
     def _do_layout(self, rect: QRect, test_only: bool) -> int:
         left, top, right, bottom = self.getContentsMargins()
         effective = rect.adjusted(left, top, -right, -bottom)
 
-        x = effective.x()
+        # Invariantes em variáveis locais: o laço interno fica só com aritmética
+        left_edge = effective.x()
+        right_edge = effective.right()
+        hsp = self._h_spacing
+        vsp = self._v_spacing
+        place = not test_only
+
+        x = left_edge
         y = effective.y()
         line_height = 0
 
-        for item in self._items:
-            w = item.widget()
-            if w is not None and not w.isVisible():
-                continue
-
+        for item in self._visible_items():
             hint = item.sizeHint()
-            next_x = x + hint.width() + self._h_spacing
+            hint_w = hint.width()
+            hint_h = hint.height()
 
-            if next_x - self._h_spacing > effective.right() and line_height > 0:
-                x = effective.x()
-                y = y + line_height + self._v_spacing
-                next_x = x + hint.width() + self._h_spacing
+            if x + hint_w > right_edge and line_height > 0:
+                x = left_edge
+                y += line_height + vsp
                 line_height = 0
 
-            if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), hint))
+            if place:
+                item.setGeometry(QRect(x, y, hint_w, hint_h))
 
-            x = next_x
-            line_height = max(line_height, hint.height())
+            x += hint_w + hsp
+            if hint_h > line_height:
+                line_height = hint_h
 
         return (y + line_height - rect.y()) + bottom
 
@@ -204,18 +361,25 @@ class ProfileTab(QWidget):
     MAX_BIO = 2000
     SCHEMA_VERSION = 1
 
+    # Um QIcon por (país, medalha, largura, altura), compartilhado entre instâncias
+    _ICON_CACHE: Dict[Tuple[str, str, int, int], QIcon] = {}
+    # Assets não mudam em tempo de execução: uma varredura por pasta para todo o processo
+    _DIR_INDEX: Dict[Path, Dict[str, Path]] = {}
+
     def __init__(self, settings: Optional[QSettings] = None, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self.settings = settings or QSettings("IL2CampaignAnalyzer", "Settings")
 
         self._ref_date: Optional[datetime] = None
+        self._ref_qdate: Optional[QDate] = None
         self.loaded_ok = False
         self.loading = False
         self._has_unsaved_changes = False
 
         self._campaign_key = "default"
         self._pilot_key = "default"
+        self._prefix_cached: Optional[str] = None
         self._recruit_ref_year = self.MIN_ENLIST_YEAR
         self._max_recruit_age = int(self.settings.value("profile/max_recruit_age", self.DEFAULT_MAX_RECRUIT_AGE))
 
@@ -248,7 +412,11 @@ class ProfileTab(QWidget):
         self.age_label = QLabel("N/A")
         self.birthplace_edit = QLineEdit()
         self.bio_edit = QTextEdit()
-        self.btn_save: Optional[QPushButton] = None
+
+        # Botão salvar desabilitado inicialmente
+        self.btn_save = QPushButton(self.tr("Salvar Perfil"))
+        self.btn_save.clicked.connect(self.save_to_settings)
+        self.btn_save.setEnabled(False)
 
         # Condecorações (agora com FlowLayout)
         self._ribbons_scroll: Optional[QScrollArea] = None
@@ -258,39 +426,73 @@ class ProfileTab(QWidget):
         # Tamanho menor ajuda bastante na densidade e evita UI "gigante"
         self._ribbon_icon_size = QSize(96, 96)
 
-        self._build_ui()
+        # Retrato, ribbons e leitura do QSettings ficam para o primeiro showEvent;
+        # setters que carregam imagens são enfileirados até lá
+        self._built = False
+        self._settings_pending = True
+        self._pending_calls: Dict[str, tuple] = {}
+
         self._connect_signals()
         self._configure_dob_bounds()
-        self.load_from_settings()
+
+    def showEvent(self, event) -> None:  # noqa: N802
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        self._build_ui()
+
+        if self._settings_pending:
+            self.load_from_settings()
+        else:
+            self._load_portrait(self.settings.value(f"{self._prefix()}/avatar_path", ""))
+
+        pending, self._pending_calls = self._pending_calls, {}
+        for name, args in pending.items():
+            getattr(self, name)(*args)
+
+    def _defer_until_built(self, name: str, *args) -> bool:
+        """Guarda a chamada mais recente de um setter até a UI existir."""
+        if self._built:
+            return False
+        self._pending_calls[name] = args
+        return True
 
     # ---------------- Keys/paths ----------------
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _slug(s: str) -> str:
         s = (s or "").strip().lower()
-        s = re.sub(r"\s+", "_", s)
-        s = re.sub(r"[^a-z0-9_\-\.\:\/]", "", s)
+        s = _WS_RE.sub("_", s)
+        s = _SLUG_RE.sub("", s)
         return s or "default"
 
     def set_context(self, campaign_name: str, pilot_name: str) -> None:
         self._campaign_key = self._slug(campaign_name)
         self._pilot_key = self._slug(pilot_name)
+        self._prefix_cached = None
         logger.info("Contexto definido: campanha=%s, piloto=%s", self._campaign_key, self._pilot_key)
 
     def _prefix(self) -> str:
-        return f"campaigns/{self._campaign_key}/profiles/{self._pilot_key}"
+        if self._prefix_cached is None:
+            self._prefix_cached = f"campaigns/{self._campaign_key}/profiles/{self._pilot_key}"
+        return self._prefix_cached
 
     @staticmethod
     def _icons_base_dir() -> Path:
-        return Path(__file__).resolve().parents[1] / "assets" / "icons"
+        return _ASSETS_DIR / "icons"
 
     @staticmethod
     def _medals_base_dir() -> Path:
-        return Path(__file__).resolve().parents[1] / "assets" / "medals"
+        return _ASSETS_DIR / "medals"
 
     @staticmethod
     def _ranks_base_dir() -> Path:
-        return Path(__file__).resolve().parents[1] / "assets" / "ranks"
+        return _ASSETS_DIR / "ranks"
 
     def _get_asset_path(self, name: str) -> Path:
         p = self._icons_base_dir() / name
@@ -395,22 +597,12 @@ class ProfileTab(QWidget):
         self._ribbons_scroll.setWidgetResizable(True)
         self._ribbons_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        self._ribbons_holder = QtWidget()
-        self._ribbons_holder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-
-        # FlowLayout (wrap)
-        self._ribbons_layout = FlowLayout(self._ribbons_holder, margin=0, h_spacing=8, v_spacing=8)
-        self._ribbons_holder.setLayout(self._ribbons_layout)
-
+        self._ribbons_holder, self._ribbons_layout = self._new_ribbons_holder()
         self._ribbons_scroll.setWidget(self._ribbons_holder)
         rv.addWidget(self._ribbons_scroll)
 
         form_right.addRow(ribbons_group)
 
-        # Botão salvar desabilitado inicialmente
-        self.btn_save = QPushButton(self.tr("Salvar Perfil"))
-        self.btn_save.clicked.connect(self.save_to_settings)
-        self.btn_save.setEnabled(False)
         form_right.addRow("", self.btn_save)
 
         info_hbox.addWidget(rank_panel)
@@ -422,13 +614,19 @@ class ProfileTab(QWidget):
         outer.addWidget(info_group, stretch=1)
 
     def _connect_signals(self):
+        # Digitação revalida no máximo a cada 100 ms (cada textChanged reinicia o timer)
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self._update_save_button)
+
         self.dob_edit.dateChanged.connect(self._update_age_label)
         self.dob_edit.dateChanged.connect(self._mark_dirty)
         self.dob_edit.dateChanged.connect(self._update_save_button)
         self.birthplace_edit.textChanged.connect(self._mark_dirty)
-        self.birthplace_edit.textChanged.connect(self._update_save_button)
+        self.birthplace_edit.textChanged.connect(self._schedule_validation)
         self.bio_edit.textChanged.connect(self._mark_dirty)
-        self.bio_edit.textChanged.connect(self._update_save_button)
+        self.bio_edit.textChanged.connect(self._schedule_validation)
 
     # ---------------- Assets (frame/avatar/roundel/rank) ----------------
 
@@ -442,7 +640,7 @@ class ProfileTab(QWidget):
             self.frame_label.setStyleSheet("color:#888; border:1px dashed #666;")
             return
 
-        pm = QPixmap(str(frame_path))
+        pm = _scaled_pixmap(frame_path, self.FRAME_W, self.FRAME_H)
         if pm.isNull():
             self.frame_label.setText(self.tr("Frame ausente"))
             self.frame_label.setStyleSheet("color:#888; border:1px dashed #666;")
@@ -450,9 +648,23 @@ class ProfileTab(QWidget):
 
         self.frame_label.setStyleSheet("")
         self.frame_label.setText("")
-        self.frame_label.setPixmap(pm.scaled(self.FRAME_W, self.FRAME_H, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.frame_label.setPixmap(pm)
         self.frame_label.raise_()
 
+    def _load_portrait(self, avatar_path: str) -> None:
+        self._load_frame()
+
+        if avatar_path:
+            try:
+                self._set_avatar_pixmap(Path(avatar_path))
+            except (OSError, ValueError):
+                pass
+        else:
+            if self.avatar_label:
+                self.avatar_label.clear()
+            if self.frame_label:
+                self.frame_label.raise_()
+
     def _choose_avatar(self):
         path, _ = QFileDialog.getOpenFileName(self, self.tr("Escolher Avatar"), "", self.tr("Imagens (*.png *.jpg *.jpeg)"))
         if not path:
@@ -473,15 +685,21 @@ class ProfileTab(QWidget):
     def _set_avatar_pixmap(self, path: Path):
         if not self.avatar_label:
             return
-        pm = QPixmap(str(path))
+        # Avatares do usuário podem ter vários megapixels: decodifica direto no tamanho do rótulo
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            raise ValueError("Imagem inválida")
+        pm = _read_scaled(str(path), mtime_ns, self.AVATAR_MAX_W, self.AVATAR_MAX_H)
         if pm.isNull():
             raise ValueError("Imagem inválida")
-        pm = pm.scaled(self.AVATAR_MAX_W, self.AVATAR_MAX_H, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.avatar_label.setPixmap(pm)
         if self.frame_label:
             self.frame_label.raise_()
 
     def set_roundel(self, country_code: str, display_name: Optional[str] = None):
+        if self._defer_until_built("set_roundel", country_code, display_name):
+            return
         code = (country_code or "").strip().upper()
         name_map = {"GERMANY": "Germany", "BRITAIN": "Great Britain", "USA": "USA", "FRANCE": "France", "BELGIAN": "Belgium"}
         label = display_name or name_map.get(code, "Germany")
@@ -497,35 +715,38 @@ class ProfileTab(QWidget):
             self.roundel_image_label.setStyleSheet("color:#888;")
             return
 
-        pm = QPixmap(str(img_path))
+        pm = _scaled_pixmap(img_path, self.roundel_image_label.width(), self.roundel_image_label.height())
         if pm.isNull():
             self.roundel_image_label.setText(self.tr("Sem roundel"))
             self.roundel_image_label.setStyleSheet("color:#888;")
             return
 
-        pm = pm.scaled(self.roundel_image_label.width(), self.roundel_image_label.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.roundel_image_label.setStyleSheet("")
         self.roundel_image_label.setText("")
         self.roundel_image_label.setPixmap(pm)
 
+    def _image_index(self, base_dir: Path) -> Dict[str, Path]:
+        index = self._DIR_INDEX.get(base_dir)
+        if index is None:
+            index = _scan_image_dir(base_dir)
+            self._DIR_INDEX[base_dir] = index
+        return index
+
     def _find_image_file(self, base_dir: Path, stem: str) -> Optional[Path]:
-        for ext in (".png", ".jpg", ".jpeg", ".PNG", ".JPG", ".JPEG"):
-            p = base_dir / f"{stem}{ext}"
-            if p.exists():
+        index = self._image_index(base_dir)
+        key = stem.lower()
+        for candidate in (key, f"{key}_roundel", f"roundel_{key}"):
+            p = index.get(candidate)
+            if p is not None:
                 return p
-
-        alt_stems = [f"{stem}_roundel", f"roundel_{stem}", stem.lower(), stem.title()]
-        for s in alt_stems:
-            for ext in (".png", ".jpg", ".jpeg", ".PNG", ".JPG", ".JPEG"):
-                p = base_dir / f"{s}{ext}"
-                if p.exists():
-                    return p
         return None
 
     def set_rank(self, rank: str):
         self.set_rank_with_insignia(rank_name=rank, country_folder="germany")
 
     def set_rank_with_insignia(self, rank_name: str, country_folder: str = "germany"):
+        if self._defer_until_built("set_rank_with_insignia", rank_name, country_folder):
+            return
         display = rank_name or "N/A"
         self.rank_text_label.setText(display)
 
@@ -543,13 +764,12 @@ class ProfileTab(QWidget):
             self.rank_image_label.setStyleSheet("color:#888;")
             return
 
-        pm = QPixmap(str(img_path))
+        pm = _scaled_pixmap(img_path, self.rank_image_label.width(), self.rank_image_label.height())
         if pm.isNull():
             self.rank_image_label.setText(self.tr("Imagem não encontrada"))
             self.rank_image_label.setStyleSheet("color:#888;")
             return
 
-        pm = pm.scaled(self.rank_image_label.width(), self.rank_image_label.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.rank_image_label.setStyleSheet("")
         self.rank_image_label.setText("")
         self.rank_image_label.setPixmap(pm)
@@ -588,6 +808,7 @@ class ProfileTab(QWidget):
 
     def update_reference_date(self, ref_date: Optional[datetime]):
         self._ref_date = ref_date
+        self._ref_qdate = QDate(ref_date.year, ref_date.month, ref_date.day) if ref_date else None
         self._update_age_label()
 
     def set_recruitment_reference_date(self, ref_date: Optional[datetime]):
@@ -613,65 +834,89 @@ class ProfileTab(QWidget):
 
     # ---------------- Ribbons (FlowLayout) ----------------
 
-    def _clear_ribbons(self):
-        if not self._ribbons_layout:
-            return
+    @staticmethod
+    def _new_ribbons_holder() -> Tuple[QtWidget, FlowLayout]:
+        holder = QtWidget()
+        holder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
 
-        while self._ribbons_layout.count():
-            item = self._ribbons_layout.takeAt(0)
-            if not item:
-                continue
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        # FlowLayout (wrap)
+        layout = FlowLayout(holder, margin=0, h_spacing=8, v_spacing=8)
+        holder.setLayout(layout)
+        return holder, layout
+
+    def _new_ribbon_button(self) -> QToolButton:
+        btn = QToolButton()
+        btn.setIconSize(self._ribbon_icon_size)
+        btn.setToolButtonStyle(Qt.ToolButtonIconOnly)
+        btn.setAutoRaise(True)
+        btn.setCursor(Qt.PointingHandCursor)
+        btn.setFixedSize(self._ribbon_icon_size.width() + 10, self._ribbon_icon_size.height() + 10)
+        return btn
 
     def set_ribbons(self, country_code: str, earned_ids: Optional[Set[str]] = None):
-        self._clear_ribbons()
+        if self._defer_until_built("set_ribbons", country_code, earned_ids):
+            return
+        if self._ribbons_scroll is None:
+            return
+        # Monta o novo container fora da tela e troca de uma vez: o layout roda uma única
+        # vez na árvore nova e o setWidget descarta o container antigo com seus filhos
+        holder, layout = self._new_ribbons_holder()
+        self._populate_ribbons(layout, country_code, earned_ids)
+        self._ribbons_scroll.setWidget(holder)
+        self._ribbons_holder = holder
+        self._ribbons_layout = layout
+
+    @staticmethod
+    def _add_ribbon_note(layout: FlowLayout, text: str) -> None:
+        label = QLabel(text)
+        layout.addWidget(label)
+        # show() explícito: o container ainda está fora da tela e o FlowLayout ignora itens ocultos
+        label.show()
 
+    def _populate_ribbons(self, layout: FlowLayout, country_code: str, earned_ids: Optional[Set[str]]) -> None:
         ids = list(earned_ids or [])
         if not ids:
-            if self._ribbons_layout:
-                self._ribbons_layout.addWidget(QLabel(self.tr("Sem condecorações registradas.")))
+            self._add_ribbon_note(layout, self.tr("Sem condecorações registradas."))
             return
 
         code = (country_code or "GERMANY").upper()
         base = self._medals_base_dir() / code
         if not base.exists():
-            if self._ribbons_layout:
-                self._ribbons_layout.addWidget(QLabel(self.tr("Pasta de medalhas ausente.")))
+            self._add_ribbon_note(layout, self.tr("Pasta de medalhas ausente."))
             return
 
-        def _pick_pm(stem: str) -> Optional[QPixmap]:
-            for ext in (".png", ".PNG", ".jpg", ".jpeg", ".JPG", ".JPEG"):
-                p = base / f"{stem}{ext}"
-                pm = QPixmap(str(p))
-                if not pm.isNull():
-                    return pm
-
-                p = base / f"ribbon_{stem}{ext}"
-                pm = QPixmap(str(p))
+        icon_w = self._ribbon_icon_size.width()
+        icon_h = self._ribbon_icon_size.height()
+
+        index = self._image_index(base)
+
+        def _pick_icon(stem: str) -> Optional[QIcon]:
+            key = (code, stem, icon_w, icon_h)
+            icon = self._ICON_CACHE.get(key)
+            if icon is not None:
+                return icon
+            stem_key = stem.lower()
+            for candidate in (stem_key, f"ribbon_{stem_key}"):
+                path = index.get(candidate)
+                if path is None:
+                    continue
+                pm = _scaled_pixmap(path, icon_w, icon_h)
                 if not pm.isNull():
-                    return pm
+                    icon = QIcon(pm)
+                    self._ICON_CACHE[key] = icon
+                    return icon
             return None
 
         for mid in ids:
-            pm = _pick_pm(mid)
-            if pm is None:
+            icon = _pick_icon(mid)
+            if icon is None:
                 continue
 
-            scaled_pm = pm.scaled(self._ribbon_icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-            btn = QToolButton()
-            btn.setIcon(QIcon(scaled_pm))
-            btn.setIconSize(self._ribbon_icon_size)
-            btn.setToolButtonStyle(Qt.ToolButtonIconOnly)
-            btn.setAutoRaise(True)
+            btn = self._new_ribbon_button()
+            btn.setIcon(icon)
             btn.setToolTip(mid)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setFixedSize(self._ribbon_icon_size.width() + 10, self._ribbon_icon_size.height() + 10)
-
-            if self._ribbons_layout:
-                self._ribbons_layout.addWidget(btn)
+            layout.addWidget(btn)
+            btn.show()
 
     # ---------------- Persistence ----------------
 
@@ -685,10 +930,14 @@ class ProfileTab(QWidget):
 
         try:
             prefix = self._prefix()
-            self.settings.setValue(f"{prefix}/schema_version", self.SCHEMA_VERSION)
-            self.settings.setValue(f"{prefix}/dob", self.dob_edit.date().toString("yyyy-MM-dd"))
-            self.settings.setValue(f"{prefix}/birthplace", self.birthplace_edit.text()[: self.MAX_BIRTHPLACE])
-            self.settings.setValue(f"{prefix}/bio", self.bio_edit.toPlainText()[: self.MAX_BIO])
+            self.settings.beginGroup(prefix)
+            try:
+                self.settings.setValue("schema_version", self.SCHEMA_VERSION)
+                self.settings.setValue("dob", self.dob_edit.date().toString("yyyy-MM-dd"))
+                self.settings.setValue("birthplace", self.birthplace_edit.text()[: self.MAX_BIRTHPLACE])
+                self.settings.setValue("bio", self.bio_edit.toPlainText()[: self.MAX_BIO])
+            finally:
+                self.settings.endGroup()
             emit_event(
                 structured_logger,
                 Events.PROFILE_SAVED,
@@ -718,35 +967,33 @@ class ProfileTab(QWidget):
     def load_from_settings(self):
         self.loaded_ok = False
         self.loading = True
+        self._settings_pending = False
 
         try:
-            prefix = self._prefix()
-            self._load_frame()
-
-            avatar_path = self.settings.value(f"{prefix}/avatar_path", "")
-            if avatar_path:
-                try:
-                    self._set_avatar_pixmap(Path(avatar_path))
-                except (OSError, ValueError):
-                    pass
-            else:
-                if self.avatar_label:
-                    self.avatar_label.clear()
-                if self.frame_label:
-                    self.frame_label.raise_()
-
-            dob_str = self.settings.value(f"{prefix}/dob", "")
-            if dob_str:
-                try:
-                    d = datetime.strptime(dob_str, "%Y-%m-%d")
-                    self.dob_edit.setDate(QDate(d.year, d.month, d.day))
-                except ValueError:
+            self.settings.beginGroup(self._prefix())
+            try:
+                avatar_path = self.settings.value("avatar_path", "")
+                dob_str = self.settings.value("dob", "")
+                birthplace = self.settings.value("birthplace", "")
+                bio = self.settings.value("bio", "")
+            finally:
+                self.settings.endGroup()
+
+            self._load_portrait(avatar_path)
+
+            # Sem sinais durante a carga: validação e rótulo de idade rodam uma vez no finally
+            with QSignalBlocker(self.dob_edit), QSignalBlocker(self.birthplace_edit), QSignalBlocker(self.bio_edit):
+                if dob_str:
+                    try:
+                        d = datetime.strptime(dob_str, "%Y-%m-%d")
+                        self.dob_edit.setDate(QDate(d.year, d.month, d.day))
+                    except ValueError:
+                        self._configure_dob_bounds()
+                else:
                     self._configure_dob_bounds()
-            else:
-                self._configure_dob_bounds()
 
-            self.birthplace_edit.setText(self.settings.value(f"{prefix}/birthplace", "")[: self.MAX_BIRTHPLACE])
-            self.bio_edit.setPlainText(self.settings.value(f"{prefix}/bio", "")[: self.MAX_BIO])
+                self.birthplace_edit.setText(birthplace[: self.MAX_BIRTHPLACE])
+                self.bio_edit.setPlainText(bio[: self.MAX_BIO])
 
             self.loaded_ok = True
 
@@ -762,10 +1009,7 @@ class ProfileTab(QWidget):
     # ---------------- Validation ----------------
 
     def _validate_profile(self) -> Tuple[bool, str]:
-        qd = self.dob_edit.date()
-        dob = datetime(qd.year(), qd.month(), qd.day())
-
-        if dob.date() > datetime.now().date():
+        if self.dob_edit.date() > QDate.currentDate():
             return False, self.tr("A data de nascimento não pode ser futura.")
 
         birthplace_text = self.birthplace_edit.text()
@@ -779,14 +1023,11 @@ class ProfileTab(QWidget):
         return True, ""
 
     def _update_age_label(self):
-        qd = self.dob_edit.date()
-        dob = datetime(qd.year(), qd.month(), qd.day())
-
-        if not self._ref_date:
+        if self._ref_qdate is None:
             self.age_label.setText("N/A")
             return
 
-        age = self._compute_age(dob, self._ref_date)
+        age = self._compute_qdate_age(self.dob_edit.date(), self._ref_qdate)
         self.age_label.setText("N/A" if age < 0 else str(age))
 
     def _mark_dirty(self, *_args):
@@ -794,6 +1035,9 @@ class ProfileTab(QWidget):
             return
         self._has_unsaved_changes = True
 
+    def _schedule_validation(self, *_args):
+        self._validate_timer.start()
+
     def _update_save_button(self):
         if not self.btn_save:
             return
@@ -807,3 +1051,10 @@ class ProfileTab(QWidget):
         if ref.date() < dob.date():
             return -1
         return ref.year - dob.year - ((ref.month, ref.day) < (dob.month, dob.day))
+
+    @staticmethod
+    def _compute_qdate_age(dob: QDate, ref: QDate) -> int:
+        """Mesmo cálculo de _compute_age, direto sobre QDate (sem criar datetime)."""
+        if ref < dob:
+            return -1
+        return ref.year() - dob.year() - ((ref.month(), ref.day()) < (dob.month(), dob.day()))
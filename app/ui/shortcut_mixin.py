@@ -1,25 +1,61 @@
 from __future__ import annotations
 
-from typing import Optional
+import weakref
+from typing import Dict, List, Optional
 
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QLineEdit, QShortcut, QWidget
 from PyQt5.QtCore import Qt
 
+_CTRL_F_NAME = "wingmate_ctrl_f"
+
+
+def _focus_first_filter(targets: List["weakref.ReferenceType[QLineEdit]"]) -> None:
+    """Foca o primeiro filtro vivo, visível e habilitado entre os registrados."""
+    for ref in targets:
+        edit = ref()
+        if edit is None:
+            continue
+        try:
+            if not (edit.isVisible() and edit.isEnabled()):
+                continue
+        except RuntimeError:
+            # Objeto C++ já destruído
+            continue
+        edit.setFocus()
+        edit.selectAll()
+        return
+
 
 class CtrlFFocusMixin:
     """Mixin para foco de filtro com Ctrl+F usando QShortcut."""
 
+    # Criados no primeiro bind: mantêm os atalhos vivos no ciclo do widget e, por
+    # atalho, os filtros que ele pode focar (refs fracas, na ordem de registro)
+    _shortcuts: List[QShortcut]
+    _shortcut_targets: Dict[QShortcut, List["weakref.ReferenceType[QLineEdit]"]]
+
     def bind_ctrl_f_to_filter(self, owner: QWidget, filter_edit: Optional[QLineEdit]) -> None:
         if filter_edit is None:
             return
 
-        shortcut = QShortcut(QKeySequence("Ctrl+F"), owner)
-        shortcut.setContext(Qt.WidgetWithChildrenShortcut)
-        shortcut.activated.connect(filter_edit.setFocus)
-        shortcut.activated.connect(filter_edit.selectAll)
-
-        # Mantém referência viva no ciclo do widget
         if not hasattr(self, "_shortcuts"):
             self._shortcuts = []
-        self._shortcuts.append(shortcut)
+            self._shortcut_targets = {}
+
+        # Um único QShortcut por dono, reaproveitado em binds repetidos: atalhos duplicados
+        # no mesmo contexto ficariam ambíguos e o Qt não dispararia nenhum deles
+        shortcut = owner.findChild(QShortcut, _CTRL_F_NAME, Qt.FindDirectChildrenOnly)
+        if shortcut is None:
+            shortcut = QShortcut(QKeySequence(QKeySequence.Find), owner)
+            shortcut.setObjectName(_CTRL_F_NAME)
+            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        if shortcut not in self._shortcut_targets:
+            new_targets: List["weakref.ReferenceType[QLineEdit]"] = []
+            shortcut.activated.connect(lambda: _focus_first_filter(new_targets))
+            self._shortcut_targets[shortcut] = new_targets
+            self._shortcuts.append(shortcut)
+
+        targets = self._shortcut_targets[shortcut]
+        targets[:] = [ref for ref in targets if ref() is not None and ref() is not filter_edit]
+        targets.append(weakref.ref(filter_edit))
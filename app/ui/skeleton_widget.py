@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtWidgets import QFrame, QLabel, QVBoxLayout, QWidget
+from PyQt5.QtCore import QEasingCurve, QPropertyAnimation, Qt
+from PyQt5.QtWidgets import QFrame, QGraphicsOpacityEffect, QLabel, QVBoxLayout, QWidget
 
 from app.ui.design_system import DSFeedback
 
 
 class SkeletonWidget(QWidget):
-    """Overlay simples de skeleton com animação por QTimer no MainThread."""
+    """Overlay simples de skeleton com pulso de opacidade animado pelo Qt."""
 
     def __init__(self, message: str = "Carregando...", parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setStyleSheet(DSFeedback.LOADING_OVERLAY_BG)
+        # Seletor por objectName: o fundo do overlay não deve cascatear para os filhos
+        self.setObjectName("skeleton_overlay")
+        self.setStyleSheet(f"#skeleton_overlay {{ {DSFeedback.LOADING_OVERLAY_BG} }}")
 
         self._title = QLabel(message, self)
         self._title.setStyleSheet(DSFeedback.LOADING_TITLE_TEXT)
@@ -22,35 +24,44 @@ class SkeletonWidget(QWidget):
         layout.setSpacing(10)
         layout.addWidget(self._title)
 
+        # Todas as barras ficam num único container com um efeito de opacidade compartilhado
+        self._bars_holder = QWidget(self)
+        bars_layout = QVBoxLayout(self._bars_holder)
+        bars_layout.setContentsMargins(0, 0, 0, 0)
+        bars_layout.setSpacing(10)
+
         self._bars: list[QFrame] = []
         for _ in range(6):
-            bar = QFrame(self)
+            bar = QFrame(self._bars_holder)
             bar.setFixedHeight(14)
-            bar.setStyleSheet(f"background-color: {DSFeedback.LOADING_BAR_IDLE}; border-radius: 6px;")
-            layout.addWidget(bar)
+            bar.setStyleSheet(f"background-color: {DSFeedback.LOADING_BAR_ACTIVE}; border-radius: 6px;")
+            bars_layout.addWidget(bar)
             self._bars.append(bar)
 
+        layout.addWidget(self._bars_holder)
         layout.addStretch(1)
 
-        self._pulse_on = False
-        self._timer = QTimer(self)
-        self._timer.setInterval(260)
-        self._timer.timeout.connect(self._tick)
+        self._opacity = QGraphicsOpacityEffect(self._bars_holder)
+        self._opacity.setOpacity(0.55)
+        self._bars_holder.setGraphicsEffect(self._opacity)
+
+        # Vai e volta 0.55 -> 1.0 -> 0.55 sem callbacks Python por quadro
+        self._pulse = QPropertyAnimation(self._opacity, b"opacity", self)
+        self._pulse.setDuration(1040)
+        self._pulse.setStartValue(0.55)
+        self._pulse.setKeyValueAt(0.5, 1.0)
+        self._pulse.setEndValue(0.55)
+        self._pulse.setEasingCurve(QEasingCurve.InOutSine)
+        self._pulse.setLoopCount(-1)
         self.hide()
 
     def set_message(self, message: str) -> None:
         self._title.setText(message or "Carregando...")
 
     def showEvent(self, event) -> None:  # noqa: N802
-        self._timer.start()
+        self._pulse.start()
         super().showEvent(event)
 
     def hideEvent(self, event) -> None:  # noqa: N802
-        self._timer.stop()
+        self._pulse.stop()
         super().hideEvent(event)
-
-    def _tick(self) -> None:
-        self._pulse_on = not self._pulse_on
-        color = DSFeedback.LOADING_BAR_ACTIVE if self._pulse_on else DSFeedback.LOADING_BAR_IDLE
-        for bar in self._bars:
-            bar.setStyleSheet(f"background-color: {color}; border-radius: 6px;")
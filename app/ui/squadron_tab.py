@@ -1,58 +1,216 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Dict, Optional, Any, Union, Set, Iterator
+from typing import List, Dict, Optional, Any, Union, Set, Iterable, Iterator, Mapping, Tuple, Callable, ClassVar, FrozenSet
+from functools import lru_cache
 from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
+import codecs
+import io
 import json
+import os
 import html
 import logging  # <-- Importação adicionada
 
-from PyQt5.QtCore import Qt, QTimer, QPoint, pyqtSignal
-from PyQt5.QtGui import QPixmap, QTransform, QColor, QMouseEvent, QIcon, QPainter, QFont
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QEvent, QModelIndex, QObject, QPersistentModelIndex, QRunnable,
+    QSortFilterProxyModel, QThreadPool, QTimer, pyqtSignal
+)
+from PyQt5.QtGui import QBrush, QPixmap, QTransform, QColor, QCursor, QIcon, QPainter, QFont
 from app.application.viewmodels import SquadronViewModel
 from app.ui.design_system import DSStyles, DSStates, DSSpacing, apply_section_group
 from app.ui.shortcut_mixin import CtrlFFocusMixin
 from app.ui.widgets.stats_bar import StatsBar
+from utils import json_fast
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QScrollArea,
-    QTableWidget, QTableWidgetItem, QHeaderView, QToolTip, QLineEdit, QCheckBox,
+    QTableView, QAbstractItemView, QHeaderView, QLineEdit, QCheckBox, QToolTip,
     QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
 )
 
 logger = logging.getLogger(__name__)  # <-- Instância do logger adicionada
 
 
-def _esc(s: str) -> str:
-    return html.escape(str(s or ""))
+@lru_cache(maxsize=2048)
+def _norm(s: str) -> str:
+    """Normalização para comparar nomes (esquadrões, aliases, patentes) sem diferenciar caixa."""
+    return s.strip().casefold() if s else ""
+
+
+@lru_cache(maxsize=512)
+def _norm_rank(rank_name: str) -> str:
+    """Chave de patente usada nas tabelas de ordem e nos nomes de arquivo das insígnias."""
+    return (rank_name or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _name_variants(base: str) -> Tuple[str, ...]:
+    """Grafias de arquivo para um nome de esquadrão (espaço, hífen, sublinhado ou colado).
+
+    Sem espaço as quatro grafias coincidem; com espaço são sempre distintas, então não há o que deduplicar.
+    """
+    if " " not in base:
+        return (base,)
+    return (base, base.replace(" ", "-"), base.replace(" ", "_"), base.replace(" ", ""))
+
+
+@lru_cache(maxsize=256)
+def _load_meta(path_str: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Lê e parseia um meta JSON; ``mtime_ns``/``size`` invalidam a entrada quando o arquivo muda.
+
+    O resultado é compartilhado entre chamadas, por isso é exposto somente leitura.
+    """
+    raw = Path(path_str).read_bytes()
+    # json_fast não aceita BOM: o BOM UTF-8 é removido antes do parse
+    data = json_fast.loads(raw[3:] if raw.startswith(codecs.BOM_UTF8) else raw)
+    return MappingProxyType(data if isinstance(data, dict) else {})
+
+
+def _read_meta(path: Path) -> Mapping[str, Any]:
+    """Retorna o meta JSON do cache; propaga ``OSError``/``JSONDecodeError`` como ``json.load``."""
+    st = path.stat()
+    return _load_meta(str(path), st.st_mtime_ns, st.st_size)
+
+
+class _RenderSignals(QObject):
+    """Ponte de sinais do _RenderJob (QRunnable não é QObject)."""
+
+    finished = pyqtSignal(int, str)
 
 
-class RankIconLabel(QLabel):
-    """QLabel com tooltip retardado (2s) para exibir o nome da patente apenas após hover."""
-    def __init__(self, rank_text: str, delay_ms: int = 2000, parent: Optional[QWidget] = None) -> None:
+class _RenderJob(QRunnable):
+    """Monta o HTML do painel "Histórico e Dados" fora da thread da UI."""
+
+    def __init__(self, epoch: int, meta: Mapping[str, Any], render: Callable[[Mapping[str, Any]], str]) -> None:
+        super().__init__()
+        self.signals = _RenderSignals()
+        self._epoch = epoch
+        self._meta = meta
+        self._render = render
+
+    def run(self) -> None:
+        try:
+            html_text = self._render(self._meta)
+        except Exception:
+            logger.exception("Falha ao montar o HTML do esquadrão")
+            html_text = ""
+        self.signals.finished.emit(self._epoch, html_text)
+
+
+# Papel com a insígnia (QPixmap já escalado) da coluna de patente
+RANK_PIXMAP_ROLE: int = Qt.UserRole + 1
+# Chave de ordenação por coluna (int ou str), comparada pelo proxy em C++
+SORT_ROLE: int = Qt.UserRole + 2
+
+
+class SquadronTableModel(QAbstractTableModel):
+    """Modelo da tabela de pessoal: guarda os dados brutos por linha, sem widgets por célula."""
+
+    HEADERS = ("Nome", "Patente", "Abates", "Missões", "Status")
+    _TEXT_KEYS = ("name", "rank", "victories", "missions", "status")
+    STATUS_TOOLTIP_MIN_LEN = 16
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self._rank_text: str = rank_text or "N/A"
-        self.rank_name: str = self._rank_text
-        self._delay_ms: int = max(0, int(delay_ms))
-        self._timer: QTimer = QTimer(self)
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._show_tooltip)
+        self._rows: List[Dict[str, Any]] = []
 
-    def enterEvent(self, event: QMouseEvent) -> None:
-        if self._delay_ms > 0:
-            self._timer.start(self._delay_ms)
-        else:
-            self._show_tooltip()
-        super().enterEvent(event)
+    def rows(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+    def set_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.HEADERS)
 
-    def leaveEvent(self, event: QMouseEvent) -> None:
-        if self._timer.isActive():
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row: Dict[str, Any] = self._rows[index.row()]
+        col: int = index.column()
+        if role == Qt.DisplayRole:
+            return row[self._TEXT_KEYS[col]]
+        if role == Qt.ToolTipRole:
+            # Só a patente (tooltip retardado) e status longos; nas demais o tooltip repetiria a célula
+            if col == 1:
+                return row["rank"]
+            if col == 4 and len(row["status"]) > self.STATUS_TOOLTIP_MIN_LEN:
+                return row["status"]
+            return None
+        if role == SORT_ROLE:
+            return row["sort_keys"][col]
+        if role == RANK_PIXMAP_ROLE and col == 1:
+            return row["rank_pixmap"]
+        if col == 4:
+            if role == Qt.ForegroundRole:
+                return row["status_brush"]
+            if role == Qt.FontRole:
+                return row["status_font"]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # noqa: N802
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class SquadronFilterProxyModel(QSortFilterProxyModel):
+    """Filtro rápido e ordenação em C++ sobre todas as colunas, usando as chaves de SORT_ROLE."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setFilterKeyColumn(-1)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setSortRole(SORT_ROLE)
+
+
+class _DelayedRankTooltip(QObject):
+    """Tooltip retardado da coluna de patente: um único QTimer e um event filter para a tabela inteira."""
+
+    def __init__(self, view: QTableView, column: int = 1, delay_ms: int = 2000) -> None:
+        super().__init__(view)
+        self._view = view
+        self._column = column
+        self._pending = QPersistentModelIndex()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(0, int(delay_ms)))
+        self._timer.timeout.connect(self._show)
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
+        etype = event.type()
+        if etype == QEvent.MouseMove:
+            index = self._view.indexAt(event.pos())
+            if index.isValid() and index.column() == self._column:
+                if QModelIndex(self._pending) != index:
+                    self._pending = QPersistentModelIndex(index)
+                    self._timer.start()
+            else:
+                self._cancel()
+        elif etype == QEvent.Leave:
+            self._cancel()
+        elif etype == QEvent.ToolTip:
+            # O tooltip padrão do Qt sairia antes do atraso; a coluna de patente usa o timer
+            index = self._view.indexAt(event.pos())
+            if index.isValid() and index.column() == self._column:
+                return True
+        return super().eventFilter(obj, event)
+
+    def _cancel(self) -> None:
+        if self._pending.isValid():
+            self._pending = QPersistentModelIndex()
             self._timer.stop()
-        QToolTip.hideText()
-        super().leaveEvent(event)
+            QToolTip.hideText()
 
-    def _show_tooltip(self) -> None:
-        global_pos: QPoint = self.mapToGlobal(QPoint(self.width() // 2, self.height() // 2))
-        QToolTip.showText(global_pos, self._rank_text, self)
+    def _show(self) -> None:
+        if self._pending.isValid():
+            QToolTip.showText(QCursor.pos(), str(self._pending.data(Qt.ToolTipRole) or "N/A"), self._view.viewport())
 
 
 class SquadronStatusDelegate(QStyledItemDelegate):
@@ -104,10 +262,8 @@ class SquadronStatusDelegate(QStyledItemDelegate):
                 return None
         return self._icon_cache.get(svg_name)
 
-    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
-        opt = QStyleOptionViewItem(option)
-        self.initStyleOption(opt, index)
-
+    def _apply_status_style(self, painter: QPainter, opt: QStyleOptionViewItem, index) -> str:
+        """Pinta o fundo da linha conforme o status e ajusta cor/fonte do texto; retorna o status normalizado."""
         norm = self._status_norm(index)
         color = SquadronTab.STATUS_COLORS.get(norm)
 
@@ -121,6 +277,13 @@ class SquadronStatusDelegate(QStyledItemDelegate):
             opt.palette.setColor(opt.palette.Text, color)
             if norm in self.EMPHASIS:
                 opt.font.setBold(True)
+        return norm
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+
+        norm = self._apply_status_style(painter, opt, index)
 
         if index.column() == self._status_column:
             icon = self._icon_for_status(norm)
@@ -134,6 +297,28 @@ class SquadronStatusDelegate(QStyledItemDelegate):
         QApplication.style().drawControl(QStyle.CE_ItemViewItem, opt, painter)
 
 
+class RankIconDelegate(SquadronStatusDelegate):
+    """Desenha a insígnia da patente centralizada na célula (ou "—" sem imagem)."""
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        self._apply_status_style(painter, opt, index)
+
+        pm: Optional[QPixmap] = index.data(RANK_PIXMAP_ROLE)
+        if pm is None:
+            opt.text = "—"
+            opt.palette.setColor(opt.palette.Text, QColor("#888"))
+            opt.displayAlignment = Qt.AlignCenter
+        else:
+            opt.text = ""
+        QApplication.style().drawControl(QStyle.CE_ItemViewItem, opt, painter)
+
+        if pm is not None:
+            r = opt.rect
+            painter.drawPixmap(r.x() + (r.width() - pm.width()) // 2, r.y() + (r.height() - pm.height()) // 2, pm)
+
+
 class SquadronTab(QWidget, CtrlFFocusMixin):
     stats_updated = pyqtSignal(int, int, int, int)
     """
@@ -175,6 +360,48 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         ],
     }
 
+    _EMBLEM_EXTS: Tuple[str, ...] = (".png", ".jpg", ".jpeg", ".PNG", ".JPG", ".JPEG")
+
+    # Folhas de estilo do modo alto contraste
+    _STYLE_HC_TABLE: str = (
+        "QTableView { background:#111; color:#fff; gridline-color:#777; }"
+        "QHeaderView::section { background:#222; color:#fff; font-weight:bold; }"
+    )
+    _STYLE_HC_HEADER: str = "QGroupBox { color:#fff; }"
+
+    # Fragmentos fixos do painel "Histórico e Dados"
+    _H3_HIST: str = "<h3>História</h3><p>"
+    _UL_OPEN: str = "<ul>"
+    _UL_CLOSE: str = "</ul>"
+    _FORMATION_FIELDS: Tuple[Tuple[str, str], ...] = (
+        ("date", "Data"),
+        ("location", "Local"),
+        ("firstCommander", "Primeiro comandante"),
+        ("context", "Contexto"),
+    )
+
+    # Peso por patente (índice em RANK_ORDER), consultado em O(1) na ordenação
+    _RANK_WEIGHT: Dict[str, Dict[str, int]] = {
+        country: {rank: i for i, rank in enumerate(ranks)} for country, ranks in RANK_ORDER.items()
+    }
+    _RANK_HEURISTICS: Tuple[str, ...] = (
+        "kommand", "major", "hauptmann", "captain", "lieutenant",
+        "leutnant", "adjudant", "sergent", "sergeant", "corporal"
+    )
+
+    # Insígnias decodificadas por (país, patente) e já escaladas por (país, patente, rotação, larg., alt.);
+    # None registra que não há arquivo para a patente
+    _PIXMAP_CACHE: Dict[Tuple[str, str], Optional[QPixmap]] = {}
+    _RANK_DIR_CACHE: Dict[str, Dict[str, Path]] = {}
+    # Extensões de insígnia em ordem de preferência
+    _RANK_IMAGE_EXTS: Dict[str, int] = {".png": 0, ".jpg": 1, ".jpeg": 2}
+    _SCALED_PIXMAP_CACHE: Dict[Tuple[str, str, bool, int, int], QPixmap] = {}
+
+    # Status destacados em negrito na coluna de status (todos têm cor em STATUS_COLORS)
+    _BOLD_STATUSES: FrozenSet[str] = frozenset(
+        {"kia", "morto", "mia", "desaparecido", "wounded", "ferido", "pow", "prisioneiro"}
+    )
+
     STATUS_COLORS: Dict[str, QColor] = {
         "ativo": QColor(0, 140, 0),
         "active": QColor(0, 140, 0),
@@ -197,11 +424,25 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         "rest": QColor(90, 110, 130),
     }
 
+    # Pincéis prontos para o ForegroundRole (evita um QBrush implícito por célula)
+    STATUS_BRUSHES: ClassVar[Dict[str, QBrush]] = {}
+
+    @classmethod
+    def _init_brushes(cls) -> None:
+        if not cls.STATUS_BRUSHES:
+            cls.STATUS_BRUSHES = {k: QBrush(v) for k, v in cls.STATUS_COLORS.items()}
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
+        self._init_brushes()
 
         self._country_folder: str = "germany"
         self._current_squad_name: str = ""
+        self._meta_index: Optional[Dict[str, Path]] = None
+        self._meta_index_mtime: int = 0
+        # Cada set_squad_overview incrementa a época; resultados de renders antigos são descartados
+        self._render_epoch: int = 0
+        self._emblem_cache: Dict[Tuple[str, int, int], Tuple[Optional[Path], Optional[QPixmap]]] = {}
         self._vm: SquadronViewModel = SquadronViewModel()
 
         root: QVBoxLayout = QVBoxLayout(self)
@@ -215,6 +456,7 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         self.emblem_label.setAlignment(Qt.AlignCenter)
         self.emblem_label.setFixedSize(self.EMBLEM_W, self.EMBLEM_H)
         self.emblem_label.setStyleSheet(DSStyles.PANEL_PLACEHOLDER)
+        self._emblem_state: str = "empty"
         header_h.addWidget(self.emblem_label)
 
         text_panel: QWidget = QWidget()
@@ -256,6 +498,7 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         self.filter_edit.textChanged.connect(self._apply_filter)
         controls_row.addWidget(self.filter_edit, 1)
 
+        self._is_hc: bool = False
         self.high_contrast_toggle: QCheckBox = QCheckBox(self.tr("Alto contraste"))
         self.high_contrast_toggle.toggled.connect(self._toggle_high_contrast)
         controls_row.addWidget(self.high_contrast_toggle)
@@ -276,34 +519,43 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         root.addWidget(self.state_label)
 
         # Tabela de pessoal
-        self.table: QTableWidget = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Nome", "Patente", "Abates", "Missões", "Status"])
+        self._model: SquadronTableModel = SquadronTableModel(self)
+        self._proxy: SquadronFilterProxyModel = SquadronFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._filter_text: str = ""
+        # Geração dos dados do modelo; o filtro só é recalculado se o texto ou os dados mudarem
+        self._rows_generation: int = 0
+        self._filtered_generation: int = 0
+        self.table: QTableView = QTableView()
+        self.table.setModel(self._proxy)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setColumnWidth(1, self.RANK_MAX_W + 10)
         self.table.verticalHeader().setDefaultSectionSize(self.RANK_MAX_H + 8)
+        # Ordem padrão por posto (maior→menor); o usuário pode reordenar pelo cabeçalho
+        self.table.horizontalHeader().setSortIndicator(1, Qt.AscendingOrder)
         self.table.setSortingEnabled(True)
         self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setToolTip(self.tr("Use setas para navegar entre os pilotos."))
         self._status_delegate = SquadronStatusDelegate(status_column=4, parent=self.table)
         self.table.setItemDelegate(self._status_delegate)
+        self._rank_delegate = RankIconDelegate(status_column=4, parent=self.table)
+        self.table.setItemDelegateForColumn(1, self._rank_delegate)
+        self._rank_tooltip = _DelayedRankTooltip(self.table, column=1, delay_ms=2000)
         root.addWidget(self.table)
         self.bind_ctrl_f_to_filter(self, self.filter_edit)
 
     # -------- Auxiliares de caminho --------
     @staticmethod
+    @lru_cache(maxsize=None)
     def _assets_root() -> Path:
         return Path(__file__).resolve().parents[1] / "assets"
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _squadrons_root(cls) -> Path:
         return cls._assets_root() / "squadrons"
 
-    @staticmethod
-    def _norm(s: str) -> str:
-        return (s or "").strip().lower()
-
     # -------- País p/ imagens de patentes --------
     def set_country(self, country_code: str) -> None:
         self._country_folder = (country_code or "GERMANY").strip().lower()
@@ -317,44 +569,54 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         if not base:
             return []
 
-        variants: Set[str] = {
-            base,
-            base.replace(" ", "-"),
-            base.replace(" ", "_"),
-            base.replace(" ", ""),
-        }
-
         cands: List[Path] = []
-        for v in variants:
+        for v in _name_variants(base):
             p: Path = meta_dir / f"{v}.json"
             if p.exists():
                 cands.append(p)
         if cands:
             return cands
 
+        hit: Optional[Path] = self._meta_index_get(meta_dir).get(_norm(base))
+        return [hit] if hit is not None else []
+
+    def _meta_index_get(self, meta_dir: Path) -> Dict[str, Path]:
+        """Índice nome normalizado → meta JSON, reconstruído só quando a pasta muda."""
+        try:
+            mtime_ns: int = meta_dir.stat().st_mtime_ns
+        except OSError:
+            return {}
+        if self._meta_index is not None and self._meta_index_mtime == mtime_ns:
+            return self._meta_index
+
+        index: Dict[str, Path] = {}
         max_files_to_scan: int = 100
         json_candidates: Iterator[Path] = islice(meta_dir.glob("*.json"), max_files_to_scan)
 
         for p in json_candidates:
             try:
-                with open(p, "r", encoding="utf-8") as f:
-                    data: Dict[str, Any] = json.load(f)
-                name_in: str = (
-                    data.get("squadronName")
-                    or (data.get("squadronInfo") or {}).get("name")
-                    or data.get("name")
-                    or data.get("displayName")
-                    or ""
-                )
-                if self._norm(name_in) == self._norm(base):
-                    cands.append(p)
+                data: Mapping[str, Any] = _read_meta(p)
             except (OSError, json.JSONDecodeError):
                 # Ignora arquivos que não podem ser lidos ou parseados
                 continue
-        return cands
+            aliases = (
+                data.get("squadronName"),
+                (data.get("squadronInfo") or {}).get("name"),
+                data.get("name"),
+                data.get("displayName"),
+                p.stem,
+            )
+            for alias in aliases:
+                if isinstance(alias, str) and alias.strip():
+                    index.setdefault(_norm(alias), p)
 
-    def _resolve_emblem_path(self, meta: Dict[str, Any]) -> Optional[Path]:
+        self._meta_index = index
+        self._meta_index_mtime = mtime_ns
+        return index
+
+    def _resolve_emblem_path(self, meta: Mapping[str, Any]) -> Optional[Path]:
         cand: Path
+        images_dir: Path = self._squadrons_root() / "images"
         raw: str = str(
             meta.get("emblemImage")
             or (meta.get("media") or {}).get("emblemImagePath")
@@ -375,7 +637,6 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
                 if cand.exists():
                     return cand
 
-            images_dir: Path = self._squadrons_root() / "images"
             cand = images_dir / raw
             if cand.exists():
                 return cand
@@ -388,181 +649,191 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         )
         fname_base = fname_base.strip()
         if fname_base:
-            images_dir: Path = self._squadrons_root() / "images"
-            for ext in (".png", ".jpg", ".jpeg", ".PNG", ".JPG", ".JPEG"):
-                for v in {
-                    fname_base,
-                    fname_base.replace(" ", "-"),
-                    fname_base.replace(" ", "_"),
-                    fname_base.replace(" ", ""),
-                }:
-                    cand = images_dir / f"{v}{ext}"
-                    if cand.exists():
-                        return cand
+            variants: Tuple[str, ...] = _name_variants(fname_base)
+            for name in [f"{v}{ext}" for ext in self._EMBLEM_EXTS for v in variants]:
+                cand = images_dir / name
+                if cand.exists():
+                    return cand
 
         return None
 
-    def _render_details_html(self, meta: Dict[str, Any]) -> str:
-        parts: List[str] = []
+    def _set_emblem(self, pm: Optional[QPixmap]) -> None:
+        """Troca o emblema só quando o estado muda: setStyleSheet força polish e repaint completo."""
+        state: str = f"pixmap:{pm.cacheKey()}" if pm is not None else "empty"
+        if state == self._emblem_state:
+            return
+        self._emblem_state = state
+        if pm is not None:
+            self.emblem_label.setText("")
+            self.emblem_label.setPixmap(pm)
+            self.emblem_label.setStyleSheet("")
+        else:
+            self.emblem_label.setPixmap(QPixmap())
+            self.emblem_label.setText(self.tr("Sem emblema"))
+            self.emblem_label.setStyleSheet(DSStyles.PANEL_PLACEHOLDER)
+
+    def _emblem_pixmap(self, meta: Mapping[str, Any]) -> Optional[QPixmap]:
+        """Emblema já escalado, memorizado por esquadrão: reselecionar não sonda o disco nem redecodifica."""
+        key = (self._current_squad_name, self.EMBLEM_W, self.EMBLEM_H)
+        cached = self._emblem_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        scaled: Optional[QPixmap] = None
+        emb: Optional[Path] = self._resolve_emblem_path(meta)
+        if emb and emb.exists():
+            pm: QPixmap = QPixmap(str(emb))
+            if not pm.isNull():
+                scaled = pm.scaled(self.EMBLEM_W, self.EMBLEM_H, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._emblem_cache[key] = (emb, scaled)
+        return scaled
+
+    def _render_details_html(self, meta: Mapping[str, Any]) -> str:
+        # Escape e escrita em variáveis locais: este é o laço quente de set_squad_overview
+        esc = html.escape
+
+        def E(x: Any) -> str:  # noqa: N802
+            if type(x) is str:
+                return esc(x)
+            return esc(str(x)) if x else ""
+
+        buf = io.StringIO()
+        w = buf.write
+
+        def section(title: str, items: Iterable[str]) -> None:
+            # Uma única escrita por seção: <h3> + <ul> com todos os <li> já montados
+            w(f"<h3>{title}</h3>{self._UL_OPEN}{''.join(items)}{self._UL_CLOSE}")
 
         # Cabeçalho reduzido: apenas Alias (sem ID e País)
         alias: str = meta.get("squadronAlias") or ""
         if alias:
-            parts.append(f"<p><b>Alias:</b> {_esc(alias)}</p>")
+            w(f"<p><b>Alias:</b> {E(alias)}</p>")
 
         # História
         h: Union[str, Dict[str, Any], None] = meta.get("history")
         if isinstance(h, str) and h.strip():
-            parts.append(f"<h3>História</h3><p>{_esc(h)}</p>")
+            w(f"{self._H3_HIST}{E(h)}</p>")
         elif isinstance(h, dict):
-            summary: str = _esc(h.get("summary", ""))
+            summary: str = E(h.get("summary", ""))
             if summary:
-                parts.append(f"<h3>História</h3><p>{summary}</p>")
+                w(f"{self._H3_HIST}{summary}</p>")
             formation: Dict[str, Any] = h.get("formation") or {}
             if any(formation.get(k) for k in ("date", "location", "context", "firstCommander")):
-                parts.append("<h3>Formação</h3><ul>")
-                if formation.get("date"):
-                    parts.append(f"<li><b>Data:</b> {_esc(formation.get('date'))}</li>")
-                if formation.get("location"):
-                    parts.append(f"<li><b>Local:</b> {_esc(formation.get('location'))}</li>")
-                if formation.get("firstCommander"):
-                    parts.append(f"<li><b>Primeiro comandante:</b> {_esc(formation.get('firstCommander'))}</li>")
-                if formation.get("context"):
-                    parts.append(f"<li><b>Contexto:</b> {_esc(formation.get('context'))}</li>")
-                parts.append("</ul>")
+                section("Formação", (
+                    f"<li><b>{label}:</b> {E(formation.get(k))}</li>"
+                    for k, label in self._FORMATION_FIELDS
+                    if formation.get(k)
+                ))
             if isinstance(h.get("designations"), list) and h["designations"]:
-                parts.append("<h3>Designações</h3><ul>")
-                for d in h["designations"]:
-                    nm: str = _esc((d or {}).get("name", ""))
-                    pr: str = _esc((d or {}).get("period", ""))
-                    if nm or pr:
-                        parts.append(f"<li>{nm} {('— ' + pr) if pr else ''}</li>")
-                parts.append("</ul>")
+                section("Designações", (
+                    f"<li>{nm} {('— ' + pr) if pr else ''}</li>"
+                    for nm, pr in ((E((d or {}).get("name", "")), E((d or {}).get("period", ""))) for d in h["designations"])
+                    if nm or pr
+                ))
             if isinstance(h.get("notableEvents"), list) and h["notableEvents"]:
-                parts.append("<h3>Eventos notáveis</h3><ul>")
-                for e in h["notableEvents"]:
-                    dt: str = _esc((e or {}).get("date", ""))
-                    ev: str = _esc((e or {}).get("event", "") or (e or {}).get("description", ""))
-                    if dt or ev:
-                        parts.append(f"<li>{dt} — {ev}</li>")
-                parts.append("</ul>")
+                section("Eventos notáveis", (
+                    f"<li>{dt} — {ev}</li>"
+                    for dt, ev in (
+                        (E((e or {}).get("date", "")), E((e or {}).get("event", "") or (e or {}).get("description", "")))
+                        for e in h["notableEvents"]
+                    )
+                    if dt or ev
+                ))
             if isinstance(h.get("commanders"), list) and h["commanders"]:
-                parts.append("<h3>Comandantes</h3><ul>")
-                for c in h["commanders"]:
-                    nm: str = _esc((c or {}).get("name", ""))
-                    tn: str = _esc((c or {}).get("tenure", ""))
-                    ft: str = _esc((c or {}).get("fate", ""))
-                    line: str = nm
-                    if tn:
-                        line += f" — {tn}"
-                    if ft:
-                        line += f" ({ft})"
-                    if line.strip():
-                        parts.append(f"<li>{line}</li>")
-                parts.append("</ul>")
+                section("Comandantes", (
+                    f"<li>{line}</li>"
+                    for line in (
+                        f"{E(c.get('name', ''))}"
+                        f"{' — ' + E(c.get('tenure', '')) if c.get('tenure') else ''}"
+                        f"{' (' + E(c.get('fate', '')) + ')' if c.get('fate') else ''}"
+                        for c in ((c or {}) for c in h["commanders"])
+                    )
+                    if line.strip()
+                ))
             if isinstance(h.get("notablePilots"), list) and h["notablePilots"]:
-                parts.append("<h3>Pilotos notáveis</h3><ul>")
-                for p in h["notablePilots"]:
-                    parts.append(f"<li>{_esc(p)}</li>")
-                parts.append("</ul>")
+                section("Pilotos notáveis", (f"<li>{E(p)}</li>" for p in h["notablePilots"]))
             if isinstance(h.get("aircraftUsed"), list) and h["aircraftUsed"]:
-                parts.append("<h3>Aeronaves</h3><ul>")
-                for a in h["aircraftUsed"]:
-                    parts.append(f"<li>{_esc(a)}</li>")
-                parts.append("</ul>")
+                section("Aeronaves", (f"<li>{E(a)}</li>" for a in h["aircraftUsed"]))
 
         # Equipment (estrutura Esc-15)
         eq: Dict[str, Any] = meta.get("equipment") or {}
         if isinstance(eq.get("aircraftUsed"), list) and eq["aircraftUsed"]:
-            parts.append("<h3>Aeronaves</h3><ul>")
-            for a in eq["aircraftUsed"]:
-                parts.append(f"<li>{_esc(a)}</li>")
-            parts.append("</ul>")
+            section("Aeronaves", (f"<li>{E(a)}</li>" for a in eq["aircraftUsed"]))
         mk: Dict[str, Any] = eq.get("markings") or meta.get("markings") or {}
         if mk:
-            desc: str = _esc(mk.get("description", ""))
+            desc: str = E(mk.get("description", ""))
             if desc:
-                parts.append(f"<h3>Marcações</h3><p>{desc}</p>")
-            ins: str = _esc(mk.get("insignia", ""))
-            ins_id: str = _esc(mk.get("insigniaId", ""))
+                w(f"<h3>Marcações</h3><p>{desc}</p>")
+            ins: str = E(mk.get("insignia", ""))
+            ins_id: str = E(mk.get("insigniaId", ""))
             if ins or ins_id:
-                parts.append("<ul>")
-                if ins:
-                    parts.append(f"<li><b>Insígnia:</b> {ins}</li>")
-                if ins_id:
-                    parts.append(f"<li><b>ID:</b> {ins_id}</li>")
-                parts.append("</ul>")
+                w(
+                    f"{self._UL_OPEN}"
+                    f"{f'<li><b>Insígnia:</b> {ins}</li>' if ins else ''}"
+                    f"{f'<li><b>ID:</b> {ins_id}</li>' if ins_id else ''}"
+                    f"{self._UL_CLOSE}"
+                )
 
         # Estatísticas
         st: Dict[str, Any] = meta.get("statistics") or {}
         if st:
-            parts.append("<h3>Estatísticas</h3><ul>")
+            items: List[str] = []
             if "totalVictories" in st:
-                parts.append(f"<li><b>Vitórias:</b> {_esc(st.get('totalVictories'))}</li>")
+                items.append(f"<li><b>Vitórias:</b> {E(st.get('totalVictories'))}</li>")
             if "aces" in st:
-                parts.append(f"<li><b>Ases:</b> {_esc(st.get('aces'))}</li>")
+                items.append(f"<li><b>Ases:</b> {E(st.get('aces'))}</li>")
             vb: Any = st.get("victoryBreakdown") or {}
             if vb:
-                parts.append(f"<li><b>Detalhe de vitórias:</b> {_esc(vb)}</li>")
+                items.append(f"<li><b>Detalhe de vitórias:</b> {E(vb)}</li>")
             cs: Any = st.get("casualties") or {}
             if cs:
-                parts.append(f"<li><b>Baixas:</b> {_esc(cs)}</li>")
+                items.append(f"<li><b>Baixas:</b> {E(cs)}</li>")
             if "citations" in st:
-                parts.append(f"<li><b>Citações:</b> {_esc(st.get('citations'))}</li>")
-            parts.append("</ul>")
+                items.append(f"<li><b>Citações:</b> {E(st.get('citations'))}</li>")
+            section("Estatísticas", items)
 
         # Aeródromos
-        af_list: List[Dict[str, str]] = []
+        af_list: List[Tuple[Any, Any, Any]] = []
         if isinstance(meta.get("airfields"), list) and meta["airfields"]:
             for it in meta["airfields"]:
-                af_list.append({
-                    "start": (it or {}).get("start", ""),
-                    "end": (it or {}).get("end", ""),
-                    "airfield": (it or {}).get("airfield", ""),
-                })
+                it = it or {}
+                af_list.append((it.get("start", ""), it.get("end", ""), it.get("airfield", "")))
         if isinstance(meta.get("deploymentHistory"), list) and meta["deploymentHistory"]:
             for it in meta["deploymentHistory"]:
-                af_list.append({
-                    "start": (it or {}).get("startDate", ""),
-                    "end": (it or {}).get("endDate", ""),
-                    "airfield": (it or {}).get("airfieldId", ""),
-                })
+                it = it or {}
+                af_list.append((it.get("startDate", ""), it.get("endDate", ""), it.get("airfieldId", "")))
         if af_list:
-            parts.append("<h3>Aeródromos</h3><ul>")
-            for it in af_list:
-                line: str = f"{_esc(it.get('start'))} → {_esc(it.get('end'))}: {_esc(it.get('airfield'))}"
-                parts.append(f"<li>{line}</li>")
-            parts.append("</ul>")
+            section("Aeródromos", (f"<li>{E(start)} → {E(end)}: {E(airfield)}</li>" for start, end, airfield in af_list))
 
         # Observação: seção "Fonte" removida conforme solicitado.
 
-        return "".join(parts)
+        return buf.getvalue()
 
     def set_squad_overview(self, squad_name: str) -> None:
         """Carrega emblema e dados completos do esquadrão a partir de assets/squadrons/meta."""
         self._current_squad_name = squad_name or ""
+        self._render_epoch += 1
 
         self.title_label.setText(self._current_squad_name or "N/A")
         self.details_label.setText("")
-        self.emblem_label.setPixmap(QPixmap())
-        self.emblem_label.setText(self.tr("Sem emblema"))
-        self.emblem_label.setStyleSheet(DSStyles.PANEL_PLACEHOLDER)
 
         if not self._current_squad_name:
+            self._set_emblem(None)
             self._set_view_state(DSStates.EMPTY, self.tr("Nenhum esquadrão selecionado."))
             return
 
         cands: List[Path] = self._candidate_meta_paths(self._current_squad_name)
         if not cands:
+            self._set_emblem(None)
             self._set_view_state(DSStates.EMPTY, self.tr("Metadados do esquadrão não encontrados."))
             return
 
         meta_path: Path = cands[0]
         try:
-            with open(meta_path, "r", encoding="utf-8") as f:
-                meta: Dict[str, Any] = json.load(f)
+            meta: Mapping[str, Any] = _read_meta(meta_path)
         except (OSError, json.JSONDecodeError):
             logger.warning(f"Falha ao ler ou parsear o arquivo de metadados do esquadrão: {meta_path}")
+            self._set_emblem(None)
             self._set_view_state(DSStates.ERROR, self.tr("Falha ao ler metadados do esquadrão."))
             return
 
@@ -573,58 +844,99 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         )
         self.title_label.setText(title if title else "N/A")
 
-        emb: Optional[Path] = self._resolve_emblem_path(meta)
-        if emb and emb.exists():
-            pm: QPixmap = QPixmap(str(emb))
-            if not pm.isNull():
-                scaled: QPixmap = pm.scaled(self.EMBLEM_W, self.EMBLEM_H, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.emblem_label.setStyleSheet("")
-                self.emblem_label.setText("")
-                self.emblem_label.setPixmap(scaled)
+        self._set_emblem(self._emblem_pixmap(meta))
 
-        self.details_label.setText(self._render_details_html(meta))
+        # Histórias longas geram muito HTML: monta no pool e aplica quando pronto
+        job = _RenderJob(self._render_epoch, meta, self._render_details_html)
+        job.signals.finished.connect(self._on_details_rendered)
+        QThreadPool.globalInstance().start(job)
         self._set_view_state(DSStates.SUCCESS, self.tr("Dados do esquadrão carregados."))
 
+    def _on_details_rendered(self, epoch: int, html_text: str) -> None:
+        if epoch != self._render_epoch:
+            return
+        self.details_label.setText(html_text)
+
     # -------- Ícone de patente --------
     @staticmethod
     def _ranks_base_dir() -> Path:
         return Path(__file__).resolve().parents[1] / "assets" / "ranks"
 
     def _rank_pixmap(self, rank_name: str) -> Optional[QPixmap]:
-        key: str = self._norm(rank_name).replace(" ", "_").replace("-", "_")
+        key: str = _norm_rank(rank_name)
         if not key:
             return None
-        base: Path = self._ranks_base_dir() / (self._country_folder or "germany")
-        if not base.exists():
-            return None
-        for ext in (".png", ".PNG", ".jpg", ".jpeg", ".JPG", ".JPEG"):
-            p: Path = base / f"{key}{ext}"
-            pm: QPixmap = QPixmap(str(p))
+        country: str = self._country_folder or "germany"
+        ck = (country, key)
+        if ck in self._PIXMAP_CACHE:
+            return self._PIXMAP_CACHE[ck]
+        found: Optional[QPixmap] = None
+        path: Optional[Path] = self._rank_dir(country).get(key)
+        if path is not None:
+            pm: QPixmap = QPixmap(str(path))
             if not pm.isNull():
-                return pm
-        return None
+                found = pm
+        self._PIXMAP_CACHE[ck] = found
+        return found
+
+    @classmethod
+    def _rank_dir(cls, country: str) -> Dict[str, Path]:
+        """Índice nome-base (minúsculo) → imagem da pasta de patentes do país, montado com um único scandir."""
+        index = cls._RANK_DIR_CACHE.get(country)
+        if index is not None:
+            return index
+        index = {}
+        ranks: Dict[str, int] = {}
+        try:
+            with os.scandir(cls._ranks_base_dir() / country) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    rank = cls._RANK_IMAGE_EXTS.get(ext.lower())
+                    if rank is None:
+                        continue
+                    k = stem.lower()
+                    if k not in ranks or rank < ranks[k]:
+                        ranks[k] = rank
+                        index[k] = Path(entry.path)
+        except OSError:
+            # Pasta do país ausente: índice vazio, sem novas sondagens
+            pass
+        cls._RANK_DIR_CACHE[country] = index
+        return index
+
+    def _rank_display_pixmap(self, rank_name: str, max_w: int, max_h: int) -> Optional[QPixmap]:
+        """Insígnia já rotacionada/escalada para a célula, memorizada por patente e tamanho."""
+        pm: Optional[QPixmap] = self._rank_pixmap(rank_name)
+        if pm is None:
+            return None
+        rotate: bool = self._should_rotate_horizontal(rank_name) and (pm.height() > pm.width())
+        ck = (self._country_folder or "germany", _norm_rank(rank_name), rotate, max_w, max_h)
+        scaled: Optional[QPixmap] = self._SCALED_PIXMAP_CACHE.get(ck)
+        if scaled is None:
+            if rotate:
+                pm = pm.transformed(QTransform().rotate(90), Qt.SmoothTransformation)
+            scaled = pm.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self._SCALED_PIXMAP_CACHE[ck] = scaled
+        return scaled
 
     def _should_rotate_horizontal(self, rank_name: str) -> bool:
         if self._country_folder not in ("germany", "ger", "de", "deu"):
             return False
-        key: str = self._norm(rank_name)
+        key: str = _norm(rank_name)
         return key in {"kommandeur", "kommander", "oberleutnant", "leutnant"}
 
     # -------- Ordenação por posto --------
     def _rank_weight(self, rank_name: str) -> int:
-        table: List[str] = self.RANK_ORDER.get(self._country_folder, [])
-        key: str = self._norm(rank_name).replace(" ", "_").replace("-", "_")
-        try:
-            return table.index(key)
-        except ValueError:
-            heuristics: List[str] = [
-                "kommand", "major", "hauptmann", "captain", "lieutenant",
-                "leutnant", "adjudant", "sergent", "sergeant", "corporal"
-            ]
-            for i, h in enumerate(heuristics):
-                if h in key:
-                    return len(table) + i
-            return len(table) + len(heuristics) + 100
+        weights: Dict[str, int] = self._RANK_WEIGHT.get(self._country_folder, {})
+        key: str = _norm_rank(rank_name)
+        w: Optional[int] = weights.get(key)
+        if w is not None:
+            return w
+        heuristics = self._RANK_HEURISTICS
+        for i, h in enumerate(heuristics):
+            if h in key:
+                return len(weights) + i
+        return len(weights) + len(heuristics) + 100
 
     def _set_view_state(self, state: str, message: str) -> None:
         self.state_label.setText(message)
@@ -638,39 +950,27 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
             self.state_label.setStyleSheet(DSStyles.STATE_INFO)
 
     def _apply_filter(self, text: str) -> None:
-        rows: List[Dict[str, str]] = []
-        for row in range(self.table.rowCount()):
-            rank_widget = self.table.cellWidget(row, 1)
-            rows.append(
-                {
-                    "name": (self.table.item(row, 0).text() if self.table.item(row, 0) else ""),
-                    "rank": str(getattr(rank_widget, "rank_name", "") if rank_widget else ""),
-                    "victories": (self.table.item(row, 2).text() if self.table.item(row, 2) else ""),
-                    "missions": (self.table.item(row, 3).text() if self.table.item(row, 3) else ""),
-                    "status": (self.table.item(row, 4).text() if self.table.item(row, 4) else ""),
-                }
-            )
-
-        visibility = self._vm.filter_visibility(rows, text)
-        for row, is_visible in enumerate(visibility):
-            self.table.setRowHidden(row, not is_visible)
+        needle: str = (text or "").strip()
+        # Mesmo filtro sobre os mesmos dados (ex.: só espaços digitados): nada muda
+        if needle == self._filter_text and self._filtered_generation == self._rows_generation:
+            return
+        self._filter_text = needle
+        self._filtered_generation = self._rows_generation
+        self._proxy.setFilterFixedString(needle)
 
-        visible_rows = sum(1 for v in visibility if v)
+        visible_rows = self._proxy.rowCount()
         filter_state = self._vm.state_for_visible_count(visible_rows)
         self._set_view_state(filter_state.state, self.tr(filter_state.message))
 
-        total_rows = self.table.rowCount()
+        rows: List[Dict[str, Any]] = self._model.rows()
         total_victories = 0
         total_missions = 0
-        for row in range(total_rows):
-            if self.table.isRowHidden(row):
-                continue
-            victories_item = self.table.item(row, 2)
-            missions_item = self.table.item(row, 3)
-            total_victories += int(victories_item.text()) if victories_item and victories_item.text().isdigit() else 0
-            total_missions += int(missions_item.text()) if missions_item and missions_item.text().isdigit() else 0
+        for r in range(visible_rows):
+            row = rows[self._proxy.mapToSource(self._proxy.index(r, 0)).row()]
+            total_victories += int(row["victories"]) if row["victories"].isdigit() else 0
+            total_missions += int(row["missions"]) if row["missions"].isdigit() else 0
 
-        self.stats_updated.emit(total_rows, visible_rows, total_victories, total_missions)
+        self.stats_updated.emit(len(rows), visible_rows, total_victories, total_missions)
 
     def _on_stats_updated(self, total: int, visible: int, victories: int, missions: int) -> None:
         self._stats_bar.update_stat(self.tr("Total"), str(total))
@@ -679,79 +979,71 @@ class SquadronTab(QWidget, CtrlFFocusMixin):
         self._stats_bar.update_stat(self.tr("Missões"), str(missions))
 
     def _toggle_high_contrast(self, enabled: bool) -> None:
-        if enabled:
-            self.table.setStyleSheet(
-                "QTableWidget { background:#111; color:#fff; gridline-color:#777; }"
-                "QHeaderView::section { background:#222; color:#fff; font-weight:bold; }"
-            )
-            self.header_group.setStyleSheet("QGroupBox { color:#fff; }")
-        else:
-            self.table.setStyleSheet("")
-            self.header_group.setStyleSheet("")
+        enabled = bool(enabled)
+        # Reaplicar a mesma folha de estilo força um novo parse e polish da tabela inteira
+        if enabled == self._is_hc:
+            return
+        self._is_hc = enabled
+        self.table.setStyleSheet(self._STYLE_HC_TABLE if enabled else "")
+        self.header_group.setStyleSheet(self._STYLE_HC_HEADER if enabled else "")
 
     # -------- Preenchimento da tabela --------
     def set_squadron(self, members: List[Dict[str, Any]]) -> None:
         members = members or []
         member_state = self._vm.state_for_members(members)
         if member_state.state == DSStates.EMPTY:
-            self.table.setRowCount(0)
+            self._model.set_rows([])
+            self._rows_generation += 1
             self._set_view_state(member_state.state, self.tr(member_state.message))
             self.stats_updated.emit(0, 0, 0, 0)
             return
-        sorted_members: List[Dict[str, Any]] = sorted(
-            members,
-            key=lambda m: (self._rank_weight(m.get("rank", "")), (m.get("name", "") or "").lower())
-        )
-
-        self.table.setRowCount(len(sorted_members))
-
-        for r, m in enumerate(sorted_members):
-            name_item = QTableWidgetItem(m.get('name', ''))
-            name_item.setToolTip(name_item.text())
-            self.table.setItem(r, 0, name_item)
-
-            rank_name: str = m.get('rank', '') or ''
-            lbl: RankIconLabel = RankIconLabel(rank_name, delay_ms=2000, parent=self.table)
-            lbl.setAlignment(Qt.AlignCenter)
-
-            pm: Optional[QPixmap] = self._rank_pixmap(rank_name)
-            if pm is not None:
-                rotate: bool = self._should_rotate_horizontal(rank_name) and (pm.height() > pm.width())
-                if rotate:
-                    pm = pm.transformed(QTransform().rotate(90), Qt.SmoothTransformation)
-
-                col_w: int = max(80, self.table.columnWidth(1) - 10)
-                max_w: int = min(self.RANK_MAX_W, col_w)
-                max_h: int = self.RANK_MAX_H
-                scaled: QPixmap = pm.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Sem pré-ordenação em Python: o proxy ordena por posto via SORT_ROLE
+        sorted_members: List[Dict[str, Any]] = members
+
+        col_w: int = max(80, self.table.columnWidth(1) - 10)
+        max_w: int = min(self.RANK_MAX_W, col_w)
+        max_h: int = self.RANK_MAX_H
+        # Um único reset do modelo em vez de itens e widgets célula a célula
+        bold_font: QFont = QFont(self.table.font())
+        bold_font.setBold(True)
+        self._model.set_rows([self._member_row(m, max_w, max_h, bold_font) for m in sorted_members])
+        self._rows_generation += 1
+
+        if self._filter_text:
+            # O proxy mantém o filtro ativo sobre os dados novos: estado e totais vêm dele
+            self._apply_filter(self._filter_text)
+            return
 
-                lbl.setPixmap(scaled)
-                self.table.setRowHeight(r, max(self.table.rowHeight(r), scaled.height() + 6))
-            else:
-                lbl.setText("—")
-                lbl.setStyleSheet("color:#888;")
-
-            self.table.setCellWidget(r, 1, lbl)
-            victories_item = QTableWidgetItem(str(m.get('victories', 0)))
-            victories_item.setToolTip(victories_item.text())
-            self.table.setItem(r, 2, victories_item)
-            missions_item = QTableWidgetItem(str(m.get('missions_flown', 0)))
-            missions_item.setToolTip(missions_item.text())
-            self.table.setItem(r, 3, missions_item)
-
-            status_text: str = m.get('status', '') or ''
-            status_item: QTableWidgetItem = QTableWidgetItem(status_text)
-            status_item.setToolTip(status_text)
-            norm: str = (status_text or '').strip().lower()
-            color: Optional[QColor] = self.STATUS_COLORS.get(norm)
-            if color:
-                status_item.setForeground(color)
-                f: QFont = status_item.font()
-                if norm in ('kia', 'morto', 'mia', 'desaparecido', 'wounded', 'ferido', 'pow', 'prisioneiro'):
-                    f.setBold(True)
-                status_item.setFont(f)
-            self.table.setItem(r, 4, status_item)
         self._set_view_state(DSStates.SUCCESS, self.tr(member_state.message))
         total_victories = sum(int(m.get("victories", 0) or 0) for m in sorted_members)
         total_missions = sum(int(m.get("missions_flown", 0) or 0) for m in sorted_members)
         self.stats_updated.emit(len(sorted_members), len(sorted_members), total_victories, total_missions)
+
+    def _member_row(self, m: Dict[str, Any], max_w: int, max_h: int, bold_font: QFont) -> Dict[str, Any]:
+        rank_name: str = m.get('rank', '') or ''
+        status_text: str = m.get('status', '') or ''
+        norm: str = status_text.strip().lower()
+        brush: Optional[QBrush] = self.STATUS_BRUSHES.get(norm)
+        font: Optional[QFont] = bold_font if norm in self._BOLD_STATUSES else None
+        name: str = str(m.get('name', '') or '')
+        victories: str = str(m.get('victories', 0))
+        missions: str = str(m.get('missions_flown', 0))
+        name_key: str = name.lower()
+        return {
+            "name": name,
+            "rank": rank_name,
+            "rank_pixmap": self._rank_display_pixmap(rank_name, max_w, max_h),
+            "victories": victories,
+            "missions": missions,
+            "status": status_text,
+            "status_brush": brush,
+            "status_font": font,
+            # Posto com nome como desempate numa única string; números comparados como int
+            "sort_keys": (
+                name_key,
+                f"{self._rank_weight(rank_name):04d}|{name_key}",
+                int(victories) if victories.isdigit() else -1,
+                int(missions) if missions.isdigit() else -1,
+                norm,
+            ),
+        }
@@ -3,21 +3,26 @@ from __future__ import annotations
 from typing import Optional
 
 from PyQt5.QtCore import QPoint, QSize, Qt, QTimer
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmap, QPixmapCache
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 
 class MedalHoverPopup(QWidget):
     ZOOM_SIZE = QSize(320, 360)
     DELAY_MS = 600
+    # Orçamento global do QPixmapCache em KB (o padrão do Qt é 10 MB)
+    PIXMAP_CACHE_KB = 32 * 1024
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.ToolTip)
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_KB)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
 
         self._image_label = QLabel()
         self._image_label.setAlignment(Qt.AlignCenter)
@@ -33,19 +38,68 @@ class MedalHoverPopup(QWidget):
         layout.addWidget(self._image_label)
         layout.addWidget(self._name_label)
 
+        # Tamanho fixo calculado uma vez: o hover não passa mais pelo adjustSize()
+        # (+2 na imagem para a borda de 1px não recortar a medalha)
+        self._image_label.setFixedSize(self.ZOOM_SIZE + QSize(2, 2))
+        self._name_label.ensurePolished()
+        name_h = self._name_label.fontMetrics().height()
+        self._name_label.setFixedHeight(name_h)
+        margins = layout.contentsMargins()
+        self.setFixedSize(
+            self._image_label.width() + margins.left() + margins.right(),
+            self._image_label.height() + layout.spacing() + name_h + margins.top() + margins.bottom(),
+        )
+
         self._timer = QTimer(self)
         self._timer.setSingleShot(True)
         self._timer.timeout.connect(self.show)
 
-    def schedule(self, pixmap: QPixmap, name: str, pos: QPoint) -> None:
+        # Troca a prévia rápida pela versão suavizada pouco antes do popup aparecer
+        self._pending_src: Optional[QPixmap] = None
+        self._upgrade_timer = QTimer(self)
+        self._upgrade_timer.setSingleShot(True)
+        self._upgrade_timer.timeout.connect(self._upgrade_smooth)
+
+    def _cache_key(self, pixmap: QPixmap) -> str:
+        size = self.ZOOM_SIZE
+        return f"medal:{pixmap.cacheKey()}:{size.width()}x{size.height()}"
+
+    def _zoomed(self, pixmap: QPixmap) -> QPixmap:
+        """Versão ampliada da medalha, cacheada pelo ``cacheKey`` da origem e pelo tamanho alvo."""
+        key = self._cache_key(pixmap)
+        hit = QPixmapCache.find(key)
+        if hit is not None and not hit.isNull():
+            return hit
         scaled = pixmap.scaled(self.ZOOM_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self._image_label.setPixmap(scaled)
-        self._name_label.setText(name)
-        self.adjustSize()
+        QPixmapCache.insert(key, scaled)
+        return scaled
+
+    def _upgrade_smooth(self) -> None:
+        src, self._pending_src = self._pending_src, None
+        if src is not None:
+            self._image_label.setPixmap(self._zoomed(src))
+
+    def schedule(self, pixmap: QPixmap, name: str, pos: QPoint) -> None:
+        hit = QPixmapCache.find(self._cache_key(pixmap))
+        if hit is not None and not hit.isNull():
+            self._upgrade_timer.stop()
+            self._pending_src = None
+            self._image_label.setPixmap(hit)
+        elif self._pending_src is None or self._pending_src.cacheKey() != pixmap.cacheKey():
+            # Miss: prévia com FastTransformation agora, escala suave fora do caminho do hover
+            self._image_label.setPixmap(
+                pixmap.scaled(self.ZOOM_SIZE, Qt.KeepAspectRatio, Qt.FastTransformation)
+            )
+            self._pending_src = pixmap
+            self._upgrade_timer.start(max(0, self.DELAY_MS - 50))
+        fm = self._name_label.fontMetrics()
+        self._name_label.setText(fm.elidedText(name, Qt.ElideRight, self.ZOOM_SIZE.width()))
         self.move(pos + QPoint(16, 16))
         self._timer.start(self.DELAY_MS)
 
     def cancel(self) -> None:
         self._timer.stop()
+        self._upgrade_timer.stop()
+        self._pending_src = None
         self.hide()
 
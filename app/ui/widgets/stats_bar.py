@@ -1,32 +1,39 @@
 from __future__ import annotations
 
+import html
 from typing import Dict, List, Optional, Tuple
 
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QWidget
 
 
-class StatCard(QWidget):
-    def __init__(self, label: str, value: str, parent: Optional[QWidget] = None) -> None:
-        super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 6, 12, 6)
-        layout.setSpacing(6)
+class StatCard(QLabel):
+    """Cartão rótulo/valor desenhado por um único QLabel em rich text (sem layout interno)."""
 
-        lbl = QLabel(f"{label}:")
-        lbl.setStyleSheet("color:#888; font-size:12px;")
+    # Folhas de estilo como constantes de classe, montadas uma única vez para todos os cartões
+    _CARD_QSS = (
+        "background:#2a2a2a; border:1px solid #3a3a3a;"
+        "border-radius:4px; padding:6px 12px;"
+    )
+    _TEMPLATE = (
+        '<span style="color:#888; font-size:12px;">{lbl}:</span>&nbsp;'
+        '<span style="color:#d8d8d8; font-size:13px; font-weight:bold;">{val}</span>'
+    )
 
-        self._val = QLabel(value)
-        self._val.setStyleSheet("color:#d8d8d8; font-size:13px; font-weight:bold;")
-
-        layout.addWidget(lbl)
-        layout.addWidget(self._val)
-        self.setStyleSheet(
-            "background:#2a2a2a; border:1px solid #3a3a3a;"
-            "border-radius:4px;"
-        )
+    def __init__(self, label: str, value: str, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._lbl = html.escape(label)
+        self._value = value
+        self.setTextFormat(Qt.RichText)
+        self.setStyleSheet(self._CARD_QSS)
+        self.setText(self._TEMPLATE.format(lbl=self._lbl, val=html.escape(value)))
 
     def update_value(self, value: str) -> None:
-        self._val.setText(value)
+        # setText sempre invalida o layout e repinta, mesmo com o texto igual
+        if value == self._value:
+            return
+        self._value = value
+        self.setText(self._TEMPLATE.format(lbl=self._lbl, val=html.escape(value)))
 
 
 class StatsBar(QWidget):
@@ -4,21 +4,28 @@
 
 import sys
 import logging
-import logging.handlers
-import tempfile
+import os
 import random
+import shutil
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from PyQt5.QtCore import Qt, QLockFile
-from PyQt5.QtWidgets import QApplication, QMessageBox, QSplashScreen
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import Qt, QLockFile, QSize, QTimer
+from PyQt5.QtWidgets import QApplication, QMessageBox, QSplashScreen, QWidget
+from PyQt5.QtGui import QIcon, QImage, QImageReader, QPixmap
 
 from app.ui.main_window import MainWindow
 from utils.observability import publish_release_report, record_startup_time
-from utils.structured_logger import StructuredLogger
+from utils.structured_logger import JsonFormatter, StructuredLogger
+
+# Data do arquivo de log fixada na inicialização: âncora única para a rotação diária
+_LOG_DATE_STR: str = datetime.now().strftime("%Y%m%d")
+
+# Raiz da aplicação resolvida uma única vez (resolve() faz stat em cada componente)
+_APP_ROOT: Path = Path(__file__).resolve().parent
 
 
 def _setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -28,7 +35,8 @@ def _setup_logging(level: int = logging.INFO) -> logging.Logger:
         return logger
 
     logger.setLevel(level)
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+    # Registros do StructuredLogger viram JSON aqui, no handler; os demais seguem em texto
+    formatter = JsonFormatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 
     sh = logging.StreamHandler(sys.stdout)
     sh.setLevel(level)
@@ -36,12 +44,16 @@ def _setup_logging(level: int = logging.INFO) -> logging.Logger:
     logger.addHandler(sh)
 
     try:
+        # Importado aqui: só é necessário quando o log em arquivo é configurado.
+        # Alias obrigatório: "import logging.handlers" tornaria "logging" local à função
+        from logging import handlers as _log_handlers
+
         base_dir = Path(__file__).parent if '__file__' in globals() else Path.cwd()
         logs_dir = base_dir / "logs"
         logs_dir.mkdir(parents=True, exist_ok=True)
-        log_filename = logs_dir / f"wingmate_{datetime.now():%Y%m%d}.log"
+        log_filename = logs_dir / f"wingmate_{_LOG_DATE_STR}.log"
 
-        fh = logging.handlers.RotatingFileHandler(
+        fh = _log_handlers.RotatingFileHandler(
             filename=str(log_filename),
             maxBytes=5 * 1024 * 1024,
             backupCount=7,
@@ -49,7 +61,17 @@ def _setup_logging(level: int = logging.INFO) -> logging.Logger:
         )
         fh.setLevel(logging.DEBUG)
         fh.setFormatter(formatter)
-        logger.addHandler(fh)
+
+        # Agrupa as escritas em disco; ERROR ou acima esvazia o buffer na hora.
+        # logging.shutdown (atexit) fecha o MemoryHandler antes do fh, sem perder linhas
+        mh = _log_handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=fh,
+            flushOnClose=True,
+        )
+        mh.setLevel(logging.DEBUG)
+        logger.addHandler(mh)
     except (PermissionError, OSError) as e:
         logger.warning(f"Não foi possível inicializar arquivo de log: {e}")
     except Exception as e:
@@ -63,34 +85,118 @@ logger: logging.Logger = _setup_logging(logging.INFO)
 structured_logger = StructuredLogger("IL2CampaignAnalyzer")
 
 
-def _pick_splash_image() -> Optional[Path]:
-    splash_dir = Path(__file__).resolve().parent / "app" / "assets" / "splash_optimized"
-    if not splash_dir.exists():
-        return None
+_SPLASH_UNTIL_PROP = "wingmate_visible_until"
 
-    images = [
-        p for p in splash_dir.iterdir()
-        if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".jpeg", ".bmp", ".webp"}
-    ]
+
+_SPLASH_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+_SPLASH_INDEX: Optional[List[str]] = None
+
+
+def _pick_splash_image() -> Optional[Path]:
+    global _SPLASH_INDEX
+    splash_dir = _APP_ROOT / "app" / "assets" / "splash_optimized"
+    if _SPLASH_INDEX is None:
+        # scandir traz o tipo da entrada junto com o nome: sem stat por arquivo
+        try:
+            with os.scandir(splash_dir) as it:
+                _SPLASH_INDEX = [
+                    e.name for e in it
+                    if e.is_file() and e.name.lower().endswith(_SPLASH_EXTS)
+                ]
+        except OSError:
+            return None
+
+    images = _SPLASH_INDEX
     if not images:
         return None
-    return random.choice(images)
+    return splash_dir / random.choice(images)
+
+
+def _read_splash(path: Path, screen_size: Optional[QSize]) -> QImage:
+    """Decodifica a splash já no tamanho que cabe na tela, sem manter a imagem inteira em memória.
+
+    O QImageReader reduz durante a leitura (no JPEG, direto no DCT) em vez de decodificar
+    tudo e escalar depois.
+    """
+    reader = QImageReader(str(path))
+    if screen_size is not None and screen_size.isValid():
+        src_size = reader.size()
+        if src_size.isValid() and (
+            src_size.width() > screen_size.width() or src_size.height() > screen_size.height()
+        ):
+            reader.setScaledSize(src_size.scaled(screen_size, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def _ensure_cached_splash(path: Path, screen_size: QSize) -> Path:
+    """Retorna uma cópia da splash já reduzida para caber na tela, gerada uma única vez.
+
+    A cópia fica em ``splash_optimized/<w>x<h>/`` e é refeita quando o original muda.
+    Imagens que já cabem na tela são usadas direto, sem cópia.
+    """
+    w, h = screen_size.width(), screen_size.height()
+    if w <= 0 or h <= 0:
+        return path
+
+    cache_path = path.parent / f"{w}x{h}" / path.name
+    try:
+        if cache_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return cache_path
+    except OSError:
+        pass
+
+    # Só o cabeçalho é lido aqui; a decodificação completa fica para quando precisar reduzir
+    src_size = QImageReader(str(path)).size()
+    if not src_size.isValid() or (src_size.width() <= w and src_size.height() <= h):
+        return path
+
+    scaled = _read_splash(path, screen_size)
+    if scaled.isNull():
+        return path
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if scaled.save(str(cache_path), quality=90):
+            return cache_path
+        logger.debug("Não foi possível gravar splash reduzida: %s", cache_path)
+    except OSError:
+        # Diretório somente leitura (ex.: bundle congelado): usa o original
+        pass
+    return path
+
+
+# Efeitos sonoros por caminho; None registra que QtMultimedia não está disponível
+_SFX_CACHE: Dict[str, Any] = {}
+
+
+def _startup_sfx(sound_file: Path) -> Any:
+    """Retorna um ``QSoundEffect`` reaproveitável para ``sound_file`` (importado sob demanda)."""
+    key = str(sound_file)
+    if key not in _SFX_CACHE:
+        sfx = None
+        try:
+            from PyQt5.QtCore import QUrl
+            from PyQt5.QtMultimedia import QSoundEffect
+
+            sfx = QSoundEffect()
+            sfx.setSource(QUrl.fromLocalFile(key))
+            sfx.setVolume(0.8)
+        except Exception as e:
+            logger.debug("QtMultimedia não disponível para áudio de splash: %s", e)
+        _SFX_CACHE[key] = sfx
+    return _SFX_CACHE[key]
 
 
 def _play_startup_sound() -> None:
-    sound_file = Path(__file__).resolve().parent / "app" / "assets" / "sounds" / "airplane_engine_start.wav"
+    sound_file = _APP_ROOT / "app" / "assets" / "sounds" / "airplane_engine_start.wav"
     if not sound_file.exists():
         logger.warning("Som de abertura não encontrado: %s", sound_file)
         return
 
-    try:
-        qt_multimedia = __import__("PyQt5.QtMultimedia", fromlist=["QSound"])
-        qsound = getattr(qt_multimedia, "QSound", None)
-        if qsound is not None:
-            qsound.play(str(sound_file))
-            return
-    except Exception as e:
-        logger.debug("QtMultimedia não disponível para áudio de splash: %s", e)
+    # O QSoundEffect mantém o WAV decodificado e enfileira o play() até terminar de carregar
+    sfx = _startup_sfx(sound_file)
+    if sfx is not None:
+        sfx.play()
+        return
 
     logger.warning("Não foi possível reproduzir áudio de splash (QtMultimedia indisponível).")
 
@@ -102,7 +208,13 @@ def _show_startup_splash(app: QApplication, duration_s: float = 4.0) -> Optional
         _play_startup_sound()
         return None
 
-    pixmap = QPixmap(str(splash_image))
+    screen = app.primaryScreen()
+    screen_size = screen.size() if screen is not None else None
+    if screen_size is not None:
+        splash_image = _ensure_cached_splash(splash_image, screen_size)
+
+    # Se a cópia reduzida não pôde ser gravada, a redução acontece aqui, na decodificação
+    pixmap = QPixmap.fromImage(_read_splash(splash_image, screen_size))
     if pixmap.isNull():
         logger.warning("Falha ao carregar splash: %s", splash_image)
         _play_startup_sound()
@@ -116,16 +228,53 @@ def _show_startup_splash(app: QApplication, duration_s: float = 4.0) -> Optional
     logger.info("Splash de abertura: %s", splash_image.name)
     _play_startup_sound()
 
-    end_time = time.monotonic() + max(0.0, duration_s)
-    while time.monotonic() < end_time:
-        app.processEvents()
-        time.sleep(0.01)
-
+    # Não bloqueia: o tempo mínimo de exibição corre em paralelo com a construção da
+    # MainWindow e é cumprido em _finish_splash
+    splash.setProperty(_SPLASH_UNTIL_PROP, time.monotonic() + max(0.0, duration_s))
     return splash
 
 
+def _finish_splash(splash: Optional[QSplashScreen], win: QWidget, on_shown: Callable[[], None]) -> None:
+    """Mostra ``win`` e fecha a splash assim que o tempo mínimo dela tiver passado."""
+    def _show() -> None:
+        if splash is not None:
+            splash.finish(win)
+        win.show()
+        on_shown()
+
+    visible_until = splash.property(_SPLASH_UNTIL_PROP) if splash is not None else None
+    remaining_ms = int((visible_until - time.monotonic()) * 1000) if visible_until else 0
+    if remaining_ms > 0:
+        QTimer.singleShot(remaining_ms, _show)
+    else:
+        _show()
+
+
+def _publish_observability_report() -> None:
+    try:
+        reports_dir = _APP_ROOT / "logs" / "observability"
+        release_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
+        baseline = reports_dir / "baseline.json"
+        report_path = publish_release_report(
+            structured_logger,
+            release_tag=release_tag,
+            output_dir=reports_dir,
+            baseline_path=baseline if baseline.exists() else None,
+        )
+        baseline.parent.mkdir(parents=True, exist_ok=True)
+        # Cópia byte a byte via temporário + os.replace: sem decodificar/recodificar e sem
+        # deixar um baseline pela metade se o processo cair no meio
+        tmp = baseline.with_suffix(".tmp")
+        shutil.copyfile(report_path, tmp)
+        os.replace(tmp, baseline)
+    except Exception as e:
+        logger.debug("Falha ao publicar relatório de observabilidade: %s", e)
+
+
 if __name__ == '__main__':
     app_start_t0 = time.perf_counter()
+    import tempfile
+
     try:
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -141,7 +290,7 @@ if __name__ == '__main__':
 
     # Ícone global da aplicação (alguns ambientes exibem ícone do app no dock/taskbar)
     try:
-        app_icon_path: Path = Path(__file__).resolve().parent / "app" / "assets" / "icons" / "app_icon.png"
+        app_icon_path: Path = _APP_ROOT / "app" / "assets" / "icons" / "app_icon.png"
         pm: QPixmap = QPixmap(str(app_icon_path))
         if not pm.isNull():
             app.setWindowIcon(QIcon(pm))
@@ -160,7 +309,11 @@ if __name__ == '__main__':
         lockfile_path: str = str(Path(tempfile.gettempdir()) / "wingmate.lock")
         lock = QLockFile(lockfile_path)
         lock.setStaleLockTime(0)
-        if not lock.tryLock(100):
+        # tryLock(0) não espera: o Qt já descarta sozinho locks cujo processo dono morreu
+        if not lock.tryLock(0):
+            ok, pid, _host, _app_name = lock.getLockInfo()
+            if ok:
+                logger.info("Lock de instância em uso pelo processo %s", pid)
             QMessageBox.warning(None, "Instância em execução", "Outra instância já está em execução.")
             sys.exit(0)
     except (PermissionError, OSError) as e:
@@ -172,10 +325,11 @@ if __name__ == '__main__':
 
     try:
         win: MainWindow = MainWindow()
-        if splash is not None:
-            splash.finish(win)
-        win.show()
-        record_startup_time(structured_logger, (time.perf_counter() - app_start_t0) * 1000.0)
+        _finish_splash(
+            splash,
+            win,
+            lambda: record_startup_time(structured_logger, (time.perf_counter() - app_start_t0) * 1000.0),
+        )
         exit_code: int = app.exec_()
     except ImportError as e:
         logger.exception(f"Falha ao importar módulos da interface: {e}")
@@ -190,21 +344,13 @@ if __name__ == '__main__':
         QMessageBox.critical(None, "Erro", "Falha ao iniciar a interface gráfica.")
         exit_code = 1
     finally:
-        try:
-            reports_dir = Path(__file__).resolve().parent / "logs" / "observability"
-            release_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
-            baseline = reports_dir / "baseline.json"
-            report_path = publish_release_report(
-                structured_logger,
-                release_tag=release_tag,
-                output_dir=reports_dir,
-                baseline_path=baseline if baseline.exists() else None,
-            )
-            baseline.parent.mkdir(parents=True, exist_ok=True)
-            baseline.write_text(report_path.read_text(encoding="utf-8"), encoding="utf-8")
-        except Exception as e:
-            logger.debug("Falha ao publicar relatório de observabilidade: %s", e)
+        # Publica em paralelo com a liberação do lock e o teardown do Qt. O join espera
+        # o relatório terminar (como a publicação síncrona de antes): a thread não é
+        # daemon, então um timeout aqui não limitaria o encerramento
+        publisher = threading.Thread(target=_publish_observability_report, name="observability-report")
+        publisher.start()
 
         if lock and lock.isLocked():
             lock.unlock()
+        publisher.join()
         sys.exit(exit_code)
\ No newline at end of file
@@ -5,7 +5,7 @@
 # ===================================================================
 
 from pydantic import BaseModel, Field, field_validator, ValidationError
-from typing import List, Optional
+from typing import ClassVar, FrozenSet, List, Optional, Tuple
 
 class MedalCondition(BaseModel):
     """Representa uma condição para conquista de medalha.
@@ -40,6 +40,10 @@ class Medal(BaseModel):
         default_factory=list, 
         description="Lista de condições para conquista"
     )
+
+    # ClassVar: sem a anotação o Pydantic trataria os nomes com "_" como atributos privados
+    _COUNTRY_ORDER: ClassVar[Tuple[str, ...]] = ('germany', 'france', 'britain', 'usa', 'belgian')
+    _VALID_COUNTRIES: ClassVar[FrozenSet[str]] = frozenset(_COUNTRY_ORDER)
     
     @field_validator('country')
     @classmethod
@@ -55,12 +59,11 @@ class Medal(BaseModel):
         Raises:
             ValueError: Se país não for válido
         """
-        valid_countries = ['germany', 'france', 'britain', 'usa', 'belgian']
         normalized = v.lower().strip()
         
-        if normalized not in valid_countries:
+        if normalized not in cls._VALID_COUNTRIES:
             raise ValueError(
-                f"País inválido: '{v}'. Países válidos: {', '.join(valid_countries)}"
+                f"País inválido: '{v}'. Países válidos: {', '.join(cls._COUNTRY_ORDER)}"
             )
         
         return normalized
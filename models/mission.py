@@ -1,5 +1,6 @@
 # models/mission.py
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional
 from datetime import datetime
 
@@ -16,11 +17,14 @@ class Mission:
     description: str = ''
     ha_report: str = ''
     
-    @property
+    @cached_property
     def parsed_date(self) -> Optional[datetime]:
-        for fmt in ('%d/%m/%Y', '%Y-%m-%d'):
-            try:
-                return datetime.strptime(self.date, fmt)
-            except ValueError:
-                continue
-        return None
+        # Calculado uma vez por instância (ordenações consultam a data O(n log n) vezes);
+        # quem alterar ``date`` depois deve descartar o valor com ``del mission.parsed_date``
+        # %Y exige 4 dígitos: só o formato ISO tem '-' na posição 4, então um único strptime basta
+        d = self.date
+        fmt = '%Y-%m-%d' if len(d) > 4 and d[4] == '-' else '%d/%m/%Y'
+        try:
+            return datetime.strptime(d, fmt)
+        except ValueError:
+            return None
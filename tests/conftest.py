@@ -0,0 +1,48 @@
+import functools
+import os
+import sys
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+try:
+    import ahocorasick  # opcional (pyahocorasick): todos os literais numa única varredura
+except ModuleNotFoundError:
+    ahocorasick = None
+
+# Raiz do repositório no path uma única vez por sessão, antes da coleta dos módulos de teste
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_source(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def read_source():
+    """Lê um arquivo-fonte do repositório uma única vez por sessão (testes de contrato)."""
+    return _read_source
+
+
+def _missing_literals(text: str, needles: Sequence[str]) -> List[str]:
+    if ahocorasick is None:
+        return [needle for needle in needles if needle not in text]
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    hits = {needle for _end, needle in automaton.iter(text)}
+    return [needle for needle in needles if needle not in hits]
+
+
+@pytest.fixture(scope="session")
+def assert_all_present():
+    """Verifica vários literais num fonte e reporta todos os ausentes de uma vez."""
+
+    def _check(text: str, needles: Sequence[str]) -> None:
+        missing = _missing_literals(text, needles)
+        assert not missing, "Trechos ausentes: " + "; ".join(missing)
+
+    return _check
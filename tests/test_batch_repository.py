@@ -1,9 +1,6 @@
 import json
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.core.batch_repository import JsonBatchRepository
 from app.core.data_parser import IL2DataParser
 
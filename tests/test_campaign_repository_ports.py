@@ -1,9 +1,6 @@
-import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.application.campaign_query_service import CampaignQueryService
 from app.core.repositories import Campaign, CampaignRepositoryPort, JsonCampaignRepository
 from app.core.data_parser import IL2DataParser
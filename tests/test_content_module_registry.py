@@ -1,7 +1,6 @@
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import pytest
 
 from app.application.content_module_registry import ContentModuleRegistry
 
@@ -46,3 +45,23 @@ def test_registry_resolve_raises_for_missing_module(tmp_path: Path):
         assert False, "Era esperado KeyError"
     except KeyError:
         assert True
+
+
+def test_registry_loads_manifest_from_symlinked_module_dir(tmp_path: Path):
+    pack = tmp_path / "packs" / "ww1-pack"
+    pack.mkdir(parents=True)
+    (pack / "module.json").write_text(
+        '{"id":"linked_pack","name":"Linked","category":"medals","path":"content"}',
+        encoding="utf-8",
+    )
+    modules_root = tmp_path / "assets" / "modules"
+    modules_root.mkdir(parents=True)
+    try:
+        (modules_root / "ww1-pack").symlink_to(pack, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks indisponíveis nesta plataforma")
+
+    registry = ContentModuleRegistry(tmp_path / "assets")
+
+    assert registry.load_external_modules() == 1
+    assert registry.get_module("linked_pack") is not None
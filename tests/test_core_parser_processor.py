@@ -1,8 +1,5 @@
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.core.data_parser import IL2DataParser
 from app.core.data_processor import IL2DataProcessor
 
@@ -36,12 +33,10 @@ def test_parser_get_campaign_aces_supports_multiple_formats(tmp_path: Path):
 
     # formato dict com chave aces
     aces_path.write_text('{"aces":[{"name":"Ace 2"}]}', encoding="utf-8")
-    parser.clear_cache()
     assert parser.get_campaign_aces("camp1") == [{"name": "Ace 2"}]
 
     # formato dict com chave acesInCampaign
     aces_path.write_text('{"acesInCampaign":{"1":{"name":"Ace 3"}}}', encoding="utf-8")
-    parser.clear_cache()
     assert parser.get_campaign_aces("camp1") == [{"name": "Ace 3"}]
 
 
@@ -63,18 +58,35 @@ def test_parser_clear_cache_refreshes_changed_file(tmp_path: Path):
     assert parser.get_campaign_info("camp1") == {"name": "v1"}
 
     campaign_file.write_text('{"name":"v2"}', encoding="utf-8")
-    assert parser.get_campaign_info("camp1") == {"name": "v1"}
-
     parser.clear_cache()
     assert parser.get_campaign_info("camp1") == {"name": "v2"}
 
 
+def test_parser_cache_rereads_rewritten_file_without_clear_cache(tmp_path: Path):
+    base = tmp_path / "pwcg"
+    campaign_dir = _build_campaign_tree(base)
+    campaign_file = campaign_dir / "Campaign.json"
+
+    parser = IL2DataParser(base)
+
+    campaign_file.write_text('{"name":"v1"}', encoding="utf-8")
+    assert parser.get_campaign_info("camp1") == {"name": "v1"}
+    assert parser.get_campaign_info("camp1") == {"name": "v1"}
+
+    # Tamanho diferente: a mudança é detectada mesmo com mtime na mesma granularidade
+    campaign_file.write_text('{"name":"v2-updated"}', encoding="utf-8")
+    assert parser.get_campaign_info("camp1") == {"name": "v2-updated"}
+    assert parser.get_cache_metrics() == {"hits": 1, "misses": 2, "entries": 1}
+
+
 def test_processor_format_date_and_status_mapping():
     processor = IL2DataProcessor(None)
 
     assert processor.format_date("19180101") == "01/01/1918"
     assert processor.format_date("invalid") == "invalid"
+    assert processor.format_date("19180101\n") == "19180101\n"
     assert processor.get_pilot_status(2) == "Morto em Combate (KIA)"
+    assert processor.get_pilot_status(2.0) == "Morto em Combate (KIA)"
     assert processor.get_pilot_status(999) == "Desconhecido"
 
 
@@ -239,8 +251,8 @@ def test_parser_find_mission_file_matches_regex_rejects_non_yyyy_mm_dd_dates(tmp
     assert matches == []
 
 
-def test_parser_get_json_many_uses_resolved_path_for_fallback():
-    src = Path("app/core/data_parser.py").read_text(encoding="utf-8")
+def test_parser_get_json_many_uses_resolved_path_for_fallback(read_source):
+    src = read_source("app/core/data_parser.py")
     assert "resolved_path: Path = file_path" in src
     assert "self._load_json_file(resolved_path)" in src
 
@@ -294,6 +306,35 @@ def test_resolve_aircraft_badge_prioritizes_ace_by_confirmed_victories():
     assert processor._resolve_aircraft_badge(7, 5) == "Ás do Modelo"
 
 
-def test_process_pilot_data_does_not_use_setdefault_fallback_block():
-    src = Path("app/core/data_processor.py").read_text(encoding="utf-8")
+def test_process_pilot_data_does_not_use_setdefault_fallback_block(read_source):
+    src = read_source("app/core/data_processor.py")
     assert "pilot.setdefault" not in src
+
+
+def test_parser_falls_back_to_latin1_for_legacy_files(tmp_path: Path):
+    base = tmp_path / "pwcg"
+    campaign_dir = _build_campaign_tree(base)
+    (campaign_dir / "Campaign.json").write_bytes('{"name":"Escadrille Cigognes é"}'.encode("latin-1"))
+
+    parser = IL2DataParser(base)
+
+    assert parser.get_campaign_info("camp1") == {"name": "Escadrille Cigognes é"}
+
+
+def test_parser_get_json_many_reads_batches_in_input_order(tmp_path: Path):
+    files = []
+    for idx in range(6):
+        path = tmp_path / f"{idx}.json"
+        path.write_text(f'{{"id": {idx}}}', encoding="utf-8")
+        files.append(path)
+    missing = tmp_path / "missing.json"
+
+    parser = IL2DataParser(tmp_path)
+    loaded = parser.get_json_many(list(reversed(files)) + [missing])
+
+    assert list(loaded) == list(reversed(files)) + [missing]
+    assert [loaded[p]["id"] for p in reversed(files)] == [5, 4, 3, 2, 1, 0]
+    assert loaded[missing] is None
+
+    parser.get_json_many(files)
+    assert parser.get_cache_metrics() == {"hits": 6, "misses": 7, "entries": 7}
@@ -1,12 +1,6 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-
-def test_tabs_use_ctrl_f_mixin_instead_of_keypress_override():
-    missions = Path("app/ui/missions_tab.py").read_text(encoding="utf-8")
-    squadron = Path("app/ui/squadron_tab.py").read_text(encoding="utf-8")
+def test_tabs_use_ctrl_f_mixin_instead_of_keypress_override(read_source):
+    missions = read_source("app/ui/missions_tab.py")
+    squadron = read_source("app/ui/squadron_tab.py")
 
     assert "CtrlFFocusMixin" in missions
     assert "bind_ctrl_f_to_filter" in missions
@@ -17,7 +11,7 @@ def test_tabs_use_ctrl_f_mixin_instead_of_keypress_override():
     assert "def keyPressEvent" not in squadron
 
 
-def test_shortcut_mixin_uses_qshortcut_widget_with_children_context():
-    src = Path("app/ui/shortcut_mixin.py").read_text(encoding="utf-8")
+def test_shortcut_mixin_uses_qshortcut_widget_with_children_context(read_source):
+    src = read_source("app/ui/shortcut_mixin.py")
     assert "QShortcut" in src
     assert "Qt.WidgetWithChildrenShortcut" in src
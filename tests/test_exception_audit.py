@@ -1,9 +1,14 @@
 import ast
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import Iterator, List
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# Diretórios sem código do projeto: podados antes de o walk descer neles
+_SKIP_DIRS = frozenset({".git", "__pycache__", ".venv", "venv", "node_modules", ".pytest_cache"})
 
 
 def _iter_json_exception_attrs(exc_node: ast.AST):
@@ -17,23 +22,57 @@ def _iter_json_exception_attrs(exc_node: ast.AST):
             yield exc_node.attr
 
 
-def test_no_nonexistent_json_exceptions_are_caught():
+class _JsonExceptVisitor(ast.NodeVisitor):
+    """Visita só o necessário: despacha ``except`` e não desce em folhas da árvore."""
+
+    def __init__(self, label: Path) -> None:
+        self.label = label
+        self.offenders: List[str] = []
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:  # noqa: N802
+        if node.type is not None:
+            for attr in _iter_json_exception_attrs(node.type):
+                if not hasattr(json, attr):
+                    self.offenders.append(f"{self.label}:{node.lineno}: json.{attr}")
+        # Há try/except aninhados dentro do corpo do handler
+        for child in node.body:
+            self.visit(child)
+
+    def _skip(self, node: ast.AST) -> None:
+        return None
+
+    visit_Name = visit_Constant = visit_Attribute = visit_alias = visit_arg = _skip  # noqa: N815
+    visit_Import = visit_ImportFrom = _skip  # noqa: N815
+
+
+def _scan_file(file_path: Path) -> List[str]:
+    """Ofensores de um arquivo; função de módulo para poder rodar em outro processo."""
     root = Path(__file__).resolve().parents[1]
-    offenders = []
+    source = file_path.read_text(encoding="utf-8")
+    tree = ast.parse(source, type_comments=False, feature_version=sys.version_info[:2])
 
-    for file_path in root.rglob("*.py"):
-        if ".git" in file_path.parts:
-            continue
+    visitor = _JsonExceptVisitor(file_path.relative_to(root))
+    visitor.visit(tree)
+    return visitor.offenders
 
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source)
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ExceptHandler) or node.type is None:
-                continue
+def _iter_py_files(root: Path) -> Iterator[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield Path(dirpath) / name
 
-            for attr in _iter_json_exception_attrs(node.type):
-                if not hasattr(json, attr):
-                    offenders.append(f"{file_path.relative_to(root)}:{node.lineno}: json.{attr}")
+
+def test_no_nonexistent_json_exceptions_are_caught():
+    root = Path(__file__).resolve().parents[1]
+    files = list(_iter_py_files(root))
+
+    # Parse de AST é CPU-bound: processos só compensam com mais de um núcleo
+    if (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as ex:
+            offenders = list(chain.from_iterable(ex.map(_scan_file, files, chunksize=16)))
+    else:
+        offenders = list(chain.from_iterable(map(_scan_file, files)))
 
     assert not offenders, "Exceções json inexistentes capturadas: " + ", ".join(offenders)
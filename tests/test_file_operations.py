@@ -1,10 +1,12 @@
+import itertools
 import json
-import sys
+import os
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import pytest
 
 import utils.file_operations as file_operations
+from utils import json_fast
 
 
 def test_atomic_json_write_replaces_target_file(tmp_path: Path):
@@ -15,7 +17,7 @@ def test_atomic_json_write_replaces_target_file(tmp_path: Path):
         json.dump({"new": True}, f)
 
     assert json.loads(target.read_text(encoding="utf-8")) == {"new": True}
-    assert not list(tmp_path.glob('.tmp_*.json'))
+    assert not [n for n in os.listdir(tmp_path) if n.startswith('.tmp_') and n.endswith('.json')]
 
 
 def test_atomic_json_write_calls_fsync(tmp_path: Path, monkeypatch):
@@ -27,8 +29,92 @@ def test_atomic_json_write_calls_fsync(tmp_path: Path, monkeypatch):
 
     monkeypatch.setattr(file_operations.os, "fsync", fake_fsync)
 
-    with file_operations.atomic_json_write(target) as f:
+    with file_operations.atomic_json_write(target, durable=True) as f:
         json.dump({"durable": True}, f)
 
     assert called
     assert json.loads(target.read_text(encoding="utf-8")) == {"durable": True}
+
+
+def test_atomic_json_write_skips_fsync_by_default(tmp_path: Path, monkeypatch):
+    called = []
+    monkeypatch.setattr(file_operations.os, "fsync", lambda fd: called.append(fd))
+
+    for idx in range(3):
+        with file_operations.atomic_json_write(tmp_path / f"{idx}.json") as f:
+            json.dump({"idx": idx}, f)
+    assert called == []
+
+    file_operations.fsync_dir(tmp_path)
+    assert len(called) == 1
+    assert json.loads((tmp_path / "2.json").read_text(encoding="utf-8")) == {"idx": 2}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_atomic_json_dump_matches_stdlib_output(tmp_path: Path, monkeypatch, use_orjson: bool):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_fast, "orjson", None)
+    target = tmp_path / "medals.json"
+    data = [{"nome": "Légion d'honneur", "ano": 1918, "taxa": 0.5, "ativo": True, "extra": None}]
+
+    file_operations.atomic_json_dump(target, data)
+
+    assert target.read_text(encoding="utf-8") == json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+    assert [n for n in os.listdir(tmp_path) if n.startswith('.tmp_')] == []
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_safe_read_json_returns_default_for_missing_or_invalid(tmp_path: Path, monkeypatch, use_orjson: bool):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_fast, "orjson", None)
+    good = tmp_path / "good.json"
+    good.write_text('{"nome": "Pour le Mérite"}', encoding="utf-8")
+    broken = tmp_path / "broken.json"
+    broken.write_bytes(b'{"nome": "\xe9"}')
+
+    assert file_operations.safe_read_json(good) == {"nome": "Pour le Mérite"}
+    assert file_operations.safe_read_json(broken, default={}) == {}
+    assert file_operations.safe_read_json(tmp_path / "missing.json") is None
+
+
+def test_atomic_write_closes_descriptor_once(tmp_path: Path, monkeypatch):
+    closed = []
+    real_close = file_operations.os.close
+    monkeypatch.setattr(file_operations.os, "close", lambda fd: (closed.append(fd), real_close(fd)))
+
+    with file_operations.atomic_write(tmp_path / "notes.txt") as f:
+        f.write("ok")
+
+    assert closed == []
+    assert (tmp_path / "notes.txt").read_text(encoding="utf-8") == "ok"
+    with pytest.raises(ValueError):
+        with file_operations.atomic_write(tmp_path / "bad.txt", mode="x+q"):
+            pass
+    assert len(closed) == 1
+    assert [n for n in os.listdir(tmp_path) if n.startswith('.tmp_')] == []
+
+
+def test_atomic_write_read_write_mode_can_read_back(tmp_path: Path):
+    with file_operations.atomic_write(tmp_path / "notes.txt", mode="w+") as f:
+        f.write("ida e volta")
+        f.seek(0)
+        assert f.read() == "ida e volta"
+
+    assert (tmp_path / "notes.txt").read_text(encoding="utf-8") == "ida e volta"
+
+
+def test_atomic_json_write_skips_leftover_temp_names(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(file_operations, "_TMP_COUNTER", itertools.count())
+    leftover = tmp_path / f".tmp_{os.getpid()}_0.json"
+    leftover.write_text("stale", encoding="utf-8")
+
+    with file_operations.atomic_json_write(tmp_path / "data.json") as f:
+        json.dump({"ok": True}, f)
+
+    assert json.loads((tmp_path / "data.json").read_text(encoding="utf-8")) == {"ok": True}
+    assert leftover.read_text(encoding="utf-8") == "stale"
+    assert sorted(os.listdir(tmp_path)) == sorted(["data.json", leftover.name])
@@ -1,8 +1,4 @@
-import sys
 from datetime import date, timedelta
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from utils.flight_streak import compute_flight_streak
 
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from utils import json_fast
+
+_SAMPLE = {"nome": "Pour le Mérite", "valores": [1, 2.5, None, True], "aninhado": {"a": "b"}}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_fast, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_stdlib_formats(backend):
+    assert json_fast.dumps(_SAMPLE) == json.dumps(_SAMPLE, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert json_fast.dumps(_SAMPLE, indent=True, newline=True) == (
+        json.dumps(_SAMPLE, ensure_ascii=False, indent=2) + "\n"
+    ).encode("utf-8")
+
+
+def test_loads_round_trips_and_raises_json_decode_error(backend):
+    assert json_fast.loads(json_fast.dumps(_SAMPLE)) == _SAMPLE
+
+    with pytest.raises(json.JSONDecodeError):
+        json_fast.loads(b"{invalido")
+
+
+def test_dumps_rejects_unserializable_objects(backend):
+    with pytest.raises(TypeError):
+        json_fast.dumps({"x": object()})
@@ -0,0 +1,21 @@
+import logging
+import symtable
+
+import pytest
+
+
+def test_setup_logging_does_not_shadow_logging_module(read_source):
+    src = read_source("main_app.py")
+    module = symtable.symtable(src, "main_app.py", "exec")
+    setup = next(child for child in module.get_children() if child.get_name() == "_setup_logging")
+
+    assert not setup.lookup("logging").is_local()
+
+
+def test_setup_logging_returns_configured_logger():
+    pytest.importorskip("PyQt5.QtWidgets")
+    import main_app
+
+    logger = logging.getLogger("IL2CampaignAnalyzer")
+    assert main_app._setup_logging() is logger
+    assert logger.handlers
@@ -1,12 +1,7 @@
-import sys
-from pathlib import Path
-
 import pytest
 
 pytest.importorskip("pytestqt")
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.ui.medals_tab import MedalsTab
 from app.ui.squadron_tab import SquadronTab
 
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from models.mission import Mission
+
+
+def _mission(date: str) -> Mission:
+    return Mission(date=date, time="12:00", aircraft="SPAD", duty="Patrol", locality="Verdun")
+
+
+def test_parsed_date_accepts_dmy_and_iso():
+    assert _mission("05/03/1918").parsed_date == datetime(1918, 3, 5)
+    assert _mission("5/3/1918").parsed_date == datetime(1918, 3, 5)
+    assert _mission("1918-03-05").parsed_date == datetime(1918, 3, 5)
+
+
+def test_parsed_date_returns_none_for_unknown_formats():
+    assert _mission("").parsed_date is None
+    assert _mission("1918/03/05").parsed_date is None
+    assert _mission("05-03-1918").parsed_date is None
+
+
+def test_parsed_date_is_computed_once_per_instance():
+    mission = _mission("05/03/1918")
+
+    assert mission.parsed_date is mission.parsed_date
+    assert mission == _mission("05/03/1918")
@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.application.mission_validation_service import Mission, MissionValidationService
 
 
@@ -41,3 +36,11 @@ def test_validation_service_skips_non_dict_items():
 
     assert len(missions) == 1
     assert missions[0].description == "ok"
+
+
+def test_validation_service_coerces_non_string_fields():
+    service = MissionValidationService()
+
+    missions = service.validate([{"date": None, "time": 0, "aircraft": 7, "duty": False}])
+
+    assert missions == [Mission(date="", time="", aircraft="7", duty="")]
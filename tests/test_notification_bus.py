@@ -1,9 +1,8 @@
+import subprocess
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-from utils.notification_bus import NotificationLevel, notification_bus
+from utils.notification_bus import NotificationBus, NotificationLevel, notification_bus
 
 
 def test_notification_bus_emits_events_to_subscribers():
@@ -17,3 +16,17 @@ def test_notification_bus_emits_events_to_subscribers():
 
     assert events
     assert events[-1] == ("info", "ok", 1234)
+
+
+def test_notification_bus_instance_is_module_singleton():
+    assert NotificationBus.instance() is notification_bus
+
+
+def test_notification_bus_module_defers_qt_import():
+    code = (
+        "import sys; import utils.notification_bus as nb; "
+        "assert 'PyQt5.QtCore' not in sys.modules; "
+        "nb.notify_info('ok'); assert nb.NotificationBus.instance() is nb.notification_bus"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
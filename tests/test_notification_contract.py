@@ -1,20 +1,17 @@
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-
-def test_no_non_critical_information_dialogs_left():
+def test_no_non_critical_information_dialogs_left(read_source):
     offenders = []
     for path in Path("app/ui").glob("*.py"):
-        src = path.read_text(encoding="utf-8")
+        src = read_source(str(path))
         if "QMessageBox.information(" in src:
             offenders.append(str(path))
 
     assert not offenders, f"QMessageBox.information encontrado em: {offenders}"
 
 
-def test_notification_bus_exposes_instance_and_send_api():
-    src = Path("utils/notification_bus.py").read_text(encoding="utf-8")
+def test_notification_bus_exposes_instance_and_send_api(read_source):
+    src = read_source("utils/notification_bus.py")
     assert "def instance(" in src
     assert "def send(" in src
@@ -1,9 +1,6 @@
 import json
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from utils.observability import (
     CRITICAL_ACTION_SLO_MS,
     Events,
@@ -96,3 +93,19 @@ def test_publish_release_report_compares_with_baseline_and_budget(tmp_path: Path
     assert "baseline_delta" in report
     assert "startup_time_ms" in report["baseline_delta"]
     assert "ux_budget" in report
+
+
+def test_metrics_snapshot_is_refreshed_after_new_records():
+    logger = _FakeStructuredLogger()
+    record_cache_stats(1, 1)
+    first = metrics_snapshot()
+    first["cache_hit_rate"] = -1.0
+
+    assert metrics_snapshot()["cache_hit_rate"] == 0.5
+
+    record_cache_stats(3, 1)
+    record_action_duration(logger, "sync_campaign", 10.0, success=False)
+    snapshot = metrics_snapshot()
+
+    assert snapshot["cache_hit_rate"] == 0.75
+    assert snapshot["actions_failed"] >= 1.0
@@ -1,9 +1,6 @@
 import json
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.application.personnel_resolution_service import PersonnelResolutionService
 from app.core.data_parser import IL2DataParser
 
@@ -4,25 +4,38 @@
 # Testes unitários para a aba de perfil do piloto
 # ===================================================================
 
-import sys
-from pathlib import Path
 from datetime import datetime
-
-# Adiciona diretório raiz ao path para imports
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from typing import TYPE_CHECKING, Type
 
 import pytest
-from pytestqt.qtbot import QtBot
 from PyQt5.QtCore import QDate
 
-from app.ui.profile_tab import ProfileTab
+if TYPE_CHECKING:
+    from pytestqt.qtbot import QtBot
+    from app.ui.profile_tab import ProfileTab
+
+# Só a aba é importada sob demanda (fixture abaixo): é ela que puxa QtWidgets e
+# o restante da UI; QtCore sozinho é barato
+
+
+@pytest.fixture(scope="module")
+def profile_tab_cls() -> Type["ProfileTab"]:
+    """Classe ProfileTab, importada uma vez no primeiro teste que a usa."""
+    from app.ui.profile_tab import ProfileTab
 
+    return ProfileTab
 
-def test_age_calculation(qtbot: QtBot):
+
+@pytest.fixture
+def tab(qtbot: "QtBot", profile_tab_cls: Type["ProfileTab"]) -> "ProfileTab":
+    """Cria a aba de perfil registrada no qtbot."""
+    widget = profile_tab_cls()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_age_calculation(tab: "ProfileTab"):
     """Testa cálculo de idade com data de referência."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Define data de nascimento: 15/05/1890
     tab.dob_edit.setDate(QDate(1890, 5, 15))
     
@@ -33,11 +46,8 @@ def test_age_calculation(qtbot: QtBot):
     assert tab.age_label.text() == '28', f"Esperado '28', obtido '{tab.age_label.text()}'"
 
 
-def test_validation_future_date(qtbot: QtBot):
+def test_validation_future_date(tab: "ProfileTab"):
     """Testa validação de data futura."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Define data futura
     tab.dob_edit.setDate(QDate(2030, 1, 1))
     
@@ -48,11 +58,8 @@ def test_validation_future_date(qtbot: QtBot):
     assert 'futura' in msg.lower(), f"Mensagem deveria mencionar 'futura': {msg}"
 
 
-def test_birthplace_length_validation(qtbot: QtBot):
+def test_birthplace_length_validation(tab: "ProfileTab"):
     """Testa validação de comprimento do local de nascimento."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Define data válida
     tab.dob_edit.setDate(QDate(1890, 1, 1))
     
@@ -66,11 +73,8 @@ def test_birthplace_length_validation(qtbot: QtBot):
     assert 'caracteres' in msg.lower(), f"Mensagem deveria mencionar 'caracteres': {msg}"
 
 
-def test_bio_length_validation(qtbot: QtBot):
+def test_bio_length_validation(tab: "ProfileTab"):
     """Testa validação de comprimento da biografia."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Define data válida
     tab.dob_edit.setDate(QDate(1890, 1, 1))
     
@@ -84,11 +88,8 @@ def test_bio_length_validation(qtbot: QtBot):
     assert 'biografia' in msg.lower(), f"Mensagem deveria mencionar 'biografia': {msg}"
 
 
-def test_valid_profile(qtbot: QtBot):
+def test_valid_profile(tab: "ProfileTab"):
     """Testa validação de perfil válido."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Define dados válidos
     tab.dob_edit.setDate(QDate(1890, 5, 15))
     tab.birthplace_edit.setText("Berlin, Germany")
@@ -100,11 +101,8 @@ def test_valid_profile(qtbot: QtBot):
     assert msg == "", f"Mensagem de erro deveria estar vazia para perfil válido: {msg}"
 
 
-def test_age_negative_when_ref_before_birth(qtbot: QtBot):
+def test_age_negative_when_ref_before_birth(tab: "ProfileTab"):
     """Testa que idade é negativa quando referência é antes do nascimento."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Nascimento em 1890
     tab.dob_edit.setDate(QDate(1890, 5, 15))
     
@@ -115,11 +113,8 @@ def test_age_negative_when_ref_before_birth(qtbot: QtBot):
     assert tab.age_label.text() == 'N/A', f"Idade deveria ser N/A, obtido '{tab.age_label.text()}'"
 
 
-def test_context_setting(qtbot: QtBot):
+def test_context_setting(tab: "ProfileTab"):
     """Testa definição de contexto campanha/piloto."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Define contexto
     tab.set_context("Campaign 1", "Hans Schmidt")
     
@@ -128,33 +123,30 @@ def test_context_setting(qtbot: QtBot):
     assert tab._prefix() == expected_prefix, f"Prefixo incorreto: {tab._prefix()}"
 
 
-def test_save_button_disabled_initially(qtbot: QtBot):
+def test_save_button_disabled_initially(tab: "ProfileTab"):
     """Testa que botão salvar está desabilitado inicialmente."""
-    tab = ProfileTab()
-    qtbot.addWidget(tab)
-    
     # Botão deve estar desabilitado inicialmente
     assert not tab.btn_save.isEnabled(), "Botão salvar deveria estar desabilitado inicialmente"
 
 
-def test_compute_age_static_method():
+def test_compute_age_static_method(profile_tab_cls: Type["ProfileTab"]):
     """Testa método estático de cálculo de idade."""
     dob = datetime(1890, 5, 15)
     ref = datetime(1918, 10, 1)
     
-    age = ProfileTab._compute_age(dob, ref)
+    age = profile_tab_cls._compute_age(dob, ref)
     
     assert age == 28, f"Idade calculada incorreta: {age}"
     
     # Testa aniversário ainda não ocorrido no ano
     ref_before_birthday = datetime(1918, 4, 1)
-    age_before = ProfileTab._compute_age(dob, ref_before_birthday)
+    age_before = profile_tab_cls._compute_age(dob, ref_before_birthday)
     
     assert age_before == 27, f"Idade antes do aniversário incorreta: {age_before}"
     
     # Testa referência antes do nascimento
     ref_invalid = datetime(1880, 1, 1)
-    age_invalid = ProfileTab._compute_age(dob, ref_invalid)
+    age_invalid = profile_tab_cls._compute_age(dob, ref_invalid)
     
     assert age_invalid == -1, f"Idade para referência inválida deveria ser -1: {age_invalid}"
 
@@ -1,11 +1,5 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-
-def test_risk_matrix_document_covers_10_prioritized_flows_and_smoke_gate():
-    doc = Path("docs/test_risk_matrix.md").read_text(encoding="utf-8")
+def test_risk_matrix_document_covers_10_prioritized_flows_and_smoke_gate(read_source):
+    doc = read_source("docs/test_risk_matrix.md")
 
     assert "## Top 10 fluxos priorizados para release" in doc
     for i in range(1, 11):
@@ -16,9 +10,9 @@ def test_risk_matrix_document_covers_10_prioritized_flows_and_smoke_gate():
     assert "pytest -q" in doc
 
 
-def test_quarantine_policy_has_sla_and_manifest():
-    matrix = Path("docs/test_risk_matrix.md").read_text(encoding="utf-8")
-    manifest = Path("tests/quarantine_manifest.md").read_text(encoding="utf-8")
+def test_quarantine_policy_has_sla_and_manifest(read_source):
+    matrix = read_source("docs/test_risk_matrix.md")
+    manifest = read_source("tests/quarantine_manifest.md")
 
     assert "Política de falha rápida" in matrix
     assert "SLA de correção" in matrix
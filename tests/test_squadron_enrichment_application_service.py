@@ -1,15 +1,14 @@
-import sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.application.squadron_enrichment_application_service import (
     SquadronEnrichmentApplicationService,
 )
 
 
 class _FakeDomain:
+    __slots__ = ("saved",)
+
     def __init__(self) -> None:
         self.saved: Tuple[Path, Dict[str, Any]] | None = None
 
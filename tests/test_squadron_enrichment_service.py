@@ -1,15 +1,17 @@
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 import pytest
 
 from app.core.squadron_enrichment_service import SquadronEnrichmentService
 
 
-def test_extract_fields_with_airfields_dict():
-    service = SquadronEnrichmentService()
+@pytest.fixture(scope="module")
+def service() -> SquadronEnrichmentService:
+    # O serviço não guarda estado entre chamadas: uma instância serve o módulo inteiro
+    return SquadronEnrichmentService()
+
+
+def test_extract_fields_with_airfields_dict(service):
     data = {
         "squadronName": "Jasta 11",
         "country": "GERMANY",
@@ -29,8 +31,7 @@ def test_extract_fields_with_airfields_dict():
     ]
 
 
-def test_build_payload_uses_source_and_history(tmp_path: Path):
-    service = SquadronEnrichmentService()
+def test_build_payload_uses_source_and_history(service, tmp_path: Path):
     src = tmp_path / "42.json"
     src.write_text('{"name":"Esc 42", "nation":"FRANCE", "airfields": []}', encoding="utf-8")
 
@@ -50,8 +51,7 @@ def test_build_payload_uses_source_and_history(tmp_path: Path):
     assert payload["source"]["pwcg_squadron_file"] == str(src)
 
 
-def test_read_json_invalid_raises_value_error(tmp_path: Path):
-    service = SquadronEnrichmentService()
+def test_read_json_invalid_raises_value_error(service, tmp_path: Path):
     broken = tmp_path / "broken.json"
     broken.write_text("{invalid}", encoding="utf-8")
 
@@ -59,8 +59,7 @@ def test_read_json_invalid_raises_value_error(tmp_path: Path):
         service.read_json(broken)
 
 
-def test_read_json_schema_invalid_raises_value_error(tmp_path: Path):
-    service = SquadronEnrichmentService()
+def test_read_json_schema_invalid_raises_value_error(service, tmp_path: Path):
     invalid_schema = tmp_path / "invalid_schema.json"
     invalid_schema.write_text('{"name":123, "airfields":"oops"}', encoding="utf-8")
 
@@ -68,8 +67,7 @@ def test_read_json_schema_invalid_raises_value_error(tmp_path: Path):
         service.read_json(invalid_schema)
 
 
-def test_save_enriched_payload_rejects_invalid_schema(tmp_path: Path):
-    service = SquadronEnrichmentService()
+def test_save_enriched_payload_rejects_invalid_schema(service, tmp_path: Path):
     out = tmp_path / "out.json"
 
     with pytest.raises(ValueError):
@@ -85,3 +83,10 @@ def test_save_enriched_payload_rejects_invalid_schema(tmp_path: Path):
                 "source": {"pwcg_squadron_file": "x"},
             },
         )
+
+
+def test_read_json_falls_back_to_latin1(service, tmp_path: Path):
+    src = tmp_path / "latin1.json"
+    src.write_bytes('{"name":"Escadrille Cigognes é"}'.encode("latin-1"))
+
+    assert service.read_json(src) == {"name": "Escadrille Cigognes é"}
@@ -1,11 +1,8 @@
-import sys
-from pathlib import Path
+import os
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-
-def test_squadron_tab_uses_status_delegate_for_row_styling_and_icons():
-    src = Path("app/ui/squadron_tab.py").read_text(encoding="utf-8")
+def test_squadron_tab_uses_status_delegate_for_row_styling_and_icons(read_source):
+    src = read_source("app/ui/squadron_tab.py")
     assert "class SquadronStatusDelegate(QStyledItemDelegate)" in src
     assert "self.table.setItemDelegate(self._status_delegate)" in src
     assert "STATUS_ICON" in src
@@ -21,6 +18,10 @@ def test_status_svg_icons_exist():
         "status_hospital.svg",
         "status_leave.svg",
     ]
-    base = Path("app/assets/icons")
-    missing = [name for name in icons if not (base / name).exists()]
+    try:
+        with os.scandir("app/assets/icons") as it:
+            present = {entry.name for entry in it}
+    except FileNotFoundError:
+        present = set()
+    missing = [name for name in icons if name not in present]
     assert not missing, f"Ícones SVG ausentes: {missing}"
@@ -0,0 +1,75 @@
+import json
+import logging
+
+from utils.structured_logger import JsonFormatter, StructuredLogger
+
+
+def test_structured_logger_passes_context_on_record(caplog):
+    logger = StructuredLogger("wingmate.test.structured")
+
+    with caplog.at_level(logging.INFO, logger="wingmate.test.structured"):
+        logger.info("Campanha carregada", campaign_name="Camp1", missions=3)
+
+    record = caplog.records[-1]
+    assert record.getMessage() == "Campanha carregada"
+    assert record.context == {"campaign_name": "Camp1", "missions": 3}
+
+
+def test_json_formatter_serializes_structured_records():
+    record = logging.LogRecord("wingmate", logging.WARNING, __file__, 1, "Falha", None, None)
+    record.context = {"campaign_name": "Camp1"}
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "WARNING"
+    assert entry["message"] == "Falha"
+    assert entry["context"] == {"campaign_name": "Camp1"}
+    assert "T" in entry["timestamp"]
+
+
+def test_json_formatter_keeps_plain_records_as_text():
+    record = logging.LogRecord("wingmate", logging.INFO, __file__, 1, "Texto %s", ("livre",), None)
+
+    formatted = JsonFormatter("%(levelname)s - %(message)s").format(record)
+
+    assert formatted == "INFO - Texto livre"
+
+
+def test_structured_logger_skips_filtered_levels(caplog):
+    logger = StructuredLogger("wingmate.test.structured")
+
+    with caplog.at_level(logging.WARNING, logger="wingmate.test.structured"):
+        logger.debug("detalhe", key="value")
+        logger.info("rotina")
+
+    assert caplog.records == []
+
+
+def test_structured_logger_skips_records_without_handlers(monkeypatch):
+    logger = StructuredLogger("wingmate.test.structured.headless")
+    logger.logger.setLevel(logging.DEBUG)
+    monkeypatch.setattr(logger.logger, "hasHandlers", lambda: False)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("registro sem handler não deveria ser criado")
+
+    monkeypatch.setattr(logger.logger, "_log", _fail)
+
+    logger.info("rotina", key="value")
+
+
+def test_structured_logger_accepts_uppercase_and_unknown_levels(caplog):
+    logger = StructuredLogger("wingmate.test.structured")
+
+    with caplog.at_level(logging.DEBUG, logger="wingmate.test.structured"):
+        logger.log("ERROR", "maiúsculo")
+        logger.log("verbose", "desconhecido")
+        logger.log("fatal", "fatal")
+        logger.log("warn", "aviso")
+
+    assert [record.levelno for record in caplog.records] == [
+        logging.ERROR,
+        logging.INFO,
+        logging.CRITICAL,
+        logging.WARNING,
+    ]
@@ -1,12 +1,7 @@
-import sys
-from pathlib import Path
-
 import pytest
 
 pytest.importorskip("pytestqt")
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.ui.main_window import DataSyncThread
 from app.ui.profile_tab import ProfileTab
 from utils.notification_bus import NotificationLevel, notification_bus
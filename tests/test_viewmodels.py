@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from app.application.mission_validation_service import Mission
 from app.application.viewmodels import MissionsViewModel, SquadronViewModel
 
@@ -30,6 +25,13 @@ def test_missions_viewmodel_states_and_filter():
     )
     assert vis2 == [False]
 
+    rows = (cols for cols in [["01/01/1918", "12:00", "Spad", "Escort"], ["02/01/1918", "", "Camel", "CAP"]])
+    assert vm.filter_visibility([Mission(description="a"), Mission(description="b")], rows, "camel") == [False, True]
+
+    untouched = (cols for cols in [["x"]])
+    assert vm.filter_visibility([Mission(description="a")], untouched, "  ") == [True]
+    assert next(untouched) == ["x"]
+
 
 def test_squadron_viewmodel_states_and_filter():
     vm = SquadronViewModel()
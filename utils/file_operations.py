@@ -4,44 +4,109 @@
 # Utilitários para operações de arquivo com escrita atômica
 # ===================================================================
 
+import itertools
+import json
 import os
-import tempfile
 from pathlib import Path
 from contextlib import contextmanager
+from typing import Any, Tuple
+
+from utils import json_fast
+
+
+# Nomes temporários determinísticos (pid + contador): sem o sorteio com retentativas do tempfile
+_TMP_COUNTER = itertools.count()
+# Mesmas flags do mkstemp (O_RDWR: atomic_write aceita modos como 'w+');
+# O_NOFOLLOW não existe no Windows e O_BINARY/O_NOINHERIT só existem nele
+_TMP_FLAGS = (
+    os.O_RDWR | os.O_CREAT | os.O_EXCL
+    | getattr(os, 'O_NOFOLLOW', 0) | getattr(os, 'O_BINARY', 0)
+    | getattr(os, 'O_NOINHERIT', 0) | getattr(os, 'O_CLOEXEC', 0)
+)
+
+
+def _create_tmp(directory: Path, suffix: str) -> Tuple[int, str]:
+    """Cria ``.tmp_<pid>_<n><suffix>`` em ``directory`` com ``O_EXCL`` (0o600, como o mkstemp)."""
+    pid = os.getpid()
+    while True:
+        tmp_path = os.path.join(directory, f".tmp_{pid}_{next(_TMP_COUNTER)}{suffix}")
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o600), tmp_path
+        except FileExistsError:
+            # Sobra de um processo anterior com o mesmo pid: tenta o próximo número
+            continue
 
 
 @contextmanager
-def atomic_json_write(filepath: Path):
-    """Context manager para escrita atômica e durável de arquivos JSON.
+def atomic_json_write(filepath: Path, *, durable: bool = False):
+    """Context manager para escrita atômica de arquivos JSON.
+
+    O conteúdo é escrito em arquivo temporário no mesmo diretório e promovido com
+    ``os.replace``: leitores nunca veem um arquivo pela metade.
 
-    O conteúdo é escrito em arquivo temporário no mesmo diretório, com flush +
-    ``os.fsync`` antes do ``os.replace`` para reduzir risco de truncamento após
-    quedas de energia.
+    Por padrão não há ``os.fsync``. Dados do usuário que não podem ser
+    regenerados devem passar ``durable=True`` (flush + ``os.fsync`` antes do
+    ``os.replace``, contra truncamento após queda de energia); lotes grandes
+    podem chamar ``fsync_dir`` no diretório uma vez ao final.
+
+    Para gravar um objeto inteiro de uma vez prefira ``atomic_json_dump``, que
+    serializa com orjson quando disponível.
     """
-    tmp_fd, tmp_path = tempfile.mkstemp(
-        dir=filepath.parent,
-        prefix='.tmp_',
-        suffix='.json'
-    )
-    tmp_file = Path(tmp_path)
+    with _atomic_json_file(filepath, durable, binary=False) as f:
+        yield f
+
+
+@contextmanager
+def _atomic_json_file(filepath: Path, durable: bool, binary: bool):
+    """Temporário ``.tmp_*.json`` no mesmo diretório, promovido com ``os.replace`` no fim."""
+    tmp_fd, tmp_path = _create_tmp(filepath.parent, '.json')
 
     try:
-        with os.fdopen(tmp_fd, 'w', encoding='utf-8') as f:
+        f = os.fdopen(tmp_fd, 'wb') if binary else os.fdopen(tmp_fd, 'w', encoding='utf-8')
+        with f:
             yield f
             f.flush()
-            os.fsync(f.fileno())
+            if durable:
+                os.fsync(f.fileno())
 
-        os.replace(str(tmp_file), str(filepath))
+        os.replace(tmp_path, filepath)
 
     except Exception:
-        if tmp_file.exists():
-            try:
-                tmp_file.unlink()
-            except OSError:
-                pass
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
         raise
 
 
+def atomic_json_dump(filepath: Path, obj: Any, *, durable: bool = False, indent: bool = True) -> None:
+    """Serializa ``obj`` e grava em ``filepath`` com as mesmas garantias de ``atomic_json_write``.
+
+    O JSON é gerado em memória como bytes e escrito de uma vez em modo binário.
+    Objetos não serializáveis levantam ``TypeError`` antes de qualquer escrita.
+    """
+    payload = json_fast.dumps(obj, indent=indent, newline=True)
+    with _atomic_json_file(filepath, durable, binary=True) as f:
+        f.write(payload)
+
+
+def fsync_dir(directory: Path) -> None:
+    """Sincroniza as entradas de ``directory`` em disco (fim de um lote ``durable=False``).
+
+    Em plataformas que não permitem abrir diretórios (Windows) é um no-op.
+    """
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 @contextmanager
 def atomic_write(filepath: Path, mode: str = 'w', encoding: str = 'utf-8'):
     """Context manager genérico para escrita atômica de arquivos de texto.
@@ -63,18 +128,22 @@ def atomic_write(filepath: Path, mode: str = 'w', encoding: str = 'utf-8'):
         >>> with atomic_write(Path("data.txt")) as f:
         ...     f.write("Hello, World!")
     """
-    tmp_fd, tmp_path = tempfile.mkstemp(
-        dir=filepath.parent,
-        prefix='.tmp_',
-        suffix=filepath.suffix
-    )
+    tmp_fd, tmp_path = _create_tmp(filepath.parent, filepath.suffix)
     tmp_file = Path(tmp_path)
-    
+
+    # A partir do open() o descritor pertence ao file object: o with o fecha uma única vez
     try:
-        with open(tmp_fd, mode, encoding=encoding) as f:
+        f = open(tmp_fd, mode, encoding=encoding)
+    except Exception:
+        os.close(tmp_fd)
+        tmp_file.unlink()
+        raise
+
+    try:
+        with f:
             yield f
         tmp_file.replace(filepath)
-        
+
     except Exception:
         if tmp_file.exists():
             try:
@@ -82,12 +151,6 @@ def atomic_write(filepath: Path, mode: str = 'w', encoding: str = 'utf-8'):
             except OSError:
                 pass
         raise
-        
-    finally:
-        try:
-            os.close(tmp_fd)
-        except OSError:
-            pass
 
 
 def safe_read_json(filepath: Path, default=None):
@@ -103,14 +166,9 @@ def safe_read_json(filepath: Path, default=None):
     Example:
         >>> data = safe_read_json(Path("config.json"), default={})
     """
-    import json
-    
-    if not filepath.exists():
-        return default
-    
+    # Uma única leitura: arquivo ausente cai no OSError (sem exists() antes e sem corrida)
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_fast.loads(filepath.read_bytes())
     except (json.JSONDecodeError, OSError, UnicodeDecodeError):
         return default
 
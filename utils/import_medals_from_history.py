@@ -2,12 +2,22 @@
 # ===================================================================
 # Wing Mate - utils/import_medals_from_descriptions.py
 # Importa medalhas do diretório descriptions para medals.json
+# Uso: python -m utils.import_medals_from_history (a partir da raiz do projeto)
 # ===================================================================
 
-import json
 import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+from utils import json_fast
+from utils.file_operations import _create_tmp
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +26,188 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _compile_any(words: Tuple[str, ...]) -> Pattern[str]:
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Tabelas compiladas uma vez no import. A ordem é a prioridade: um padrão por país
+# (e não uma alternância única) para que o primeiro país da lista continue vencendo
+# mesmo quando outro aparece antes no texto.
+_COUNTRY_PATTERNS: Tuple[Tuple[str, Pattern[str]], ...] = tuple(
+    (code, _compile_any(variations))
+    for code, variations in (
+        ("germany", ("germany", "alemanha", "deutschland", "german", "prussian", "prussia", "prússia")),
+        ("france", ("france", "frança", "french", "francês")),
+        ("britain", ("britain", "uk", "england", "inglaterra", "british", "britânico")),
+        ("usa", ("usa", "america", "américa", "united states", "eua")),
+        ("belgian", ("belgium", "belgian", "bélgica", "belga")),
+    )
+)
+_HISTORIA_PATTERNS: Tuple[Tuple[str, Pattern[str]], ...] = tuple(
+    (code, _compile_any(words))
+    for code, words in (
+        ("germany", ("pruss", "alemã", "german", "deutsch")),
+        ("france", ("franc", "french")),
+        ("britain", ("brit", "english", "inglês")),
+        ("belgian", ("belg", "belgium")),
+        ("usa", ("amer", "usa", "united states")),
+    )
+)
+
+
+_MISSING = object()
+
+
+def _dget(obj: Any, *path: str, default: Any = None) -> Any:
+    """Percorre dicionários aninhados; ``default`` se algum nível faltar, for nulo ou não for dict."""
+    for key in path:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key, _MISSING)
+        if obj is _MISSING:
+            return default
+    return obj if obj is not None else default
+
+
+@lru_cache(maxsize=64)
+def _load_description(path: str, mtime_ns: int) -> Any:
+    """JSON de descrição lido uma vez por (caminho, mtime).
+
+    Cache pequeno: só evita reler as últimas descrições numa reimportação no mesmo
+    processo, sem manter o acervo inteiro parseado em memória. O objeto devolvido é
+    compartilhado entre chamadas e não deve ser alterado.
+    """
+    return json_fast.loads(Path(path).read_bytes())
+
+
+# Leitura de arquivos pequenos é dominada por I/O: threads além do número de núcleos
+_PREFETCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Leituras em voo à frente do consumidor: o suficiente para manter as threads
+# ocupadas sem parsear o diretório inteiro antes da primeira medalha sair
+_PREFETCH_AHEAD = 2 * _PREFETCH_WORKERS
+
+
+def _scan_file_names(directory: Path) -> Set[str]:
+    """Nomes dos arquivos de ``directory`` numa única leitura (vazio se não existir)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+# -------------------------------------------------------------------
+# Condições de conquista por família de medalha
+# -------------------------------------------------------------------
+
+def _conditions_pour_le_merite(medal_id: str, data: Dict[str, Any]) -> List[Dict[str, str]]:
+    conditions: List[Dict[str, str]] = []
+    criterios = _dget(data, "destaqueNaPrimeiraGuerra", "criteriosPilotos")
+    if isinstance(criterios, dict):
+        inicial = criterios.get("inicial", "")
+        if inicial:
+            conditions.append({
+                "descricao": inicial,
+                "tipo": "victories",
+                "valor": "8"
+            })
+        
+        evolucao = criterios.get("evolucao", "")
+        if evolucao and "20" in evolucao:
+            conditions.append({
+                "descricao": "Critério tardio da guerra (1917-1918): 20 vitórias",
+                "tipo": "victories",
+                "valor": "20"
+            })
+    return conditions
+
+
+def _conditions_iron_cross(medal_id: str, data: Dict[str, Any]) -> List[Dict[str, str]]:
+    conditions: List[Dict[str, str]] = []
+    classes = data.get("classes", [])
+    if classes and isinstance(classes, list):
+        for cls in classes[:3]:  # Primeiras 3 classes
+            if isinstance(cls, dict):
+                nome_classe = cls.get("nome", "")
+                criterio = cls.get("criterio", "")
+                conditions.append({
+                    "descricao": f"{nome_classe}: {criterio}" if criterio else nome_classe,
+                    "tipo": "combat",
+                    "valor": "1"
+                })
+    return conditions
+
+
+def _conditions_wound_badge(medal_id: str, data: Dict[str, Any]) -> List[Dict[str, str]]:
+    conditions: List[Dict[str, str]] = []
+    classe_tipo = "black"
+    if "silver" in medal_id or "prata" in medal_id:
+        classe_tipo = "silver"
+    elif "gold" in medal_id or "ouro" in medal_id:
+        classe_tipo = "gold"
+    
+    classes = data.get("classes", [])
+    if classes and isinstance(classes, list):
+        for cls in classes:
+            if isinstance(cls, dict):
+                nome = cls.get("nome", "").lower()
+                if classe_tipo in nome or (classe_tipo == "black" and "preto" in nome):
+                    criterio = cls.get("criterio", "")
+                    conditions.append({
+                        "descricao": criterio or f"Ferimento em combate ({nome})",
+                        "tipo": "wounds",
+                        "valor": cls.get("ferimentos", "1")
+                    })
+                    break
+    return conditions
+
+
+def _fixed_condition(descricao: str, tipo: str) -> Callable[[str, Dict[str, Any]], List[Dict[str, str]]]:
+    """Handler para famílias cuja condição não depende dos dados históricos.
+
+    O dicionário da condição é montado uma vez e compartilhado entre as medalhas
+    (a lista é nova a cada chamada): o resultado é só serializado, não alterado.
+    """
+    condition = {"descricao": descricao, "tipo": tipo, "valor": "1"}
+
+    def handler(medal_id: str, data: Dict[str, Any]) -> List[Dict[str, str]]:
+        return [condition]
+    return handler
+
+
+def _conditions_generic(medal_id: str, data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Genérico para medalhas não mapeadas."""
+    nome = data.get("nome", "Medalha")
+    return [{
+        "descricao": f"Condição de conquista para {nome} (a definir)",
+        "tipo": "generic",
+        "valor": "1"
+    }]
+
+
+# Primeiro trecho encontrado no ID decide a família (mesma ordem da antiga cadeia de elif)
+_MEDAL_DISPATCH: Tuple[Tuple[Tuple[str, ...], Callable[[str, Dict[str, Any]], List[Dict[str, str]]]], ...] = (
+    (("pour_le_merit", "blue_max"), _conditions_pour_le_merite),
+    (("iron_cross", "cruz_de_ferro"), _conditions_iron_cross),
+    (("wound_badge", "ferido"), _conditions_wound_badge),
+    # Ordem da Casa de Hohenzollern
+    (("hohenzollern",), _fixed_condition(
+        "Serviços distinguidos à Casa Real Prussiana ou atos notáveis de bravura", "service")),
+    # Distintivo de Piloto
+    (("pilot_badge", "distintivo_piloto"), _fixed_condition(
+        "Conclusão bem-sucedida do treinamento de piloto militar", "qualification")),
+    # Medalha de Mérito de Guerra Prussiana
+    (("war_merit", "merito_guerra"), _fixed_condition(
+        "Serviços extraordinários durante a guerra", "service")),
+    # Ordem Militar de Max Joseph (Baviera)
+    (("max_joseph", "bav_order"), _fixed_condition(
+        "Ato de bravura excepcional que mudou o curso de uma batalha", "heroism")),
+    # Ordem da Águia Vermelha
+    (("red_eagle", "aguia_vermelha"), _fixed_condition(
+        "Serviços civis ou militares de alto mérito ao Estado Prussiano", "service")),
+)
+
+
 class MedalDescriptionImporter:
     """Importador de medalhas de arquivos JSON do diretório descriptions."""
     
@@ -33,6 +225,10 @@ class MedalDescriptionImporter:
         
         # País padrão (pode ser alterado por medalha)
         self.default_country = "germany"
+
+        # Listagens de imagens/ribbons feitas uma vez por import_all (sem stat por medalha)
+        self._images: Set[str] = set()
+        self._ribbons: Set[str] = set()
     
     def import_all(self) -> List[Dict[str, Any]]:
         """Importa todas as medalhas do diretório descriptions.
@@ -40,51 +236,93 @@ class MedalDescriptionImporter:
         Returns:
             Lista de dicionários de medalhas no formato simplificado
         """
-        if not self.descriptions_dir.exists():
-            logger.error(f"Diretório não encontrado: {self.descriptions_dir}")
-            return []
+        return list(self.iter_medals())
+    
+    def iter_medals(self) -> Iterator[Dict[str, Any]]:
+        """Gera as medalhas uma a uma, na ordem dos arquivos de descrição.
         
-        json_files = list(self.descriptions_dir.glob("*.json"))
+        Yields:
+            Dicionários de medalhas no formato simplificado
+        """
+        try:
+            with os.scandir(self.descriptions_dir) as it:
+                # mtime vem do DirEntry e vira chave do cache de leitura
+                json_files = [
+                    (Path(entry.path), entry.stat().st_mtime_ns) for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            logger.error(f"Diretório não encontrado: {self.descriptions_dir}")
+            return
+
+        self._images = _scan_file_names(self.images_dir)
+        self._ribbons = _scan_file_names(self.ribbons_dir)
+
         if not json_files:
             logger.warning(f"Nenhum arquivo JSON encontrado em {self.descriptions_dir}")
-            return []
+            return
         
         logger.info(f"Encontrados {len(json_files)} arquivos JSON\n")
         
-        medals: List[Dict[str, Any]] = []
+        imported = 0
+        json_files.sort()
         
-        for json_file in sorted(json_files):
+        # Leitura + parse em paralelo numa janela limitada; conversão e logs seguem em ordem
+        pending: Deque[Tuple[Path, "Future[Any]"]] = deque()
+        files = iter(json_files)
+        with ThreadPoolExecutor(max_workers=min(_PREFETCH_WORKERS, len(json_files))) as pool:
+
+            def submit_next() -> None:
+                item = next(files, None)
+                if item is not None:
+                    pending.append((item[0], pool.submit(_load_description, str(item[0]), item[1])))
+
             try:
-                logger.info(f"Processando: {json_file.name}")
-                medal_dict = self._convert_to_simple_format(json_file)
-                
-                if medal_dict:
-                    medals.append(medal_dict)
-                    logger.info(f"  ✓ Importada: {medal_dict['nome']}")
-                else:
-                    logger.warning(f"  ✗ Ignorada (dados insuficientes)")
-            
-            except Exception as e:
-                logger.error(f"  ✗ Erro: {e}")
+                for _ in range(_PREFETCH_AHEAD):
+                    submit_next()
+                while pending:
+                    json_file, future = pending.popleft()
+                    submit_next()
+                    try:
+                        logger.info(f"Processando: {json_file.name}")
+                        medal_dict = self._convert_data(future.result())
+                    except Exception as e:
+                        logger.error(f"  ✗ Erro: {e}")
+                        continue
+                    
+                    if medal_dict:
+                        imported += 1
+                        logger.info(f"  ✓ Importada: {medal_dict['nome']}")
+                        yield medal_dict
+                    else:
+                        logger.warning(f"  ✗ Ignorada (dados insuficientes)")
+            finally:
+                # Gerador abandonado no meio: descarta as leituras que ainda não começaram
+                for _, future in pending:
+                    future.cancel()
         
         logger.info(f"\n{'='*60}")
-        logger.info(f"Total de medalhas importadas: {len(medals)}")
+        logger.info(f"Total de medalhas importadas: {imported}")
         logger.info(f"{'='*60}\n")
-        
-        return medals
     
-    def _convert_to_simple_format(self, json_file: Path) -> Optional[Dict[str, Any]]:
+    def _convert_to_simple_format(
+        self, json_file: Path, mtime_ns: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """Converte JSON de descrição para formato simplificado do input_medals_tab.
         
         Args:
             json_file: Caminho do arquivo JSON de descrição
+            mtime_ns: mtime já conhecido do arquivo (evita um stat extra)
             
         Returns:
             Dicionário no formato simplificado ou None se inválido
         """
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        if mtime_ns is None:
+            mtime_ns = json_file.stat().st_mtime_ns
+        return self._convert_data(_load_description(str(json_file), mtime_ns))
+    
+    def _convert_data(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Converte o JSON de descrição já carregado (ver ``_convert_to_simple_format``)."""
         # Extrai campos básicos
         medal_id = data.get("id", "")
         nome = data.get("nome", "")
@@ -98,11 +336,11 @@ class MedalDescriptionImporter:
         ribbon_path = f"ribbons/ribbon_{medal_id}.png"
         
         # Verifica existência de imagem (obrigatória)
-        if not (self.images_dir / f"{medal_id}.png").exists():
+        if f"{medal_id}.png" not in self._images:
             logger.warning(f"    ⚠ Imagem não encontrada: {medal_id}.png")
         
         # Ribbon é opcional
-        if not (self.ribbons_dir / f"ribbon_{medal_id}.png").exists():
+        if f"ribbon_{medal_id}.png" not in self._ribbons:
             logger.debug(f"    ⓘ Ribbon não encontrada (opcional): ribbon_{medal_id}.png")
             ribbon_path = ""
         
@@ -143,25 +381,16 @@ class MedalDescriptionImporter:
                 return normalized
         
         # Busca em história/fundação
-        historia = data.get("historia", {})
-        if isinstance(historia, dict):
-            fundacao = historia.get("fundacao", {}) or historia.get("criacao", {})
-            if isinstance(fundacao, dict):
-                local = fundacao.get("local", "")
-                instituidor = fundacao.get("instituidor", "") or fundacao.get("fundador", "")
-                
-                combined = f"{local} {instituidor}".lower()
-                
-                if any(word in combined for word in ["pruss", "alemã", "german", "deutsch"]):
-                    return "germany"
-                if any(word in combined for word in ["franc", "french"]):
-                    return "france"
-                if any(word in combined for word in ["brit", "english", "inglês"]):
-                    return "britain"
-                if any(word in combined for word in ["belg", "belgium"]):
-                    return "belgian"
-                if any(word in combined for word in ["amer", "usa", "united states"]):
-                    return "usa"
+        fundacao = _dget(data, "historia", "fundacao") or _dget(data, "historia", "criacao")
+        if isinstance(fundacao, dict):
+            local = fundacao.get("local", "")
+            instituidor = fundacao.get("instituidor", "") or fundacao.get("fundador", "")
+            
+            combined = f"{local} {instituidor}".lower()
+
+            for code, pattern in _HISTORIA_PATTERNS:
+                if pattern.search(combined):
+                    return code
         
         return None
     
@@ -180,17 +409,8 @@ class MedalDescriptionImporter:
         if not s:
             return None
         
-        # Mapeamento de variações para códigos
-        mapping = {
-            "germany": ["germany", "alemanha", "deutschland", "german", "prussian", "prussia", "prússia"],
-            "france": ["france", "frança", "french", "francês"],
-            "britain": ["britain", "uk", "england", "inglaterra", "british", "britânico"],
-            "usa": ["usa", "america", "américa", "united states", "eua"],
-            "belgian": ["belgium", "belgian", "bélgica", "belga"]
-        }
-        
-        for code, variations in mapping.items():
-            if any(var in s for var in variations):
+        for code, pattern in _COUNTRY_PATTERNS:
+            if pattern.search(s):
                 return code
         
         return None
@@ -205,116 +425,30 @@ class MedalDescriptionImporter:
         Returns:
             Lista de dicionários de condições
         """
-        conditions: List[Dict[str, str]] = []
-        
-        # Pour le Mérite
-        if "pour_le_merit" in medal_id or "blue_max" in medal_id:
-            destaque = data.get("destaqueNaPrimeiraGuerra", {})
-            if isinstance(destaque, dict):
-                criterios = destaque.get("criteriosPilotos", {})
-                if isinstance(criterios, dict):
-                    inicial = criterios.get("inicial", "")
-                    if inicial:
-                        conditions.append({
-                            "descricao": inicial,
-                            "tipo": "victories",
-                            "valor": "8"
-                        })
-                    
-                    evolucao = criterios.get("evolucao", "")
-                    if evolucao and "20" in evolucao:
-                        conditions.append({
-                            "descricao": "Critério tardio da guerra (1917-1918): 20 vitórias",
-                            "tipo": "victories",
-                            "valor": "20"
-                        })
-        
-        # Cruz de Ferro
-        elif "iron_cross" in medal_id or "cruz_de_ferro" in medal_id:
-            classes = data.get("classes", [])
-            if classes and isinstance(classes, list):
-                for cls in classes[:3]:  # Primeiras 3 classes
-                    if isinstance(cls, dict):
-                        nome_classe = cls.get("nome", "")
-                        criterio = cls.get("criterio", "")
-                        conditions.append({
-                            "descricao": f"{nome_classe}: {criterio}" if criterio else nome_classe,
-                            "tipo": "combat",
-                            "valor": "1"
-                        })
-        
-        # Distintivo de Ferido
-        elif "wound_badge" in medal_id or "ferido" in medal_id:
-            classe_tipo = "black"
-            if "silver" in medal_id or "prata" in medal_id:
-                classe_tipo = "silver"
-            elif "gold" in medal_id or "ouro" in medal_id:
-                classe_tipo = "gold"
-            
-            classes = data.get("classes", [])
-            if classes and isinstance(classes, list):
-                for cls in classes:
-                    if isinstance(cls, dict):
-                        nome = cls.get("nome", "").lower()
-                        if classe_tipo in nome or (classe_tipo == "black" and "preto" in nome):
-                            criterio = cls.get("criterio", "")
-                            conditions.append({
-                                "descricao": criterio or f"Ferimento em combate ({nome})",
-                                "tipo": "wounds",
-                                "valor": cls.get("ferimentos", "1")
-                            })
-                            break
-        
-        # Ordem da Casa de Hohenzollern
-        elif "hohenzollern" in medal_id:
-            conditions.append({
-                "descricao": "Serviços distinguidos à Casa Real Prussiana ou atos notáveis de bravura",
-                "tipo": "service",
-                "valor": "1"
-            })
-        
-        # Distintivo de Piloto
-        elif "pilot_badge" in medal_id or "distintivo_piloto" in medal_id:
-            conditions.append({
-                "descricao": "Conclusão bem-sucedida do treinamento de piloto militar",
-                "tipo": "qualification",
-                "valor": "1"
-            })
-        
-        # Medalha de Mérito de Guerra Prussiana
-        elif "war_merit" in medal_id or "merito_guerra" in medal_id:
-            conditions.append({
-                "descricao": "Serviços extraordinários durante a guerra",
-                "tipo": "service",
-                "valor": "1"
-            })
-        
-        # Ordem Militar de Max Joseph (Baviera)
-        elif "max_joseph" in medal_id or "bav_order" in medal_id:
-            conditions.append({
-                "descricao": "Ato de bravura excepcional que mudou o curso de uma batalha",
-                "tipo": "heroism",
-                "valor": "1"
-            })
-        
-        # Ordem da Águia Vermelha
-        elif "red_eagle" in medal_id or "aguia_vermelha" in medal_id:
-            conditions.append({
-                "descricao": "Serviços civis ou militares de alto mérito ao Estado Prussiano",
-                "tipo": "service",
-                "valor": "1"
-            })
-        
-        # Genérico para medalhas não mapeadas
-        else:
-            nome = data.get("nome", "Medalha")
-            conditions.append({
-                "descricao": f"Condição de conquista para {nome} (a definir)",
-                "tipo": "generic",
-                "valor": "1"
-            })
+        for needles, handler in _MEDAL_DISPATCH:
+            if any(needle in medal_id for needle in needles):
+                return handler(medal_id, data)
+        return _conditions_generic(medal_id, data)
+    
+    @contextmanager
+    def _open_output(self) -> Iterator[BinaryIO]:
+        """Abre um temporário exclusivo do processo ao lado de medals.json e o promove com os.replace.
         
-        return conditions
+        Em qualquer falha (inclusive interrupção) o temporário é removido e medals.json
+        fica intacto; execuções simultâneas não compartilham o mesmo temporário.
+        """
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_fd, tmp_path = _create_tmp(self.output_file.parent, ".json")
+        try:
+            with os.fdopen(tmp_fd, 'wb') as f:
+                yield f
+            os.replace(tmp_path, self.output_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def save_to_file(self, medals: List[Dict[str, Any]]) -> None:
         """Salva medalhas importadas no arquivo medals.json.
@@ -323,12 +457,10 @@ class MedalDescriptionImporter:
             medals: Lista de medalhas a salvar
         """
         try:
-            # Cria diretório meta se não existir
-            self.output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Salva com formatação
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(medals, f, ensure_ascii=False, indent=2)
+            # Serializa antes de abrir o temporário: erro de dados não deixa arquivo para trás
+            payload = json_fast.dumps(medals, indent=True)
+            with self._open_output() as f:
+                f.write(payload)
             
             logger.info(f"✓ Medalhas salvas em: {self.output_file}")
             logger.info(f"  Total de medalhas: {len(medals)}")
@@ -336,6 +468,42 @@ class MedalDescriptionImporter:
         except OSError as e:
             logger.error(f"✗ Erro ao salvar medalhas: {e}")
     
+    def save_streaming(self, medals: Iterable[Dict[str, Any]]) -> int:
+        """Grava medalhas em medals.json à medida que são geradas, sem montar a lista inteira.
+        
+        A saída é idêntica à de ``save_to_file``. Se não houver nenhuma medalha o
+        arquivo existente não é tocado.
+        
+        Args:
+            medals: Iterável de medalhas (ex.: ``iter_medals()``)
+            
+        Returns:
+            Quantidade de medalhas gravadas
+        """
+        it = iter(medals)
+        first = next(it, None)
+        if first is None:
+            return 0
+        
+        count = 0
+        try:
+            with self._open_output() as f:
+                f.write(b"[\n")
+                for count, medal in enumerate(chain((first,), it), 1):
+                    if count > 1:
+                        f.write(b",\n")
+                    # Reindenta o elemento um nível: strings JSON nunca contêm \n literal
+                    f.write(b"  " + json_fast.dumps(medal, indent=True).replace(b"\n", b"\n  "))
+                f.write(b"\n]")
+            
+            logger.info(f"✓ Medalhas salvas em: {self.output_file}")
+            logger.info(f"  Total de medalhas: {count}")
+        
+        except OSError as e:
+            logger.error(f"✗ Erro ao salvar medalhas: {e}")
+        
+        return count
+    
     def print_summary(self) -> None:
         """Exibe resumo dos diretórios e arquivos."""
         logger.info("\n" + "="*60)
@@ -354,11 +522,8 @@ def main():
     importer = MedalDescriptionImporter()
     importer.print_summary()
     
-    # Importa medalhas
-    medals = importer.import_all()
-    
-    if medals:
-        importer.save_to_file(medals)
+    # Importa e grava as medalhas em fluxo
+    if importer.save_streaming(importer.iter_medals()):
         logger.info("\n✓ Importação concluída com sucesso!\n")
     else:
         logger.warning("\n⚠ Nenhuma medalha foi importada.\n")
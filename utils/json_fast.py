@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# ===================================================================
+# Wing Mate - utils/json_fast.py
+# JSON em bytes com orjson (opcional) e fallback equivalente na stdlib
+# ===================================================================
+
+import json
+from types import ModuleType
+from typing import Any, Optional
+
+orjson: Optional[ModuleType]
+try:
+    import orjson  # opcional: parse/serialização direto em bytes, bem mais rápido que o json da stdlib
+except ModuleNotFoundError:
+    orjson = None
+
+
+def loads(raw: bytes) -> Any:
+    """Decodifica JSON UTF-8 direto dos bytes.
+
+    Conteúdo inválido levanta ``json.JSONDecodeError`` (``orjson.JSONDecodeError``
+    herda dela) e bytes fora do UTF-8, ``UnicodeDecodeError`` no fallback. BOM
+    não é aceito em nenhum dos dois caminhos.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def dumps(obj: Any, *, indent: bool = False, newline: bool = False) -> bytes:
+    """Serializa em UTF-8 sem escapes ASCII: compacto ou com indentação de 2 espaços.
+
+    Sem orjson equivale a ``json.dumps(ensure_ascii=False)`` com ``indent=2`` ou
+    separadores compactos; ``newline`` acrescenta ``\\n`` ao final. Objetos não
+    serializáveis levantam ``TypeError`` nos dois caminhos.
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        payload: bytes = orjson.dumps(obj, option=option)
+        return payload
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    if newline:
+        text += "\n"
+    return text.encode('utf-8')
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import threading
 from enum import Enum
-from typing import Callable, List, Optional
+from typing import Any, Callable, ClassVar, Optional, Tuple, Type
 
 
 class NotificationLevel(str, Enum):
@@ -10,71 +11,99 @@ class NotificationLevel(str, Enum):
     ERROR = "error"
 
 
-try:
-    from PyQt5.QtCore import QObject, pyqtSignal
+class _FallbackSignal:
+    def __init__(self) -> None:
+        self._subs: Tuple[Callable[[str, str, int], None], ...] = ()
 
-    class NotificationBus(QObject):
-        """Observer bus global para notificações thread-safe via sinal Qt."""
+    def connect(self, fn: Callable[[str, str, int], None], *_args: Any, **_kwargs: Any) -> None:
+        # Copy-on-write: emit itera a tupla vigente sem cópia nem lock
+        self._subs = self._subs + (fn,)
 
-        _instance: Optional["NotificationBus"] = None
-        notified = pyqtSignal(str, str, int)
+    def emit(self, level: str, message: str, timeout_ms: int) -> None:
+        for fn in self._subs:
+            fn(level, message, timeout_ms)
+
+
+class _BusMixin:
+    """API comum aos dois backends; ``notified`` é o sinal Qt ou o ``_FallbackSignal``."""
+
+    _INSTANCE: ClassVar[_BusMixin]
+    notified: Any
+
+    def notify(self, level: NotificationLevel, message: str, timeout_ms: int = 3000) -> None:
+        self.notified.emit(level.value, str(message or ""), int(timeout_ms or 0))
 
-        def notify(self, level: NotificationLevel, message: str, timeout_ms: int = 3000) -> None:
-            self.notified.emit(level.value, str(message or ""), int(timeout_ms or 0))
+    def send(self, level: NotificationLevel, message: str, timeout_ms: int = 3000) -> None:
+        self.notify(level, message, timeout_ms)
 
-        def send(self, level: NotificationLevel, message: str, timeout_ms: int = 3000) -> None:
-            self.notify(level, message, timeout_ms)
+    @classmethod
+    def instance(cls) -> _BusMixin:
+        return cls._INSTANCE
 
-        @classmethod
-        def instance(cls) -> "NotificationBus":
-            if cls._instance is None:
-                cls._instance = cls()
-            return cls._instance
 
-except ModuleNotFoundError:
+class _FallbackNotificationBus(_BusMixin):
+    """Fallback sem Qt (usado em ambientes de teste sem PyQt)."""
 
-    class _FallbackSignal:
-        def __init__(self) -> None:
-            self._subs: List[Callable[[str, str, int], None]] = []
+    def __init__(self) -> None:
+        self.notified = _FallbackSignal()
 
-        def connect(self, fn: Callable[[str, str, int], None], *_args, **_kwargs) -> None:
-            self._subs.append(fn)
 
-        def emit(self, level: str, message: str, timeout_ms: int) -> None:
-            for fn in list(self._subs):
-                fn(level, message, timeout_ms)
+def _qt_bus_class() -> Type[_BusMixin]:
+    """Classe do bus Qt; o PyQt5 só é importado aqui (``ModuleNotFoundError`` sem Qt)."""
+    from PyQt5.QtCore import QObject, pyqtSignal
+
+    class _QtNotificationBus(QObject, _BusMixin):
+        """Observer bus global para notificações thread-safe via sinal Qt."""
+
+        notified = pyqtSignal(str, str, int)
+
+    return _QtNotificationBus
 
-    class NotificationBus:
-        """Fallback sem Qt (usado em ambientes de teste sem PyQt)."""
 
-        _instance: Optional["NotificationBus"] = None
+def _build_bus_class() -> Type[_BusMixin]:
+    """Escolhe o backend no primeiro uso: o PyQt5 só é importado quando o bus é acessado."""
+    try:
+        return _qt_bus_class()
+    except ModuleNotFoundError:
+        return _FallbackNotificationBus
 
-        def __init__(self) -> None:
-            self.notified = _FallbackSignal()
 
-        def notify(self, level: NotificationLevel, message: str, timeout_ms: int = 3000) -> None:
-            self.notified.emit(level.value, str(message or ""), int(timeout_ms or 0))
+_BUILD_LOCK = threading.Lock()
+_bus: Optional[_BusMixin] = None
 
-        def send(self, level: NotificationLevel, message: str, timeout_ms: int = 3000) -> None:
-            self.notify(level, message, timeout_ms)
 
-        @classmethod
-        def instance(cls) -> "NotificationBus":
-            if cls._instance is None:
-                cls._instance = cls()
-            return cls._instance
+def _get_bus() -> _BusMixin:
+    global _bus
+    if _bus is None:
+        with _BUILD_LOCK:
+            if _bus is None:
+                bus_cls = _build_bus_class()
+                bus_cls._INSTANCE = bus_cls()
+                _bus = bus_cls._INSTANCE
+    return _bus
 
 
-notification_bus = NotificationBus.instance()
+def __getattr__(name: str) -> Any:
+    # ``NotificationBus`` e ``notification_bus`` são resolvidos no primeiro acesso
+    # (PEP 562) e gravados no módulo: os acessos seguintes não passam mais por aqui
+    value: Any
+    if name == "notification_bus":
+        value = _get_bus()
+    elif name == "NotificationBus":
+        value = type(_get_bus())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 def notify_info(message: str, timeout_ms: int = 2500) -> None:
-    NotificationBus.instance().send(NotificationLevel.INFO, message, timeout_ms)
+    _get_bus().send(NotificationLevel.INFO, message, timeout_ms)
 
 
 def notify_warning(message: str, timeout_ms: int = 3500) -> None:
-    NotificationBus.instance().send(NotificationLevel.WARNING, message, timeout_ms)
+    _get_bus().send(NotificationLevel.WARNING, message, timeout_ms)
 
 
 def notify_error(message: str, timeout_ms: int = 4500) -> None:
-    NotificationBus.instance().send(NotificationLevel.ERROR, message, timeout_ms)
+    _get_bus().send(NotificationLevel.ERROR, message, timeout_ms)
@@ -9,6 +9,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Optional
 
+from utils.file_operations import atomic_json_dump
 from utils.structured_logger import StructuredLogger
 
 # SLOs de UX (máquina de referência)
@@ -28,6 +29,17 @@ class Events:
 
 
 class _MetricsState:
+    __slots__ = (
+        "startup_time_ms",
+        "actions_total",
+        "actions_failed",
+        "action_duration_ms_total",
+        "max_tab_switch_ms",
+        "cache_hits",
+        "cache_misses",
+        "_snapshot",
+    )
+
     def __init__(self) -> None:
         self.startup_time_ms: float = 0.0
         self.actions_total: int = 0
@@ -36,8 +48,15 @@ class _MetricsState:
         self.max_tab_switch_ms: float = 0.0
         self.cache_hits: int = 0
         self.cache_misses: int = 0
+        # Snapshot memoizado; os record_* o descartam a cada escrita
+        self._snapshot: Optional[dict[str, float]] = None
 
     def snapshot(self) -> dict[str, float]:
+        if self._snapshot is None:
+            self._snapshot = self._compute_snapshot()
+        return dict(self._snapshot)
+
+    def _compute_snapshot(self) -> dict[str, float]:
         error_rate = (self.actions_failed / self.actions_total) if self.actions_total else 0.0
         cache_total = self.cache_hits + self.cache_misses
         cache_hit_rate = (self.cache_hits / cache_total) if cache_total else 0.0
@@ -64,11 +83,13 @@ def get_session_id() -> str:
 
 
 def emit_event(logger: StructuredLogger, event: str, level: str = "info", **context: Any) -> None:
-    logger.log(level, event, event=event, session_id=get_session_id(), **context)
+    # _SESSION_ID lido direto do módulo: sem chamada de função por evento
+    logger.log(level, event, event=event, session_id=_SESSION_ID, **context)
 
 
 def record_startup_time(logger: StructuredLogger, startup_time_ms: float) -> None:
     _METRICS.startup_time_ms = max(0.0, float(startup_time_ms))
+    _METRICS._snapshot = None
     emit_event(logger, Events.STARTUP_COMPLETED, startup_time_ms=round(_METRICS.startup_time_ms, 2))
 
 
@@ -85,6 +106,7 @@ def record_action_duration(
         _METRICS.max_tab_switch_ms = max(_METRICS.max_tab_switch_ms, duration)
     if not success:
         _METRICS.actions_failed += 1
+    _METRICS._snapshot = None
 
     emit_event(
         logger,
@@ -98,6 +120,7 @@ def record_action_duration(
 def record_cache_stats(cache_hits: int, cache_misses: int) -> None:
     _METRICS.cache_hits = max(0, int(cache_hits))
     _METRICS.cache_misses = max(0, int(cache_misses))
+    _METRICS._snapshot = None
 
 
 def metrics_snapshot() -> dict[str, float]:
@@ -138,7 +161,7 @@ def publish_release_report(
 
     report = {
         "release": release_tag,
-        "session_id": get_session_id(),
+        "session_id": _SESSION_ID,
         "generated_at_epoch_ms": int(time.time() * 1000),
         "metrics": snapshot,
         "ux_budget": budget,
@@ -146,7 +169,7 @@ def publish_release_report(
     }
 
     report_path = output_dir / f"observability_{release_tag}.json"
-    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    atomic_json_dump(report_path, report)
 
     emit_event(
         logger,
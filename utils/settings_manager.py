@@ -1,22 +1,86 @@
 # utils/settings_manager.py
-from PyQt5.QtCore import QSettings
+from typing import Any, Dict, Optional
+
+from PyQt5.QtCore import QCoreApplication, QSettings, QThread, QTimer
+
+# Marca chaves já consultadas e ausentes (ou nulas) no backend
+_MISSING = object()
+
 
 class SettingsManager:
-    _instance = None
-    _settings = None
+    _instance: Optional["SettingsManager"] = None
+    _settings: QSettings
+    # Janela de agrupamento das escritas antes do sync() no backend (registro/ini)
+    SYNC_DELAY_MS = 250
+    # Criado no thread da GUI na primeira escrita feita nele
+    _sync_timer: Optional[QTimer] = None
+    # Cache write-through: cada chave vai ao registro/ini no máximo uma vez
+    _cache: Dict[str, Any]
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+    def __new__(cls) -> "SettingsManager":
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
             cls._settings = QSettings('IL2CampaignAnalyzer', 'Settings')
-        return cls._instance
+            instance._cache = {}
+        return instance
     
-    def get(self, key: str, default=None):
-        return self._settings.value(key, default)
+    def get(self, key: str, default: Any = None) -> Any:
+        """Valor de ``key`` (``default`` se ausente ou nulo), servido do cache após a primeira leitura.
+
+        Depois de um ``set`` no mesmo processo devolve o próprio objeto Python
+        gravado, não o valor relido do ini/registro (onde tipos podem mudar, p.ex.
+        ``bool`` → ``"true"``). O cache só vê escritas feitas por esta classe:
+        ``main_window.py:223``, ``profile_tab.py:372`` e
+        ``simulator_selection_main_window.py:24`` gravam no mesmo QSettings
+        diretamente, e essas chaves podem ficar obsoletas aqui até um
+        ``invalidate``.
+        """
+        value = self._cache.get(key)
+        if value is None:
+            value = self._settings.value(key)
+            if value is None:
+                value = _MISSING
+            self._cache[key] = value
+        return default if value is _MISSING else value
     
-    def set(self, key: str, value) -> None:
+    def set(self, key: str, value: Any) -> None:
+        """Grava ``key`` no cache e no QSettings; o ``sync()`` no disco é adiado e agrupado."""
+        self._cache[key] = _MISSING if value is None else value
         self._settings.setValue(key, value)
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() != app.thread():
+            # Fora do thread da GUI (ex.: DataSyncThread, sem event loop) um timer
+            # nunca dispararia: grava na hora, como antes
+            self._settings.sync()
+            return
+        # sync() adiado e agrupado: várias escritas seguidas geram um único flush
+        timer = self._sync_timer
+        if timer is None:
+            timer = self._sync_timer = QTimer(app)
+            timer.setSingleShot(True)
+            timer.setInterval(self.SYNC_DELAY_MS)
+            timer.timeout.connect(self._do_sync)
+            # Escritas ainda pendentes ao sair do event loop são gravadas no encerramento
+            app.aboutToQuit.connect(self.flush)
+        if not timer.isActive():
+            timer.start()
+    
+    def _do_sync(self) -> None:
         self._settings.sync()
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Descarta o cache de leitura (uma chave ou todas), p.ex. após escrita de outro processo."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+    
+    def flush(self) -> None:
+        """Persiste imediatamente as escritas pendentes (ex.: no encerramento)."""
+        if self._sync_timer is not None:
+            self._sync_timer.stop()
+        self._do_sync()
 
 # Uso global
 settings = SettingsManager()
@@ -5,9 +5,48 @@
 # ===================================================================
 
 import logging
-import json
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from utils import json_fast
+
+
+# Nomes de nível aceitos por StructuredLogger.log, resolvidos sem upper()/getattr por chamada
+_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'warn': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+    'fatal': logging.CRITICAL,
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter que serializa em JSON os registros emitidos pelo StructuredLogger.
+
+    A serialização acontece no handler, não no ponto de chamada: registros
+    filtrados ou capturados por handlers sem este formatter nunca viram JSON.
+    Registros comuns (sem ``context``) seguem o formato textual padrão.
+    """
+
+    def __init__(self, fmt: Optional[str] = '%(message)s', datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        context = getattr(record, 'context', None)
+        if context is not None:
+            record.message = json_fast.dumps({
+                'timestamp': datetime.fromtimestamp(record.created, timezone.utc)
+                .replace(tzinfo=None)
+                .isoformat(),
+                'level': record.levelname,
+                'message': record.message,
+                'context': context,
+            }).decode('utf-8')
+        return super().formatMessage(record)
+
 
 class StructuredLogger:
     """Logger estruturado que gera logs em formato JSON para fácil parsing.
@@ -25,7 +64,7 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
     
     def log(self, level: str, message: str, **context: Any) -> None:
-        """Registra uma mensagem de log estruturada em formato JSON.
+        """Registra uma mensagem de log estruturada (serializada em JSON pelo JsonFormatter).
         
         Args:
             level: Nível do log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -37,15 +76,19 @@ class StructuredLogger:
             >>> logger.log('error', 'Falha ao carregar campanha', 
             ...           campaign_name='Campaign1', error_type='JSONDecodeError')
         """
-        log_entry = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'level': level.upper(),
-            'message': message,
-            'context': context
-        }
-        
-        log_level = getattr(logging, level.upper(), logging.INFO)
-        self.logger.log(log_level, json.dumps(log_entry, ensure_ascii=False))
+        log_level = _LEVELS.get(level)
+        if log_level is None:
+            # Fora da tabela (maiúsculas, 'notset'...): mesma resolução de antes
+            log_level = getattr(logging, level.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(log_level):
+            return
+        # Sem handlers na hierarquia (testes/headless) o registro só iria para o
+        # lastResort, que atende apenas WARNING ou acima: nem LogRecord é criado
+        last_resort = logging.lastResort
+        if (last_resort is None or log_level < last_resort.level) and not self.logger.hasHandlers():
+            return
+        # Só o dicionário de contexto viaja no LogRecord; o JSON é montado pelo JsonFormatter
+        self.logger.log(log_level, message, extra={'context': context})
     
     def debug(self, message: str, **context: Any) -> None:
         """Atalho para log de nível DEBUG."""
@@ -70,11 +113,10 @@ class StructuredLogger:
 
 # Exemplo de uso
 if __name__ == "__main__":
-    # Configuração básica de logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(message)s'
-    )
+    # Configuração básica de logging com saída JSON
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    logging.basicConfig(level=logging.DEBUG, handlers=[handler])
     
     # Criação do logger estruturado
     logger = StructuredLogger('IL2CampaignAnalyzer')